@@ -0,0 +1,127 @@
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+from motor.core import AgnosticCollection
+from pymongo import ASCENDING, IndexModel
+from app.core.config import settings
+from app.core.common.ports import AudioProcessor, AudioTranscriptResult
+from app.util.cache import LRUCache, SingleFlight
+from app.util.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CachedAudioProcessor(AudioProcessor):
+    """
+    Content addressed cache in front of another audio processor.
+
+    Results are keyed by a hash of the audio bytes and the recognition
+    configuration. Lookups go to the in-process LRU first and then to the
+    optional Mongo collection; identical concurrent requests share a single
+    recognition.
+    """
+    collection_name = "transcription_cache"
+    indexes = [
+        # Named as the create_index call that used to create it
+        IndexModel(
+            [("created_at", ASCENDING)],
+            name="created_at_1",
+            expireAfterSeconds=settings.TRANSCRIPTION_CACHE_MONGO_TTL_SECONDS
+        ),
+    ]
+
+    def __init__(
+        self,
+        processor: AudioProcessor,
+        max_entries: int,
+        ttl_seconds: int,
+        collection: Optional[AgnosticCollection] = None,
+    ):
+        self.processor = processor
+        self.memory = LRUCache(max_entries, ttl_seconds)
+        self.collection = collection
+        self.single_flight = SingleFlight()
+
+    async def process_audio_transcript(self, audio_data: bytes) -> AudioTranscriptResult:
+        key = self._cache_key(hashlib.blake2b(audio_data, digest_size=16))
+
+        cached = await self._get(key)
+        if cached is not None:
+            return cached
+
+        result, shared = await self.single_flight.do(
+            key,
+            lambda: self._recognize_and_store(key, audio_data)
+        )
+        Metrics.incr("transcription_cache.coalesced" if shared else "transcription_cache.miss")
+        return result
+
+    async def process_audio_stream(self, chunks: AsyncIterator[bytes]) -> AudioTranscriptResult:
+        # The key is only known once the whole upload went through, so streamed
+        # uploads can not be answered from the cache but still fill it
+        audio_hash = hashlib.blake2b(digest_size=16)
+
+        async def hashed_chunks() -> AsyncIterator[bytes]:
+            async for chunk in chunks:
+                audio_hash.update(chunk)
+                yield chunk
+
+        result = await self.processor.process_audio_stream(hashed_chunks())
+        Metrics.incr("transcription_cache.miss")
+        await self._set(self._cache_key(audio_hash), result)
+        return result
+
+    def config_fingerprint(self) -> str:
+        return self.processor.config_fingerprint()
+
+    def shutdown(self) -> None:
+        self.memory.clear()
+        self.processor.shutdown()
+
+    def _cache_key(self, audio_hash) -> str:
+        return f"{self.processor.config_fingerprint()}:{audio_hash.hexdigest()}"
+
+    async def _recognize_and_store(self, key: str, audio_data: bytes) -> AudioTranscriptResult:
+        result = await self.processor.process_audio_transcript(audio_data)
+        await self._set(key, result)
+        return result
+
+    async def _get(self, key: str) -> Optional[AudioTranscriptResult]:
+        result = self.memory.get(key)
+        if result is not None:
+            Metrics.incr("transcription_cache.hit")
+            return result
+
+        if self.collection is None:
+            return None
+
+        try:
+            document = await self.collection.find_one({"_id": key})
+        except Exception as e:
+            logger.error(f"Error reading transcription cache: {str(e)}")
+            return None
+
+        if document is None:
+            return None
+
+        result = AudioTranscriptResult(**document["result"])
+        self.memory.set(key, result)
+        Metrics.incr("transcription_cache.hit")
+        Metrics.incr("transcription_cache.hit_mongo")
+        return result
+
+    async def _set(self, key: str, result: AudioTranscriptResult) -> None:
+        self.memory.set(key, result)
+
+        if self.collection is None:
+            return
+
+        try:
+            await self.collection.replace_one(
+                {"_id": key},
+                {"result": result.model_dump(), "created_at": datetime.now(timezone.utc)},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error writing transcription cache: {str(e)}")
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional, Set, Tuple
+
+from app.core.common.ports import SubtitleMovies
+from app.core.movies.application.dto.movie_dto import MovieIn, MovieSearchOut
+from app.util.cache import LRUCache, SingleFlight
+from app.util.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CachedSubtitleMovies(SubtitleMovies):
+    """
+    Cache in front of another subtitle movies service for the movie search.
+
+    Results are keyed by the normalized query and kept for `ttl_seconds`.
+    Identical concurrent searches share a single upstream call. With
+    `stale_seconds`, an expired result is still served for that long while
+    it is refreshed in the background.
+    """
+
+    def __init__(self, service: SubtitleMovies, max_entries: int, ttl_seconds: float, stale_seconds: float = 0):
+        self.service = service
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        # Entries are (fetched_at, results), kept until they can not be served stale anymore
+        self.memory = LRUCache(max_entries, ttl_seconds + stale_seconds)
+        self.single_flight = SingleFlight()
+        # Keeps a reference to the background refreshes until they are done
+        self._refreshes: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.casefold().split())
+
+    async def search_movies(self, query: str) -> List[MovieSearchOut]:
+        key = self.normalize_query(query)
+
+        entry: Optional[Tuple[float, List[MovieSearchOut]]] = self.memory.get(key)
+        if entry is not None:
+            fetched_at, results = entry
+            if time.monotonic() - fetched_at <= self.ttl_seconds:
+                self._record("hit")
+                return list(results)
+
+            # Stale, answer now and refresh once in the background
+            self._record("stale")
+            if not self.single_flight.in_flight(key):
+                refresh = asyncio.ensure_future(self._refresh(key, query))
+                self._refreshes.add(refresh)
+                refresh.add_done_callback(self._refreshes.discard)
+            return list(results)
+
+        results, shared = await self.single_flight.do(key, lambda: self._fetch(key, query))
+        self._record("coalesced" if shared else "miss")
+        return list(results)
+
+    async def get_subtitles(
+        self,
+        imdb_id: str,
+        language: str = "en",
+        on_line: Optional[Callable[[str], None]] = None
+    ) -> MovieIn:
+        return await self.service.get_subtitles(imdb_id, language, on_line)
+
+    def clear(self) -> None:
+        self.memory.clear()
+
+    async def _fetch(self, key: str, query: str) -> List[MovieSearchOut]:
+        Metrics.incr("movie_search_cache.upstream_calls")
+        try:
+            results = await self.service.search_movies(query)
+        except Exception:
+            Metrics.incr("movie_search_cache.upstream_errors")
+            raise
+
+        self.memory.set(key, (time.monotonic(), results))
+        return results
+
+    async def _refresh(self, key: str, query: str) -> None:
+        try:
+            await self.single_flight.do(key, lambda: self._fetch(key, query))
+        except Exception as e:
+            # The stale result is served until it expires
+            logger.warning(f"Error refreshing movie search '{key}': {str(e)}")
+
+    @staticmethod
+    def _record(outcome: str) -> None:
+        Metrics.incr(f"movie_search_cache.{outcome}")
+        served = sum(Metrics.get_counter(f"movie_search_cache.{name}") for name in ("hit", "stale", "miss", "coalesced"))
+        cached = Metrics.get_counter("movie_search_cache.hit") + Metrics.get_counter("movie_search_cache.stale")
+        Metrics.set_gauge("movie_search_cache.hit_ratio", round(cached / served, 4))
@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import math
+import random
+from typing import Optional
+from app.core.common.ports import AudioProcessor, AudioTranscriptResult, AudioProcessorBusyError
+from app.util.webm import get_webm_duration_us
+
+
+class FakeAudioProcessor(AudioProcessor):
+    """
+    Local stand-in for a speech to text service, meant for load tests.
+
+    The transcript, word timings and confidences are derived from a hash of
+    the audio, so the same upload always produces the same result. Latency
+    and failures are sampled from the configured distributions.
+    """
+
+    vocabulary = (
+        "the", "to", "you", "i", "it", "we", "what", "is", "this", "that",
+        "mission", "log", "location", "fortress", "captain", "ready", "never",
+        "home", "going", "right", "now", "friend", "believe", "tonight",
+    )
+    words_per_second = 2.5
+    # Audio that is not WebM is assumed to be 16 kHz 16 bit mono PCM
+    fallback_bytes_per_second = 32_000
+    latency_distributions = ("fixed", "normal", "lognormal", "exponential")
+
+    def __init__(
+        self,
+        latency_mean_seconds: float = 0.0,
+        latency_stddev_seconds: float = 0.0,
+        latency_distribution: str = "lognormal",
+        error_rate: float = 0.0,
+        busy_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: Optional[int] = None,
+    ):
+        if latency_distribution not in self.latency_distributions:
+            raise ValueError(f"Invalid latency distribution: {latency_distribution}")
+
+        self.latency_mean_seconds = latency_mean_seconds
+        self.latency_stddev_seconds = latency_stddev_seconds
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.busy_rate = busy_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+
+    async def process_audio_transcript(self, audio_data: bytes) -> AudioTranscriptResult:
+        latency = self._sample_latency()
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        outcome = self.random.random()
+        if outcome < self.busy_rate:
+            raise AudioProcessorBusyError(self.retry_after)
+        if outcome < self.busy_rate + self.error_rate:
+            raise RuntimeError("Fake audio processor failure")
+
+        return self.transcribe(audio_data)
+
+    def transcribe(self, audio_data: bytes) -> AudioTranscriptResult:
+        """Deterministic transcript for the given audio"""
+        digest = hashlib.blake2b(audio_data, digest_size=8).digest()
+        rng = random.Random(int.from_bytes(digest, "big"))
+
+        duration = self._duration_seconds(audio_data)
+        word_count = max(1, int(duration * self.words_per_second)) if audio_data else 0
+        slot = duration / word_count if word_count else 0
+
+        words = []
+        for i in range(word_count):
+            start_time = i * slot + rng.uniform(0, slot * 0.3)
+            end_time = start_time + slot * rng.uniform(0.5, 0.7)
+            words.append({
+                "word": rng.choice(self.vocabulary),
+                "start_time": round(start_time, 3),
+                "end_time": round(end_time, 3),
+                "confidence": round(rng.uniform(0.6, 0.99), 4),
+            })
+
+        return AudioTranscriptResult(
+            transcribed_text=" ".join(word["word"] for word in words),
+            confidence=round(sum(word["confidence"] for word in words) / len(words), 4) if words else 0,
+            words=words
+        )
+
+    def config_fingerprint(self) -> str:
+        return "fake"
+
+    def _duration_seconds(self, audio_data: bytes) -> float:
+        duration_us = get_webm_duration_us(audio_data)
+        if duration_us is not None:
+            return duration_us / 1_000_000
+        return len(audio_data) / self.fallback_bytes_per_second
+
+    def _sample_latency(self) -> float:
+        mean, stddev = self.latency_mean_seconds, self.latency_stddev_seconds
+        if mean <= 0:
+            return 0.0
+
+        if self.latency_distribution == "exponential":
+            return self.random.expovariate(1 / mean)
+        if self.latency_distribution == "fixed" or stddev <= 0:
+            return mean
+        if self.latency_distribution == "normal":
+            return max(0.0, self.random.gauss(mean, stddev))
+
+        # Lognormal with the requested mean and standard deviation, the usual
+        # shape of remote service latencies (long right tail)
+        sigma_squared = math.log(1 + (stddev / mean) ** 2)
+        return self.random.lognormvariate(math.log(mean) - sigma_squared / 2, math.sqrt(sigma_squared))
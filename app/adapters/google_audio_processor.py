@@ -1,9 +1,20 @@
-from app.core.common.ports import AudioProcessor, AudioTranscriptResult
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, List
+from app.core.config import settings
+from app.core.common.ports import AudioProcessor, AudioTranscriptResult, AudioProcessorBusyError
+from app.util.metrics import Metrics
 from google.oauth2 import service_account
 from google.cloud import speech_v1
 
 class GoogleAudioProcessor(AudioProcessor):
     min_time_seconds_to_long_running=60
+    long_running_timeout_seconds=90
+    streaming_timeout_seconds=300
+    # Google rejects streaming requests carrying more than 25 KB of audio
+    max_stream_request_bytes=25 * 1024
     def __init__(cls):
         credentials = service_account.Credentials.from_service_account_file('google_credentials.json')
         cls.speech_client = speech_v1.SpeechClient(credentials=credentials)
@@ -14,16 +25,17 @@ class GoogleAudioProcessor(AudioProcessor):
             enable_word_time_offsets=True,
             enable_automatic_punctuation=True,
         )
+        # The Speech client is synchronous, so recognition runs on a dedicated pool
+        # and the semaphore keeps the number of queued requests bounded
+        cls.executor = ThreadPoolExecutor(
+            max_workers=settings.AUDIO_PROCESSOR_MAX_WORKERS,
+            thread_name_prefix="google-speech",
+        )
+        cls.semaphore = asyncio.Semaphore(settings.AUDIO_PROCESSOR_MAX_CONCURRENCY)
 
     async def process_audio_transcript(cls, audio_data: bytes) -> AudioTranscriptResult:
 
-        audio = speech_v1.RecognitionAudio(content=audio_data)
-
-        if cls._get_audio_duration(audio_data) > cls.min_time_seconds_to_long_running:
-            operation = cls.speech_client.long_running_recognize(config=cls.config, audio=audio)
-            response = operation.result(timeout=90)
-        else:
-            response = cls.speech_client.recognize(config=cls.config, audio=audio)
+        response = await cls._run_bounded(cls._recognize, audio_data)
 
         if not response.results:
             return AudioTranscriptResult(
@@ -42,4 +54,103 @@ class GoogleAudioProcessor(AudioProcessor):
                 "end_time": word_info.end_time.total_seconds(),
                 "confidence": transcription.confidence
             } for word_info in transcription.words]
-        )
\ No newline at end of file
+        )
+
+    async def process_audio_stream(cls, chunks: AsyncIterator[bytes]) -> AudioTranscriptResult:
+        # The upload is read before taking a slot, so a slow client never holds a
+        # recognition thread. Its size and duration are capped by the caller
+        audio = [chunk async for chunk in chunks]
+        return await cls._run_bounded(cls._streaming_recognize, audio)
+
+    def config_fingerprint(cls) -> str:
+        config_json = speech_v1.RecognitionConfig.to_json(cls.config, sort_keys=True)
+        return hashlib.blake2b(config_json.encode(), digest_size=8).hexdigest()
+
+    def shutdown(cls) -> None:
+        cls.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _recognize(cls, audio_data: bytes):
+        """Blocking recognition, must only run on the executor"""
+        audio = speech_v1.RecognitionAudio(content=audio_data)
+
+        if cls._get_audio_duration(audio_data) > cls.min_time_seconds_to_long_running:
+            operation = cls.speech_client.long_running_recognize(config=cls.config, audio=audio)
+            return operation.result(timeout=cls.long_running_timeout_seconds)
+
+        return cls.speech_client.recognize(config=cls.config, audio=audio)
+
+    def _streaming_recognize(cls, chunks: List[bytes]) -> AudioTranscriptResult:
+        """Blocking streaming recognition of the uploaded chunks, must only run on the executor"""
+        streaming_config = speech_v1.StreamingRecognitionConfig(config=cls.config)
+        responses = cls.speech_client.streaming_recognize(
+            config=streaming_config,
+            requests=cls._stream_requests(chunks),
+            timeout=cls.streaming_timeout_seconds,
+        )
+
+        transcripts, words, confidences = [], [], []
+        for response in responses:
+            for result in response.results:
+                if not result.is_final or not result.alternatives:
+                    continue
+                alternative = result.alternatives[0]
+                transcripts.append(alternative.transcript.strip())
+                confidences.append(alternative.confidence)
+                words.extend({
+                    "word": word_info.word,
+                    "start_time": word_info.start_time.total_seconds(),
+                    "end_time": word_info.end_time.total_seconds(),
+                    "confidence": alternative.confidence
+                } for word_info in alternative.words)
+
+        return AudioTranscriptResult(
+            transcribed_text = " ".join(transcripts),
+            confidence = sum(confidences) / len(confidences) if confidences else 0,
+            words = words
+        )
+
+    def _stream_requests(cls, chunks: List[bytes]) -> Iterator[speech_v1.StreamingRecognizeRequest]:
+        for chunk in chunks:
+            for offset in range(0, len(chunk), cls.max_stream_request_bytes):
+                yield speech_v1.StreamingRecognizeRequest(
+                    audio_content=chunk[offset:offset + cls.max_stream_request_bytes]
+                )
+
+    async def _run_bounded(cls, func, *args):
+        """Run a blocking call on the executor once a concurrency slot is free"""
+        enqueued_at = time.perf_counter()
+        Metrics.add_gauge("audio_processor.waiting", 1)
+        # wait_for on acquire() may lose a slot granted as the timeout fires (before
+        # Python 3.12), the acquiring task gives back a slot nobody waits for anymore
+        acquire = asyncio.ensure_future(cls.semaphore.acquire())
+        try:
+            done, _ = await asyncio.wait({acquire}, timeout=settings.AUDIO_PROCESSOR_ACQUIRE_TIMEOUT_SECONDS)
+        except BaseException:
+            cls._abandon_acquire(acquire)
+            raise
+        finally:
+            Metrics.add_gauge("audio_processor.waiting", -1)
+
+        if not done:
+            cls._abandon_acquire(acquire)
+            Metrics.incr("audio_processor.rejected")
+            raise AudioProcessorBusyError(settings.AUDIO_PROCESSOR_RETRY_AFTER_SECONDS)
+
+        Metrics.observe("audio_processor.wait_seconds", time.perf_counter() - enqueued_at)
+        Metrics.add_gauge("audio_processor.in_flight", 1)
+        started_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(cls.executor, func, *args)
+        finally:
+            Metrics.observe("audio_processor.recognition_seconds", time.perf_counter() - started_at)
+            Metrics.add_gauge("audio_processor.in_flight", -1)
+            cls.semaphore.release()
+
+    def _abandon_acquire(cls, acquire: asyncio.Future) -> None:
+        def release_if_acquired(future: asyncio.Future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                cls.semaphore.release()
+
+        acquire.cancel()
+        acquire.add_done_callback(release_if_acquired)
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Callable, List, Optional
 from app.integration.http_client import HttpClient
 from app.core.config import settings
 from app.core.common.ports import SubtitleMovies
-from app.core.movies.application.dto.movie_dto import MovieSearchOut, MovieOut
+from app.core.movies.application.dto.movie_dto import MovieSearchOut, MovieIn
+from app.util.text_stream import iter_decoded_lines
 from datetime import datetime
 
 class OpenSubTitles(SubtitleMovies):
@@ -17,7 +18,8 @@ class OpenSubTitles(SubtitleMovies):
     @classmethod
     async def search_movies(cls, query: str) -> List[MovieSearchOut]:
 
-        async with HttpClient.session.get(
+        async with HttpClient.request(
+            "GET",
             f"{cls.base_url}/features",
             headers=cls.default_headers,
             params={
@@ -42,14 +44,20 @@ class OpenSubTitles(SubtitleMovies):
             ]
 
     @classmethod
-    async def get_subtitles(cls, imdb_id: str, language: str = "en") -> MovieOut:
+    async def get_subtitles(
+        cls,
+        imdb_id: str,
+        language: str = "en",
+        on_line: Optional[Callable[[str], None]] = None
+    ) -> MovieIn:
 
         params = {
             "imdb_id": imdb_id,
             "languages": language
         }
 
-        async with HttpClient.session.get(
+        async with HttpClient.request(
+            "GET",
             f"{cls.base_url}/subtitles",
             headers=cls.default_headers,
             params=params
@@ -65,7 +73,8 @@ class OpenSubTitles(SubtitleMovies):
             subtitle = max(data["data"], key=lambda x: x.get("ratings", 0))
             file_id = subtitle["attributes"]["files"][0]["file_id"]
 
-            async with HttpClient.session.post(
+            async with HttpClient.request(
+                "POST",
                 f"{cls.base_url}/download",
                 headers=cls.default_headers,
                 json={"file_id": file_id}
@@ -76,12 +85,25 @@ class OpenSubTitles(SubtitleMovies):
                 download_data = await download_response.json()
                 subtitle_url = download_data["link"]
                 
-                async with HttpClient.session.get(subtitle_url) as content_response:
-                    subtitle_content = await content_response.text()
-                    
+                async with HttpClient.request("GET", subtitle_url) as content_response:
+                    if content_response.status != 200:
+                        raise Exception(f"Failed to download subtitle content: {content_response.status}")
+
+                    # Decoded while it downloads, the raw body is never buffered
+                    lines = []
+                    async for line in iter_decoded_lines(
+                        content_response.content.iter_chunked(settings.SUBTITLE_DOWNLOAD_CHUNK_SIZE),
+                        settings.SUBTITLE_DOWNLOAD_MAX_BYTES,
+                        content_response.charset
+                    ):
+                        lines.append(line)
+                        if on_line is not None:
+                            on_line(line)
+                    subtitle_content = "".join(lines)
+
                     all_movie_info = subtitle["attributes"]
 
-                    processed_data = MovieOut(
+                    processed_data = MovieIn(
                         imdb_id = imdb_id,
                         content = subtitle_content,
                         all_movie_info = all_movie_info,
@@ -3,6 +3,7 @@ from .movie_bo import MovieBusiness
 from .subtitles_bo import SubtitlesBussiness
 from .dialogue_bo import DialogueBusiness
 from .user_bo import UserBusiness
+from .job_bo import JobBusiness
 
 __all__ = (
   "AuthBusiness",
@@ -10,4 +11,5 @@ __all__ = (
   "SubtitlesBussiness",
   "DialogueBusiness",
   "UserBusiness",
+  "JobBusiness",
 )
\ No newline at end of file
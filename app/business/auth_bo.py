@@ -1,18 +1,17 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from google.oauth2 import id_token
-from google.auth.transport import requests
 from fastapi import HTTPException, status, Depends, Request
 import jwt
 from jwt.exceptions import InvalidTokenError
 from fastapi.security import OAuth2AuthorizationCodeBearer
 
 from app.core.common.application.dto import GoogleLoginData, DevLoginData
-from app.core.users.application.dto.user_dto import UserOut
+from app.core.users.application.dto.user_dto import UserPrincipal
 from app.core.config import settings
 from app.core.users.infra.database.repositories import UserMongoRepository
 from app.core.users.domain import UserEntity, UserProgress
-from app.core.users.application import UserMapper
+from app.core.users.application import UserMapper, PrincipalCache
+from app.integration.google_id_token import GoogleIdTokenVerifier, GoogleKeysUnavailableError
 
 class AuthBusiness:
 
@@ -26,35 +25,24 @@ class AuthBusiness:
     async def google_login_service(cls, token_data: GoogleLoginData):
         token = token_data.token
         try:
-            idinfo = id_token.verify_oauth2_token(
-                token, requests.Request(), settings.GOOGLE_CLIENT_ID, 5)
+            idinfo = await GoogleIdTokenVerifier.verify(token, settings.GOOGLE_CLIENT_ID)
             if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Invalid issuer."
                 )
-            google_id = idinfo['sub']
 
-            user_entity = await cls.user_repo.find_by_google_id(google_id)
-            
-            if not user_entity:
-                user_entity = UserEntity.create(
-                    email=idinfo['email'],
-                    name=idinfo['name'],
-                    picture=idinfo.get('picture', ''),
-                    google_id=idinfo['sub'],
-                    achievements=[],
-                    created_at=datetime.now(timezone.utc),
-                    last_login=datetime.now(timezone.utc),
-                    progress=UserProgress()
-                )
-                await cls.user_repo.create(user_entity)
-            else:
-                # Update last login
-                user_entity.last_login = datetime.now(timezone.utc)
-                await cls.user_repo.update(user_entity.id.value, user_entity)
-
-            user_entity = await cls.user_repo.find_by_google_id(google_id)
+            now = datetime.now(timezone.utc)
+            user_entity = await cls.user_repo.upsert_login(UserEntity.create(
+                email=idinfo['email'],
+                name=idinfo['name'],
+                picture=idinfo.get('picture', ''),
+                google_id=idinfo['sub'],
+                achievements=[],
+                created_at=now,
+                last_login=now,
+                progress=UserProgress()
+            ))
             user_dto = UserMapper.to_dto(user_entity)
             access_token = cls.create_access_token(data={"sub": str(user_dto.id)})
             
@@ -69,29 +57,25 @@ class AuthBusiness:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid token"
             )
+        except GoogleKeysUnavailableError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Google sign-in is temporarily unavailable"
+            )
   
     @classmethod
     async def dev_login_service(cls, data: DevLoginData):
-        results = await cls.user_repo.find_with_filters({"email": data.email}, limit=1)
-        user_entity = results[0] if results else None
-
-        if not user_entity:
-            user_entity = UserEntity.create(
-                email=data.email,
-                name=data.name,
-                picture="",
-                google_id="",
-                achievements=[],
-                created_at=datetime.now(timezone.utc),
-                last_login=datetime.now(timezone.utc),
-                progress=UserProgress()
-            )
-            await cls.user_repo.create(user_entity)
-            results = await cls.user_repo.find_with_filters({"email": data.email}, limit=1)
-            user_entity = results[0]
-        else:
-            user_entity.last_login = datetime.now(timezone.utc)
-            await cls.user_repo.update(user_entity.id.value, user_entity)
+        now = datetime.now(timezone.utc)
+        user_entity = await cls.user_repo.upsert_login(UserEntity.create(
+            email=data.email,
+            name=data.name,
+            picture="",
+            google_id="",
+            achievements=[],
+            created_at=now,
+            last_login=now,
+            progress=UserProgress()
+        ), key="email")
 
         user_dto = UserMapper.to_dto(user_entity)
         access_token = cls.create_access_token(data={"sub": str(user_dto.id)})
@@ -113,7 +97,7 @@ class AuthBusiness:
     @staticmethod
     async def get_current_user(
         request: Request,
-    ) -> UserOut:
+    ) -> UserPrincipal:
         if request.state.user:
             return request.state.user
 
@@ -128,7 +112,7 @@ class AuthBusiness:
         cls,
         request: Request,
         token: str = Depends(oauth2_scheme),
-    ) -> UserOut:
+    ) -> UserPrincipal:
 
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -145,8 +129,12 @@ class AuthBusiness:
         except InvalidTokenError:
             raise credentials_exception     
 
-        user_entity = await cls.user_repo.find_by_id(user_id)
-        if user_entity is None:
-            raise credentials_exception
+        principal = PrincipalCache.get(user_id)
+        if principal is None:
+            user_entity = await cls.user_repo.find_by_id(user_id)
+            if user_entity is None:
+                raise credentials_exception
+            principal = UserMapper.to_principal(user_entity)
+            PrincipalCache.set(principal)
 
-        request.state.user = UserMapper.to_dto(user_entity)
+        request.state.user = principal
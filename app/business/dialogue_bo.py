@@ -1,14 +1,23 @@
-from typing import List
+from typing import AsyncIterator, Awaitable, List, Optional
 from datetime import datetime, timezone
 import logging
 from fastapi import HTTPException, status
-from app.core.dialogues.application.dto.dialogue_dto import DialogueOut, PracticeResult, DialoguePracticeHistoryOut
-from app.core.users.application.dto.user_dto import UserOut
+from app.core.dialogues.application.dto.dialogue_dto import DialogueOut, DialogueSummaryOut, PracticeResult, DialoguePracticeHistoryOut
+from app.core.users.application.dto.user_dto import UserPrincipal
+from app.core.common.application.dto import Page
 from app.integration.audio_processor import AudioProcessor
+from app.integration.mongo import Mongo
+from app.integration.outbox_relay import OutboxRelay
+from app.core.common.ports import AudioProcessorBusyError, AudioTranscriptResult
 from app.business.user_bo import UserBusiness
 from app.core.dialogues.infra.database.repositories import DialogueMongoRepository, DialoguePracticeHistoryMongoRepository
 from app.core.dialogues.application import DialogueMapper, DialoguePracticeHistoryMapper
 from app.core.dialogues.domain import DialoguePracticeHistoryEntity
+from app.core.common.infra.database.repositories import OutboxMongoRepository
+from app.core.config import settings
+from app.util.webm import get_webm_duration_us
+from app.util.text_search import parse_query, find_highlights, find_literal_highlights
+from app.util.cursor import InvalidCursorError
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +27,7 @@ class DialogueBusiness:
     FLUENCY_THRESHOLD = 0.7
     dialogue_repo = DialogueMongoRepository()
     dialogue_practice_history_repo = DialoguePracticeHistoryMongoRepository()
+    outbox_repo = OutboxMongoRepository()
 
     @classmethod
     async def search_dialogues(
@@ -26,11 +36,62 @@ class DialogueBusiness:
         imdb_id: str,
         skip: int = 0,
         limit: int = 20,
-    ) -> List[DialogueOut]:
+        search_mode: str = "text",
+        after: Optional[str] = None,
+    ) -> Page[DialogueOut]:
 
-        entities = await cls.dialogue_repo.find_with_filters({ "imdb_id": imdb_id, "search": search }, skip, limit)    
-        return [DialogueMapper.to_dto(entity) for entity in entities]
+        filters = { "imdb_id": imdb_id, "search": search, "search_mode": search_mode }
+        try:
+            entities = await cls.dialogue_repo.find_with_filters(filters, skip, limit, after)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        dialogues = [DialogueMapper.to_dto(entity) for entity in entities]
+
+        if search:
+            query = parse_query(search)
+            for dialogue in dialogues:
+                for line in dialogue.lines:
+                    if search_mode == "regex":
+                        line.highlights = find_literal_highlights(line.text, search)
+                    else:
+                        line.highlights = find_highlights(line.text, query)
+
+        return Page(
+            items=dialogues,
+            next_cursor=cls.dialogue_repo.next_cursor(entities, filters, skip, limit, after)
+        )
     
+    @classmethod
+    async def search_dialogue_summaries(
+        cls,
+        search: str,
+        imdb_id: str,
+        skip: int = 0,
+        limit: int = 20,
+        search_mode: str = "text",
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page[DialogueSummaryOut]:
+        """Listing without the lines, only the requested `fields` (all summary fields by default)"""
+        unknown = set(fields or []) - DialogueMongoRepository.SUMMARY_PROJECTION.keys()
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+
+        filters = { "imdb_id": imdb_id, "search": search, "search_mode": search_mode }
+        try:
+            docs = await cls.dialogue_repo.find_summaries_with_filters(filters, skip, limit, after, fields)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        summaries = [DialogueMapper.from_summary_document_to_dto(doc) for doc in docs]
+
+        return Page(
+            items=summaries,
+            next_cursor=cls.dialogue_repo.next_cursor(summaries, filters, skip, limit, after)
+        )
+
     @classmethod
     async def get_dialogue (cls, dialogue_id: str) -> DialogueOut:
         entity = await cls.dialogue_repo.find_by_id(dialogue_id)
@@ -48,18 +109,89 @@ class DialogueBusiness:
         cls,
         dialogue_id: str,
         audio_data: bytes,
-        user: UserOut = None
+        user: UserPrincipal = None
     ) -> PracticeResult:
         dialogue = await cls.get_dialogue(dialogue_id)
+        transcription_result = await cls._transcribe(
+            AudioProcessor.client.process_audio_transcript(audio_data)
+        )
+        return await cls._build_practice_result(dialogue, transcription_result, user)
 
+    @classmethod
+    async def proccess_practice_dialogue_stream(
+        cls,
+        dialogue_id: str,
+        chunks: AsyncIterator[bytes],
+        user: UserPrincipal = None
+    ) -> PracticeResult:
+        """Same as proccess_practice_dialogue, but the audio is consumed chunk by chunk"""
+        dialogue = await cls.get_dialogue(dialogue_id)
+        transcription_result = await cls._transcribe(
+            AudioProcessor.client.process_audio_stream(cls._limit_audio_stream(chunks))
+        )
+        return await cls._build_practice_result(dialogue, transcription_result, user)
+
+    @staticmethod
+    async def _limit_audio_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """
+        Forward the upload chunks while enforcing the size and duration limits,
+        so an oversized upload is rejected as soon as it crosses a limit.
+        """
+        received = 0
+        probe = bytearray()
+        probed = False
+
+        async for chunk in chunks:
+            if not chunk:
+                continue
+
+            received += len(chunk)
+            if received > settings.AUDIO_UPLOAD_MAX_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                    detail=f"Audio exceeds the maximum size of {settings.AUDIO_UPLOAD_MAX_BYTES} bytes"
+                )
+
+            if not probed:
+                probe += chunk[:settings.AUDIO_UPLOAD_PROBE_BYTES - len(probe)]
+                if len(probe) >= settings.AUDIO_UPLOAD_PROBE_BYTES:
+                    probed = True
+                    # The header Duration (or the timecodes seen so far) is a lower bound of the clip length
+                    duration_us = get_webm_duration_us(probe)
+                    probe = bytearray()
+                    if duration_us is not None and duration_us / 1_000_000 > settings.AUDIO_UPLOAD_MAX_DURATION_SECONDS:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                            detail=f"Audio exceeds the maximum duration of {settings.AUDIO_UPLOAD_MAX_DURATION_SECONDS} seconds"
+                        )
+
+            yield chunk
+
+    @staticmethod
+    async def _transcribe(transcription: Awaitable[AudioTranscriptResult]) -> AudioTranscriptResult:
         try:
-            transcription_result = await AudioProcessor.client.process_audio_transcript(audio_data)
+            return await transcription
+        except HTTPException:
+            raise
+        except AudioProcessorBusyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Audio processor is busy, try again later",
+                headers={"Retry-After": str(e.retry_after)}
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Audio processing error: {str(e)}"
             )
 
+    @classmethod
+    async def _build_practice_result(
+        cls,
+        dialogue: DialogueOut,
+        transcription_result: AudioTranscriptResult,
+        user: UserPrincipal
+    ) -> PracticeResult:
         word_scores = [word_score.get('confidence', 0) for word_score in transcription_result.words]
         full_dialogue_text = " ".join(line.text for line in dialogue.lines)
 
@@ -86,6 +218,10 @@ class DialogueBusiness:
             xp_earned=xp_earned
         )
 
+        if settings.OUTBOX_ENABLED:
+            await cls._record_practice(dialogue, user.id, result)
+            return result
+
         await cls._create_practice_history(dialogue, user.id, result)
         await UserBusiness.update_progress(user.id, result)
         
@@ -95,41 +231,76 @@ class DialogueBusiness:
         return result
 
     @classmethod
-    async def list_practice_history(cls, filter_type: str, skip: int = 0, limit: int = 20, user: UserOut = None) -> List[DialoguePracticeHistoryOut]:
+    async def _record_practice(cls, dialogue: DialogueOut, user_id: str, result: PracticeResult) -> None:
+        """
+        Write the practice history, the progress and their events to the outbox
+        in one transaction, the relay dispatches the events once it commits
+        """
+        async def record(session):
+            await cls.dialogue_practice_history_repo.create(
+                cls._practice_history_entity(dialogue, user_id, result),
+                session=session
+            )
+            user_entity = await UserBusiness.record_practice_result(user_id, result, session)
+            await cls.outbox_repo.add([cls._practice_completed_event(dialogue, user_id, result)], session=session)
+            return user_entity
+
+        user_entity = await Mongo.run_in_transaction(record)
+        user_entity.mark_events_as_committed()
+        OutboxRelay.notify()
+
+    @classmethod
+    async def list_practice_history(
+        cls,
+        filter_type: str,
+        skip: int = 0,
+        limit: int = 20,
+        user: UserPrincipal = None,
+        after: Optional[str] = None
+    ) -> Page[DialoguePracticeHistoryOut]:
         filters = {
             "user_id": user.id,
             "sort_field": "completed_at" if filter_type == 'recent' else "xp_earned",
             "sort_desc": True
         }
         
-        entities = await cls.dialogue_practice_history_repo.find_with_filters(
-            filters, 
-            skip, 
-            limit,
-            include_dialogue=True
-        )
+        try:
+            entities = await cls.dialogue_practice_history_repo.find_with_filters(
+                filters, 
+                skip, 
+                limit,
+                include_dialogue=True,
+                after=after
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
-        return [DialoguePracticeHistoryMapper.to_dto(entity, include_dialogue=True) for entity in entities]
+        return Page(
+            items=[DialoguePracticeHistoryMapper.to_dto(entity, include_dialogue=True) for entity in entities],
+            next_cursor=cls.dialogue_practice_history_repo.next_cursor(entities, filters, skip, limit, after)
+        )
 
     @classmethod
     async def _create_practice_history(cls, dialogue: DialogueOut, user_id: str, result: PracticeResult) -> None:
         try:
-            practice_duration = sum(line.end_time - line.start_time for line in dialogue.lines)
-            practice_entity = DialoguePracticeHistoryEntity.create(
-                dialogue_id=dialogue.id,
-                user_id=user_id,
-                pronunciation_score=result.pronunciation_score,
-                fluency_score=result.fluency_score,
-                completed_at=datetime.now(timezone.utc),
-                practice_duration_seconds=practice_duration,
-                character_played='',
-                xp_earned=result.xp_earned
-            )
-
-            await cls.dialogue_practice_history_repo.create(practice_entity)
+            await cls.dialogue_practice_history_repo.create(cls._practice_history_entity(dialogue, user_id, result))
         except Exception as e:
             logger.error(f"Error saving practice history: {str(e)}")
 
+    @staticmethod
+    def _practice_history_entity(dialogue: DialogueOut, user_id: str, result: PracticeResult) -> DialoguePracticeHistoryEntity:
+        practice_duration = sum(line.end_time - line.start_time for line in dialogue.lines)
+        return DialoguePracticeHistoryEntity.create(
+            dialogue_id=dialogue.id,
+            user_id=user_id,
+            pronunciation_score=result.pronunciation_score,
+            fluency_score=result.fluency_score,
+            completed_at=datetime.now(timezone.utc),
+            practice_duration_seconds=practice_duration,
+            character_played='',
+            xp_earned=result.xp_earned
+        )
+
     @staticmethod
     def _calculate_fluency_score(word_timings: list) -> float:
         # TODO: Implement more sophisticated fluency scoring
@@ -216,24 +387,26 @@ class DialogueBusiness:
     ) -> None:
         """Publish dialogue-related domain events"""
         from app.core.common.domain.events.event_dispatcher import event_dispatcher
-        from app.core.dialogues.domain.events.practice_completed_event import PracticeCompletedEvent
-        from app.core.common.domain.value_objects import Uuid, Score, XpPoints
         
         try:
-            # Create and publish practice completed event
-            practice_duration = sum(line.end_time - line.start_time for line in dialogue.lines)
-            practice_event = PracticeCompletedEvent(
-                user_id=Uuid(user_id),
-                dialogue_id=Uuid(dialogue.id),
-                pronunciation_score=Score(result.pronunciation_score),
-                fluency_score=Score(result.fluency_score),
-                xp_earned=XpPoints(result.xp_earned),
-                practice_duration_seconds=practice_duration,
-                difficulty_level=dialogue.difficulty_level,
-                character_played=""
-            )
-            
-            await event_dispatcher.publish(practice_event)
+            await event_dispatcher.publish(cls._practice_completed_event(dialogue, user_id, result))
             
         except Exception as e:
-            logger.error(f"Error publishing practice domain events: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error publishing practice domain events: {str(e)}")
+
+    @staticmethod
+    def _practice_completed_event(dialogue: DialogueOut, user_id: str, result: PracticeResult):
+        from app.core.dialogues.domain.events.practice_completed_event import PracticeCompletedEvent
+        from app.core.common.domain.value_objects import Uuid, Score, XpPoints
+
+        practice_duration = sum(line.end_time - line.start_time for line in dialogue.lines)
+        return PracticeCompletedEvent(
+            user_id=Uuid(user_id),
+            dialogue_id=Uuid(dialogue.id),
+            pronunciation_score=Score(result.pronunciation_score),
+            fluency_score=Score(result.fluency_score),
+            xp_earned=XpPoints(result.xp_earned),
+            practice_duration_seconds=practice_duration,
+            difficulty_level=dialogue.difficulty_level,
+            character_played=""
+        )
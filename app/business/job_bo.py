@@ -0,0 +1,42 @@
+from typing import Any, Dict, Optional
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.core.jobs.application import JobMapper
+from app.core.jobs.application.dto.job_dto import JobOut
+from app.core.jobs.domain import JobEntity
+from app.core.jobs.infra.database.repositories import JobMongoRepository
+from app.integration.job_runner import JobRunner
+
+class JobBusiness:
+    job_repo = JobMongoRepository()
+
+    @classmethod
+    async def enqueue(cls, type: str, payload: Dict[str, Any], key: Optional[str] = None) -> JobOut:
+        """Queue a job, a pending or running job with the same key is returned instead"""
+        entity = JobEntity.create(
+            type=type,
+            payload=payload,
+            key=key,
+            max_attempts=settings.JOB_MAX_ATTEMPTS
+        )
+        if key is None:
+            await cls.job_repo.create(entity)
+        else:
+            entity, created = await cls.job_repo.create_or_find_active(entity)
+            if not created:
+                return JobMapper.to_dto(entity)
+        JobRunner.notify()
+
+        return JobMapper.to_dto(entity)
+
+    @classmethod
+    async def get_job(cls, job_id: str) -> JobOut:
+        entity = await cls.job_repo.find_by_id(job_id)
+
+        if entity is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+
+        return JobMapper.to_dto(entity)
@@ -1,15 +1,28 @@
-from typing import List, Dict, Optional
+import asyncio
+import queue
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple
+from fastapi import HTTPException, status
 from app.integration.connector import get_subtitle_movie_connector
+from app.integration.process_pool import ProcessPool
 from app.core.movies.application.dto.movie_dto import MovieSearchOut, MovieOut, MovieIn
-from app.business.subtitles_bo import SubtitlesBussiness
+from app.business.subtitles_bo import SubtitlesBussiness, ParsedScene
 from app.core.dialogues.domain.dialogue_entity import DialogueMovie
-from app.core.movies.infra.database.repositories import MovieProcessedMongoRepository
+from app.core.movies.infra.database.repositories import MovieProcessedMongoRepository, SubtitleContentMongoRepository
+from app.core.movies.domain import MovieEntity
 from app.core.movies.application import MovieMapper
 from app.core.dialogues.infra.database.repositories import DialogueMongoRepository
+from app.core.common.application.dto import Page
+from app.core.jobs.application.dto.job_dto import JobOut
+from app.core.jobs.domain import JobEntity
+from app.business.job_bo import JobBusiness
+from app.util.cursor import InvalidCursorError
+from app.util.text_stream import TextTooLargeError
 
 class MovieBusiness:
+    PROCESS_MOVIE_DIALOGUES_JOB = "process_movie_dialogues"
     subtitle_movie = get_subtitle_movie_connector()
     movie_repo = MovieProcessedMongoRepository()
+    content_repo = SubtitleContentMongoRepository()
     dialogue_repo = DialogueMongoRepository()
 
     @classmethod
@@ -20,6 +33,8 @@ class MovieBusiness:
     @classmethod
     async def store_processed_movie(cls, movie_data: MovieIn):
         entity = MovieMapper.to_entity(movie_data)
+        if entity.content is not None:
+            entity.content_id = await cls.content_repo.save(entity.content)
         if entity.id:
             await cls.movie_repo.update(entity.id, entity)
         else:
@@ -30,12 +45,57 @@ class MovieBusiness:
         return await cls.subtitle_movie.search_movies(query)
 
     @classmethod
-    async def process_movie_dialogues(cls, imdb_id: str, language: str = "en") -> Dict:
+    async def enqueue_movie_dialogues_processing(cls, imdb_id: str, language: str = "en") -> JobOut:
+        """Process the movie in the background, repeated requests share the running job"""
+        return await JobBusiness.enqueue(
+            cls.PROCESS_MOVIE_DIALOGUES_JOB,
+            {"imdb_id": imdb_id, "language": language},
+            key=f"{cls.PROCESS_MOVIE_DIALOGUES_JOB}:{imdb_id}:{language}"
+        )
+
+    @classmethod
+    async def run_process_movie_dialogues_job(
+        cls,
+        job: JobEntity,
+        progress: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> Dict:
+        return await cls.process_movie_dialogues(job.payload["imdb_id"], job.payload["language"], progress)
+
+    @classmethod
+    async def process_movie_dialogues(
+        cls,
+        imdb_id: str,
+        language: str = "en",
+        progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ) -> Dict:
+        report = progress or cls._ignore_progress
+
+        scenes = None
         movie_entity = await cls.movie_repo.find_by_imdb_id(imdb_id)
         if movie_entity is None:
-            movie_dto = await cls.subtitle_movie.get_subtitles(imdb_id, language)
+            await report({"stage": "downloading"})
+            movie_dto, scenes = await cls._download_and_parse(imdb_id, language)
             movie_entity = MovieMapper.to_entity(movie_dto)
+            movie_entity.content_id = await cls.content_repo.save(movie_entity.content)
             await cls.movie_repo.create(movie_entity)
+
+        if movie_entity.content_id is None:
+            await cls._move_inline_content(movie_entity)
+
+        # Same subtitle and parser as the last run, the stored dialogues are up to date
+        content_hash = movie_entity.content_id
+        parser_version = SubtitlesBussiness.PARSER_VERSION
+        if movie_entity.is_processed(content_hash, parser_version):
+            await report({"stage": "done", "dialogues_stored": movie_entity.dialogues_count})
+            return {"message": "Subtitles already processed", "dialogues_count": movie_entity.dialogues_count}
+
+        if movie_entity.content is None:
+            movie_entity.content = await cls.content_repo.find_by_id(movie_entity.content_id)
+            if movie_entity.content is None:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Subtitle content {movie_entity.content_id} not found"
+                )
         
         dialogue_movie = DialogueMovie(
             imdb_id=imdb_id,
@@ -43,22 +103,81 @@ class MovieBusiness:
             language=language
         )
             
-        dialogue_entities = SubtitlesBussiness.process_subtitle_content(movie_entity.content, dialogue_movie)
-        
-        if dialogue_entities:
-            saved_entities = await cls.dialogue_repo.create_many(dialogue_entities)
-            dialogues_count = len(saved_entities)
+        await report({"stage": "parsing"})
+        if scenes is not None:
+            dialogue_entities = SubtitlesBussiness.to_dialogue_entities(scenes, dialogue_movie)
         else:
-            dialogues_count = 0
+            dialogue_entities = await SubtitlesBussiness.process_subtitle_content_async(movie_entity.content, dialogue_movie)
 
+        await report({"stage": "storing", "scenes_parsed": len(dialogue_entities)})
+        dialogues_count = await cls.dialogue_repo.replace_movie_dialogues(imdb_id, dialogue_entities)
+
+        movie_entity.mark_processed(content_hash, parser_version, dialogues_count)
+        await cls.movie_repo.update(str(movie_entity.id), movie_entity)
+
+        await report({"stage": "done", "dialogues_stored": dialogues_count})
         return {"message": "Subtitles processed successfully", "dialogues_count": dialogues_count}
+
+    @classmethod
+    async def _download_and_parse(cls, imdb_id: str, language: str) -> Tuple[MovieIn, List[ParsedScene]]:
+        """
+        Download and parse the subtitle. With worker processes the downloaded
+        content is parsed on the pool, like a reprocessing, so the parser does
+        not hold the GIL of the event loop. Without them the lines are parsed
+        on a thread while they download.
+        """
+        if ProcessPool.executor is not None:
+            movie_dto = await cls._download(imdb_id, language)
+            return movie_dto, await ProcessPool.run(SubtitlesBussiness.parse_content, movie_dto.content)
+
+        lines = queue.SimpleQueue()
+        parsing = asyncio.ensure_future(asyncio.to_thread(SubtitlesBussiness.parse_content, iter(lines.get, None)))
+        try:
+            movie_dto = await cls._download(imdb_id, language, lines.put)
+        except BaseException:
+            lines.put(None)
+            # The parser stops on the partial content, only its thread has to be waited for
+            await asyncio.gather(parsing, return_exceptions=True)
+            raise
+        lines.put(None)
+        return movie_dto, await parsing
+
+    @classmethod
+    async def _download(cls, imdb_id: str, language: str, on_line: Optional[Callable[[str], None]] = None) -> MovieIn:
+        try:
+            return await cls.subtitle_movie.get_subtitles(imdb_id, language, on_line)
+        except TextTooLargeError as e:
+            raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
+
+    @classmethod
+    async def _move_inline_content(cls, movie_entity: MovieEntity) -> None:
+        """Movies stored before the content moved out of their document are migrated when processed"""
+        movie_entity.content = await cls.movie_repo.find_inline_content(str(movie_entity.id)) or ""
+        movie_entity.content_id = await cls.content_repo.save(movie_entity.content)
+        await cls.movie_repo.detach_inline_content(str(movie_entity.id), movie_entity.content_id)
+
+    @staticmethod
+    async def _ignore_progress(progress: Dict[str, Any]) -> None:
+        pass
     
     @classmethod
-    async def search_processed_movies(cls, search: Optional[str] = None, skip: int = 0, limit: int = 20) -> List[MovieOut]:
+    async def search_processed_movies(
+        cls,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> Page[MovieOut]:
         filters = {}
         if search:
             filters["title"] = search
         
-        entities = await cls.movie_repo.find_with_filters(filters, skip, limit)
+        try:
+            entities = await cls.movie_repo.find_with_filters(filters, skip, limit, after)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
-        return [MovieMapper.to_dto(entity) for entity in entities]
\ No newline at end of file
+        return Page(
+            items=[MovieMapper.to_dto(entity) for entity in entities],
+            next_cursor=cls.movie_repo.next_cursor(entities, filters, skip, limit, after)
+        )
\ No newline at end of file
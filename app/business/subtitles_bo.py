@@ -1,98 +1,68 @@
-import re
-from typing import List, Tuple
+import asyncio
+from typing import Iterable, List, Tuple, Union
 from app.core.dialogues.domain.dialogue_entity import DialogueEntity, DialogueLine, DialogueMovie
+from app.integration.process_pool import ProcessPool
+from app.util.subtitles import iter_dialogue_lines, merge_consecutive_lines
+
+# Plain data crossing the process boundary
+# (character, text, start_time, end_time)
+ParsedLine = Tuple[str, str, float, float]
+# (lines, duration_seconds, difficulty_level)
+ParsedScene = Tuple[List[ParsedLine], float, int]
 
 class SubtitlesBussiness:
+    # Bump when a change to the parsing or scene grouping should reprocess the stored movies
+    PARSER_VERSION = 2
 
     @classmethod
     def process_subtitle_content(cls, content: str, movie: DialogueMovie = None) -> List[DialogueEntity]:
-        """Process subtitle content into structured dialogues"""
-
-        dialogue_lines = cls._extract_dialogues(content)
-        scenes = cls._group_into_scenes(dialogue_lines)
-
-        return [DialogueEntity.create(
-            lines=scene,
-            duration_seconds=scene[-1].end_time - scene[0].start_time,
-            movie=movie
-        ) for scene in scenes]
-
-    @classmethod
-    def _extract_dialogues(cls, subtitle_content: str) -> List[DialogueLine]:
-        """Extract dialogues from subtitle content with character identification"""
-        dialogue_lines = []
-        min_length_to_be_valid_block = 3
-        
-        subtitle_blocks = re.split(r'\n\n+', subtitle_content.strip())
-        
-        for block in subtitle_blocks:
-            lines = block.split('\n')
-            if len(lines) < min_length_to_be_valid_block:
-                continue
-                
-            timestamp = lines[1]
-            start_time, end_time = cls._parse_timestamp(timestamp)
-            
-            # Parse text and identify character
-            text = '\n'.join(lines[2:])
-            dialogues = cls._identify_all_characters(text)
-            
-            for character, dialogue in dialogues:
-                if dialogue:
-                    dialogue_lines.append(
-                        DialogueLine(
-                            character=character,
-                            text=dialogue,
-                            start_time=start_time,
-                            end_time=end_time
-                        )
-                    )
-        
-        return cls._merge_consecutive_lines(dialogue_lines)
+        """Process subtitle content into structured dialogues, on the calling thread"""
+        return cls.to_dialogue_entities(cls.parse_content(content), movie)
 
     @classmethod
-    def _clear_text_dialogue(cls, text: str) -> str:
-        return cls._remove_dots(cls._remove_html_tags(text))
+    async def process_subtitle_content_async(cls, content: str, movie: DialogueMovie = None) -> List[DialogueEntity]:
+        """Same as process_subtitle_content with the parsing done in the process pool"""
+        return cls.to_dialogue_entities(await ProcessPool.run(cls.parse_content, content), movie)
 
     @classmethod
-    def _identify_all_characters(cls, text: str) -> List[Tuple[str, str]]:
-        dialogues = []
-        lines = text.splitlines()
-        
-        for line in lines:
-            character, dialogue = cls._identify_character(line)
-            
-            if character and dialogue:
-                dialogues.append((character, dialogue))
-            elif dialogues and character == "":
-                last_character, last_dialogue = dialogues[-1]
-                dialogues.append((last_character, dialogue))
-            else:
-                dialogues.append(("", dialogue))
-        return dialogues
+    async def parse_many(cls, contents: List[str]) -> List[List[ParsedScene]]:
+        """Parse several subtitle files in parallel, one pool task per file"""
+        return list(await asyncio.gather(*(ProcessPool.run(cls.parse_content, content) for content in contents)))
 
     @classmethod
-    def _identify_character(cls, text: str) -> Tuple[str, str]:
+    def parse_content(cls, content: Union[str, Iterable[str]]) -> List[ParsedScene]:
         """
-        Identify character name and dialogue from text
-        Returns tuple of (character_name, dialogue_text)
+        Parse subtitle content, or its lines, into scenes with their difficulty.
+        Pure CPU work returning plain tuples, so it can run in a worker process.
         """
-        # Common patterns for character identification
-        patterns = [
-            r'^([A-Z][A-Z\s]+):\s*(.*)',  # JOHN: Hello there
-            r'^([A-Z][a-z]+):\s*(.*)',    # John: Hello there
-            r'\[([^\]]+)\]\s*(.*)',       # [JOHN] Hello there
-            r'\(([^\)]+)\)\s*(.*)',       # (JOHN) Hello there
+        scenes = cls._group_into_scenes(cls._extract_dialogues(content))
+        return [
+            (
+                [(line.character, line.text, line.start_time, line.end_time) for line in scene],
+                scene[-1].end_time - scene[0].start_time,
+                DialogueEntity.calculate_difficulty(scene),
+            )
+            for scene in scenes
         ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, text.strip())
-            if match:
-                character = match.group(1).strip()
-                dialogue = match.group(2).strip()
-                return character, cls._clear_text_dialogue(dialogue)
-        
-        return "", cls._clear_text_dialogue(text.strip())
+
+    @staticmethod
+    def to_dialogue_entities(scenes: List[ParsedScene], movie: DialogueMovie = None) -> List[DialogueEntity]:
+        entities = []
+        for parsed_lines, duration_seconds, difficulty_level in scenes:
+            lines = [DialogueLine(*parsed_line) for parsed_line in parsed_lines]
+            entities.append(DialogueEntity.create(
+                lines=lines,
+                duration_seconds=duration_seconds,
+                difficulty_level=difficulty_level,
+                movie=movie,
+                scene_key=DialogueEntity.build_scene_key(movie.imdb_id, lines) if movie else None
+            ))
+        return entities
+
+    @staticmethod
+    def _extract_dialogues(subtitle_content: Union[str, Iterable[str]]) -> List[DialogueLine]:
+        """Extract dialogues from SRT, WebVTT, ASS/SSA or MicroDVD content with character identification"""
+        return list(merge_consecutive_lines(iter_dialogue_lines(subtitle_content)))
 
     @staticmethod
     def _group_into_scenes(lines: List[DialogueLine], 
@@ -126,62 +96,3 @@ class SubtitlesBussiness:
             scenes.append(current_scene)
         
         return scenes
-
-    @staticmethod
-    def _merge_consecutive_lines(lines: List[DialogueLine]) -> List[DialogueLine]:
-        """Merge consecutive lines from the same character"""
-        if not lines:
-            return lines
-            
-        merged_lines = []
-        current_line = lines[0]
-        
-        for next_line in lines[1:]:
-            # If same character and small time gap (less than 2 seconds)
-            if (current_line.character and current_line.character == next_line.character and
-                next_line.start_time - current_line.end_time < 2.0):
-                current_line.text += " " + next_line.text
-                current_line.end_time = next_line.end_time
-            else:
-                merged_lines.append(current_line)
-                current_line = next_line
-        
-        merged_lines.append(current_line)
-        return merged_lines
-
-    @staticmethod
-    def _parse_timestamp(timestamp: str) -> Tuple[float, float]:
-        """Convert SRT timestamp to seconds"""
-        pattern = r'(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})'
-        match = re.match(pattern, timestamp)
-        if not match:
-            return 0.0, 0.0
-            
-        groups = match.groups()
-        start_time = (
-            int(groups[0]) * 3600 +  # hours
-            int(groups[1]) * 60 +    # minutes
-            int(groups[2]) +         # seconds
-            int(groups[3]) / 1000    # milliseconds
-        )
-        
-        end_time = (
-            int(groups[4]) * 3600 +
-            int(groups[5]) * 60 +
-            int(groups[6]) +
-            int(groups[7]) / 1000
-        )
-        
-        return start_time, end_time
-
-    @staticmethod
-    def _remove_html_tags(text: str) -> str:
-        """Remove HTML tags from the given text."""
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', text)
-
-    @staticmethod
-    def _remove_dots(text: str) -> str:
-        """Remove all dots from the given text."""
-        return text.replace('.', '').replace('-', '')
-
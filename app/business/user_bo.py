@@ -5,11 +5,16 @@ from app.core.users.application.dto.user_dto import UserOut
 from app.core.dialogues.application.dto.dialogue_dto import PracticeResult
 from app.core.users.infra.database.repositories import UserMongoRepository
 from app.core.users.application import UserMapper
+from app.core.common.infra.database.repositories import OutboxMongoRepository
+from app.core.config import settings
+from app.integration.mongo import Mongo
+from app.integration.outbox_relay import OutboxRelay
 
 logger = logging.getLogger(__name__)
 
 class UserBusiness:
     user_repo = UserMongoRepository()
+    outbox_repo = OutboxMongoRepository()
 
     @classmethod
     async def get_user(cls, user_id: str) -> UserOut:
@@ -28,24 +33,53 @@ class UserBusiness:
         practice_result: PracticeResult
     ):
         """Update user's progress, publish user events, and return the user entity"""
-        user_entity = await cls.user_repo.find_by_id(user_id)
+        if not settings.OUTBOX_ENABLED:
+            user_entity = await cls._apply_practice_result(user_id, practice_result)
+            # Publish user domain events (like level up) in the appropriate business context
+            await cls._publish_user_events(user_entity)
+            return user_entity
+
+        user_entity = await Mongo.run_in_transaction(
+            lambda session: cls.record_practice_result(user_id, practice_result, session)
+        )
+        user_entity.mark_events_as_committed()
+        OutboxRelay.notify()
+
+        return user_entity
+
+    @classmethod
+    async def record_practice_result(cls, user_id: str, practice_result: PracticeResult, session=None):
+        """
+        Update the progress and write the user events it raises to the outbox,
+        within the transaction of `session`. The caller marks the events
+        committed once the transaction is.
+        """
+        user_entity = await cls._apply_practice_result(user_id, practice_result, session)
+        await cls.outbox_repo.add(user_entity.get_uncommitted_events(), session=session)
+        return user_entity
+
+    @classmethod
+    async def _apply_practice_result(cls, user_id: str, practice_result: PracticeResult, session=None):
+        user_entity = await cls.user_repo.apply_practice_result(
+            user_id,
+            practice_result.pronunciation_score,
+            practice_result.fluency_score,
+            practice_result.xp_earned,
+            session=session
+        )
         if not user_entity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        
+
+        # The database already holds the new progress, replaying the same result on
+        # the state before the update yields it in memory and raises the level-up events
         user_entity.update_progress(
             practice_result.pronunciation_score,
             practice_result.fluency_score,
             practice_result.xp_earned
         )
-
-        await cls.user_repo.update(user_id, user_entity)
-        
-        # Publish user domain events (like level up) in the appropriate business context
-        await cls._publish_user_events(user_entity)
-        
         return user_entity
     
     @classmethod
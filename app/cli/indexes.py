@@ -0,0 +1,49 @@
+"""
+Report missing and unused MongoDB indexes.
+
+    python -m app.cli.indexes           # report only
+    python -m app.cli.indexes --apply   # create the missing indexes
+
+Index usage comes from $indexStats, counters reset when mongod restarts, so
+an index is only reported as unused for the current server uptime.
+"""
+import argparse
+import asyncio
+import sys
+
+from app.integration import Mongo
+from app.integration.mongo_indexes import ensure_indexes, get_index_report
+
+
+async def run(apply: bool) -> int:
+    Mongo._startup()
+    try:
+        if apply:
+            await ensure_indexes()
+
+        report = await get_index_report()
+    finally:
+        Mongo._shutdown()
+
+    problems = 0
+    for collection_name, result in report.items():
+        print(f"{collection_name}:")
+        for name, ops in sorted(result["usage"].items()):
+            print(f"  {name:<28} {ops:>10} ops")
+        for label in ("missing", "undeclared", "unused"):
+            if result[label]:
+                print(f"  {label}: {', '.join(result[label])}")
+        problems += len(result["missing"])
+
+    return 1 if problems else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="create the missing indexes before reporting")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.apply)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Inspect and replay the events of the outbox.
+
+    python -m app.cli.outbox                     # list the failed events
+    python -m app.cli.outbox --replay            # dispatch every failed event again
+    python -m app.cli.outbox --replay ID [ID...] # dispatch these events again, failed or dispatched
+
+Replayed events go back to pending with their attempts reset, the relay of a
+running app picks them up on its next poll. Handlers deduplicate on the
+event_id, so replaying an event that was already handled is harmless.
+"""
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from app.core.common.infra.database.repositories import OutboxMongoRepository
+from app.integration import Mongo
+
+
+async def run(replay: Optional[List[str]], limit: int) -> int:
+    repo = OutboxMongoRepository()
+    Mongo._startup()
+    try:
+        if replay is not None:
+            count = await repo.replay(replay or None)
+            print(f"{count} events queued for dispatch")
+            return 0
+
+        failed = await repo.find_failed(limit)
+    finally:
+        Mongo._shutdown()
+
+    for doc in failed:
+        print(f"{doc['_id']}  {doc['event_type']:<32} attempts={doc['attempts']}  {doc.get('error') or ''}")
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--replay", nargs="*", metavar="EVENT_ID",
+        help="dispatch the given events again, or every failed event when none is given"
+    )
+    parser.add_argument("--limit", type=int, default=50, help="number of failed events to list")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.replay, args.limit)))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,11 @@ from .logging import start_logging, stop_logging
 from .mongo import start_mongo, stop_mongo
 from .http_client import start_http_client, stop_http_client
 from .audio_processor import start_audio_processor, stop_audio_processor
+from .job_runner import start_job_runner, stop_job_runner
+from .process_pool import start_process_pool, stop_process_pool
+from .google_id_token import start_google_id_token_verifier, stop_google_id_token_verifier
+from .event_bus import start_event_bus, stop_event_bus
+from .outbox_relay import start_outbox_relay, stop_outbox_relay
 
 
 __all__ = (
@@ -13,4 +18,14 @@ __all__ = (
     "stop_http_client",
     "start_audio_processor",
     "stop_audio_processor",
+    "start_job_runner",
+    "stop_job_runner",
+    "start_process_pool",
+    "stop_process_pool",
+    "start_google_id_token_verifier",
+    "stop_google_id_token_verifier",
+    "start_event_bus",
+    "stop_event_bus",
+    "start_outbox_relay",
+    "stop_outbox_relay",
 )
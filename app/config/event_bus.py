@@ -0,0 +1,39 @@
+import logging
+from app.core.config import settings
+from app.core.common.domain.events import EventBus
+from app.core.common.domain.events.event_dispatcher import event_dispatcher
+
+logger = logging.getLogger(__name__)
+
+
+def start_event_bus() -> None:
+    if not settings.EVENT_BUS_ENABLED:
+        return
+
+    if settings.OUTBOX_ENABLED:
+        # The queued event types are written to the outbox, the bus would never see them
+        logger.warning("EVENT_BUS_ENABLED is ignored while OUTBOX_ENABLED is set, the outbox relay handles the events")
+        return
+
+    logger.info(
+        "Starting event bus with %s consumers for %s",
+        settings.EVENT_BUS_CONSUMERS,
+        ", ".join(settings.EVENT_BUS_QUEUED_EVENT_TYPES)
+    )
+    bus = EventBus(
+        event_dispatcher,
+        max_size=settings.EVENT_BUS_MAX_SIZE,
+        consumers=settings.EVENT_BUS_CONSUMERS,
+        overflow_policy=settings.EVENT_BUS_OVERFLOW_POLICY,
+        put_timeout_seconds=settings.EVENT_BUS_PUT_TIMEOUT_SECONDS
+    )
+    bus.start()
+    event_dispatcher.attach_bus(bus, settings.EVENT_BUS_QUEUED_EVENT_TYPES)
+
+async def stop_event_bus() -> None:
+    # Events published from now on are handled inline, then the queue is drained
+    if (bus := event_dispatcher.detach_bus()) is None:
+        return
+
+    logger.info("Stopping event bus, %s queued event(s)", bus.queue.qsize())
+    await bus.stop(settings.EVENT_BUS_DRAIN_TIMEOUT_SECONDS)
@@ -0,0 +1,11 @@
+import logging
+from app.integration.google_id_token import GoogleIdTokenVerifier
+
+logger = logging.getLogger(__name__)
+
+
+def start_google_id_token_verifier() -> None:
+    GoogleIdTokenVerifier._startup()
+
+async def stop_google_id_token_verifier() -> None:
+    await GoogleIdTokenVerifier._shutdown()
@@ -0,0 +1,18 @@
+import logging
+from app.business import MovieBusiness
+from app.core.config import settings
+from app.integration.job_runner import JobRunner
+
+logger = logging.getLogger(__name__)
+
+
+async def start_job_runner() -> None:
+    JobRunner.register(MovieBusiness.PROCESS_MOVIE_DIALOGUES_JOB, MovieBusiness.run_process_movie_dialogues_job)
+
+    if settings.JOB_RUNNER_ENABLED:
+        logger.info("Starting job runner")
+        await JobRunner._startup()
+
+async def stop_job_runner() -> None:
+    logger.info("Stopping job runner")
+    await JobRunner._shutdown()
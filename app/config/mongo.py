@@ -3,6 +3,8 @@ import logging
 from bson import ObjectId
 
 from app.integration import Mongo
+from app.integration.mongo_indexes import ensure_indexes
+from app.core.config import settings
 from app.util import pydantic
 
 logger = logging.getLogger(__name__)
@@ -12,6 +14,15 @@ async def start_mongo() -> None:
     pydantic.register_encoder(ObjectId, str)
     Mongo._startup()
 
+    try:
+        if not await Mongo.detect_transactions():
+            logger.warning("MongoDB has no transactions (standalone server), the outbox is written after the aggregate")
+    except Exception as e:
+        logger.error(f"Could not detect MongoDB transaction support: {str(e)}")
+
+    if settings.MONGO_ENSURE_INDEXES:
+        await ensure_indexes()
+
 
 async def stop_mongo() -> None:
     Mongo._shutdown()
@@ -0,0 +1,17 @@
+import logging
+from app.core.config import settings
+from app.core.common.domain.events.event_dispatcher import event_dispatcher
+from app.core.common.domain.events.event_setup import EVENT_TYPES
+from app.integration.outbox_relay import OutboxRelay
+
+logger = logging.getLogger(__name__)
+
+
+async def start_outbox_relay() -> None:
+    if settings.OUTBOX_ENABLED and settings.OUTBOX_RELAY_ENABLED:
+        logger.info("Starting outbox relay")
+        await OutboxRelay._startup(event_dispatcher, EVENT_TYPES)
+
+async def stop_outbox_relay() -> None:
+    logger.info("Stopping outbox relay")
+    await OutboxRelay._shutdown()
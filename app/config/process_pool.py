@@ -0,0 +1,14 @@
+import logging
+from app.core.config import settings
+from app.integration.process_pool import ProcessPool
+
+logger = logging.getLogger(__name__)
+
+
+def start_process_pool() -> None:
+    logger.info("Starting process pool with %s workers", settings.PROCESS_POOL_MAX_WORKERS)
+    ProcessPool._startup(settings.PROCESS_POOL_MAX_WORKERS)
+
+def stop_process_pool() -> None:
+    logger.info("Stopping process pool")
+    ProcessPool._shutdown()
@@ -1,4 +1,5 @@
 from .auth import GoogleLoginData, DevLoginData
+from .page import Page
 from .base import PyObjectId, ObjectId, BaseModel, Field, EmailStr, Optional, List, MongoObjectId
 
 __all__ = (
@@ -12,4 +13,5 @@ __all__ = (
     "Optional",
     "List",
     "MongoObjectId",
+    "Page",
 )
\ No newline at end of file
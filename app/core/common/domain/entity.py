@@ -1,5 +1,6 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 from app.core.common.domain.value_objects import Uuid
 
 
@@ -8,11 +9,35 @@ class Entity(ABC):
     
     def __init__(self):
         self._uncommitted_events: List['DomainEvent'] = []
+        self._persisted_state: Optional[Dict[str, Any]] = None
 
     @abstractmethod
     def entity_dump(cls) -> dict[str, Any]:
         pass
     
+    def mark_persisted(self, document: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Remember the stored state, changes are tracked from this point.
+        Mappers pass the document the entity was loaded from, it is kept as
+        is, so the entity must not share mutable values with it.
+        """
+        self._persisted_state = document if document is not None else copy.deepcopy(self.entity_dump())
+
+    def get_persisted_state(self) -> Optional[Dict[str, Any]]:
+        return self._persisted_state
+
+    def get_changed_fields(self) -> Dict[str, Any]:
+        """Top-level fields whose value differs from the stored state, all of them for new entities"""
+        current = self.entity_dump()
+        persisted = self.get_persisted_state()
+        if persisted is None:
+            return current
+
+        return {
+            field: value for field, value in current.items()
+            if field not in persisted or persisted[field] != value
+        }
+
     def raise_event(self, event: 'DomainEvent') -> None:
         """Add a domain event to the uncommitted events list"""
         self._uncommitted_events.append(event)
@@ -2,5 +2,7 @@ from .domain_event import DomainEvent
 from .integration_event import IntegrationEvent
 from .event_dispatcher import EventDispatcher
 from .event_handler import EventHandler
+from .event_bus import EventBus
+from .outbox_repo import OutboxRepository
 
-__all__ = ["DomainEvent", "IntegrationEvent", "EventDispatcher", "EventHandler"]
\ No newline at end of file
+__all__ = ["DomainEvent", "IntegrationEvent", "EventDispatcher", "EventHandler", "EventBus", "OutboxRepository"]
\ No newline at end of file
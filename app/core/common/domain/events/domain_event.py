@@ -29,6 +29,17 @@ class DomainEvent(ABC):
             "payload": self.payload
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DomainEvent":
+        """Rebuild an event serialized with to_dict, keeping its event_id"""
+        event = cls.__new__(cls)
+        occurred_at = data["occurred_at"]
+        event.event_id = Uuid(data["event_id"])
+        event.aggregate_id = Uuid(data["aggregate_id"])
+        event.occurred_at = datetime.fromisoformat(occurred_at) if isinstance(occurred_at, str) else occurred_at
+        event.payload = dict(data["payload"])
+        return event
+    
     def __eq__(self, other) -> bool:
         if not isinstance(other, DomainEvent):
             return False
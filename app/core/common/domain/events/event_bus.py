@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, List, Optional
+
+from app.util.metrics import Metrics
+from .domain_event import DomainEvent
+
+if TYPE_CHECKING:
+    from .event_dispatcher import EventDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    """
+    Bounded in-process queue of domain events, handled by background
+    consumer tasks so the publisher does not wait for the handlers.
+
+    When the queue is full the overflow policy decides:
+    - block: wait up to `put_timeout_seconds` for room, then drop the event
+    - drop_newest: drop the event being published
+    - drop_oldest: drop the oldest queued event to make room
+    - inline: dispatch the event in the publisher, nothing is lost but the
+      publisher pays for the handlers again (backpressure)
+
+    Queued events are lost if the process dies, see the outbox for durable events.
+    """
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    INLINE = "inline"
+    OVERFLOW_POLICIES = (BLOCK, DROP_NEWEST, DROP_OLDEST, INLINE)
+
+    def __init__(
+        self,
+        dispatcher: "EventDispatcher",
+        max_size: int,
+        consumers: int,
+        overflow_policy: str = INLINE,
+        put_timeout_seconds: float = 0.1
+    ):
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow_policy}, expected one of {self.OVERFLOW_POLICIES}")
+
+        self.dispatcher = dispatcher
+        self.consumers = consumers
+        self.overflow_policy = overflow_policy
+        self.put_timeout_seconds = put_timeout_seconds
+        self.queue: asyncio.Queue = asyncio.Queue(max_size)
+        self._tasks: List[asyncio.Task] = []
+        self._accepting = False
+
+    def start(self) -> None:
+        self._accepting = True
+        self._tasks = [
+            asyncio.create_task(self._consume(), name=f"event-bus-consumer-{i}")
+            for i in range(self.consumers)
+        ]
+
+    async def stop(self, drain_timeout_seconds: Optional[float] = None) -> None:
+        """Stop accepting events, handle the queued ones for up to `drain_timeout_seconds`, then stop the consumers"""
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self.queue.join(), drain_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.error(f"Event bus drain timed out, {self.queue.qsize()} event(s) dropped")
+            Metrics.incr("events.bus.dropped", self.queue.qsize())
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def put(self, event: DomainEvent) -> None:
+        """Queue an event, applying the overflow policy when the queue is full"""
+        if not self._accepting:
+            # Stopping, the consumers may already be gone
+            await self.dispatcher.dispatch_all([event])
+            return
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if not await self._overflow(event):
+                return
+
+        Metrics.incr("events.bus.enqueued")
+        Metrics.set_gauge("events.bus.queue_size", self.queue.qsize())
+
+    async def _overflow(self, event: DomainEvent) -> bool:
+        """Returns whether the event was queued"""
+        Metrics.incr(f"events.bus.overflow.{self.overflow_policy}")
+
+        if self.overflow_policy == self.INLINE:
+            await self.dispatcher.dispatch_all([event])
+            return False
+
+        if self.overflow_policy == self.BLOCK:
+            try:
+                await asyncio.wait_for(self.queue.put(event), self.put_timeout_seconds)
+                return True
+            except asyncio.TimeoutError:
+                dropped = event
+        elif self.overflow_policy == self.DROP_OLDEST:
+            dropped = self.queue.get_nowait()
+            self.queue.task_done()
+            self.queue.put_nowait(event)
+        else:
+            dropped = event
+
+        Metrics.incr("events.bus.dropped")
+        logger.warning(f"Event bus full, dropped {dropped}")
+        return dropped is not event
+
+    async def _consume(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.dispatcher.dispatch_all([event])
+            except Exception as e:
+                logger.error(f"Error dispatching {event} from the event bus: {str(e)}")
+            finally:
+                self.queue.task_done()
+                Metrics.set_gauge("events.bus.queue_size", self.queue.qsize())
@@ -1,16 +1,41 @@
+import asyncio
 import logging
-from typing import List, Dict, Type
+import time
+from contextlib import nullcontext
+from typing import Iterable, List, Dict, Optional, Set
+from app.util.metrics import Metrics
 from .domain_event import DomainEvent
 from .event_handler import EventHandler
+from .event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
 
 class EventDispatcher:
-    """Simple in-memory event dispatcher for domain events"""
+    """
+    In-memory event dispatcher for domain events.
+
+    In concurrent mode the handlers of the published events run at the same
+    time, except handlers sharing an `ordering_key`, which run one after the
+    other in publish order. Each handler runs under its timeout, its failure
+    or timeout is logged and never reaches the publisher or the other handlers.
+
+    With an attached EventBus, the event types marked as queued are handed
+    to the bus and handled in the background, the others are still handled
+    before publish returns.
+    """
     
-    def __init__(self):
+    def __init__(self, concurrent: bool = True, handler_timeout_seconds: Optional[float] = None):
         self._handlers: Dict[str, List[EventHandler]] = {}
+        self._ordering_locks: Dict[str, asyncio.Lock] = {}
+        self.concurrent = concurrent
+        self.handler_timeout_seconds = handler_timeout_seconds
+        self._bus: Optional[EventBus] = None
+        self._queued_event_types: Set[str] = set()
+
+    def configure(self, concurrent: bool, handler_timeout_seconds: Optional[float]) -> None:
+        self.concurrent = concurrent
+        self.handler_timeout_seconds = handler_timeout_seconds
     
     def register_handler(self, handler: EventHandler) -> None:
         """Register an event handler for a specific event type"""
@@ -32,32 +57,80 @@ class EventDispatcher:
             except ValueError:
                 logger.warning(f"Handler {handler.__class__.__name__} was not registered for event type {event_type}")
     
+    def attach_bus(self, bus: EventBus, queued_event_types: Iterable[str]) -> None:
+        """Hand the events of `queued_event_types` to `bus` instead of handling them in the publisher"""
+        self._bus = bus
+        self._queued_event_types = set(queued_event_types)
+
+    def detach_bus(self) -> Optional[EventBus]:
+        bus, self._bus = self._bus, None
+        self._queued_event_types = set()
+        return bus
+
     async def publish(self, event: DomainEvent) -> None:
         """Publish a single domain event to all registered handlers"""
-        event_type = event.event_type
-        handlers = self._handlers.get(event_type, [])
-        
-        if not handlers:
-            logger.debug(f"No handlers registered for event type {event_type}")
-            return
-        
-        # Log differently for integration events vs domain events
-        event_category = "INTEGRATION" if getattr(event, 'is_integration_event', False) else "DOMAIN"
-        logger.info(f"Publishing {event_category} event {event_type} to {len(handlers)} handler(s)")
-        
-        for handler in handlers:
-            try:
-                await handler.handle(event)
-                logger.debug(f"Handler {handler.__class__.__name__} processed {event_category} event {event_type}")
-            except Exception as e:
-                logger.error(f"Error in handler {handler.__class__.__name__} for {event_category} event {event_type}: {str(e)}")
-                # Integration events may need more sophisticated error handling (retry, DLQ)
-                # Domain events typically fail fast within the same bounded context
+        await self.publish_all([event])
     
     async def publish_all(self, events: List[DomainEvent]) -> None:
         """Publish multiple domain events"""
+        inline = []
+        for event in events:
+            if self._bus is not None and event.event_type in self._queued_event_types:
+                await self._bus.put(event)
+            else:
+                inline.append(event)
+
+        if inline:
+            await self.dispatch_all(inline)
+
+    async def dispatch_all(self, events: List[DomainEvent]) -> bool:
+        """Run the handlers of the events now, whatever their delivery. Returns whether all of them succeeded"""
+        deliveries = []
         for event in events:
-            await self.publish(event)
+            event_type = event.event_type
+            handlers = self._handlers.get(event_type, [])
+
+            if not handlers:
+                logger.debug(f"No handlers registered for event type {event_type}")
+                continue
+
+            # Log differently for integration events vs domain events
+            event_category = "INTEGRATION" if getattr(event, 'is_integration_event', False) else "DOMAIN"
+            logger.info(f"Publishing {event_category} event {event_type} to {len(handlers)} handler(s)")
+            deliveries.extend(self._deliver(handler, event, event_category) for handler in handlers)
+
+        if self.concurrent:
+            # Started in order, handlers with an ordering key queue on its lock in publish order
+            return all(await asyncio.gather(*deliveries))
+
+        results = [await delivery for delivery in deliveries]
+        return all(results)
+
+    async def _deliver(self, handler: EventHandler, event: DomainEvent, event_category: str) -> bool:
+        handler_name = handler.__class__.__name__
+        event_type = event.event_type
+        ordering_key = getattr(handler, "ordering_key", None)
+        timeout = getattr(handler, "timeout_seconds", None)
+        if timeout is None:
+            timeout = self.handler_timeout_seconds
+
+        lock = self._ordering_locks.setdefault(ordering_key, asyncio.Lock()) if ordering_key else nullcontext()
+        async with lock:
+            started_at = time.perf_counter()
+            try:
+                await asyncio.wait_for(handler.handle(event), timeout)
+                logger.debug(f"Handler {handler_name} processed {event_category} event {event_type}")
+                return True
+            except asyncio.TimeoutError:
+                Metrics.incr(f"events.handlers.{handler_name}.timeouts")
+                logger.error(f"Handler {handler_name} timed out after {timeout}s for {event_category} event {event_type}")
+            except Exception as e:
+                Metrics.incr(f"events.handlers.{handler_name}.errors")
+                logger.error(f"Error in handler {handler_name} for {event_category} event {event_type}: {str(e)}")
+                # Events relayed from the outbox are retried, the others are only logged
+            finally:
+                Metrics.observe(f"events.handlers.{handler_name}.seconds", time.perf_counter() - started_at)
+        return False
     
     def get_registered_handlers(self, event_type: str = None) -> Dict[str, List[EventHandler]]:
         """Get all registered handlers, optionally filtered by event type"""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import Optional, TypeVar
 from .domain_event import DomainEvent
 
 # Type variable for specific event types
@@ -8,6 +8,11 @@ EventType = TypeVar('EventType', bound=DomainEvent)
 
 class EventHandler(ABC):
     """Base class for all domain event handlers"""
+
+    # Handlers sharing an ordering key never run concurrently, events reach them in publish order
+    ordering_key: Optional[str] = None
+    # Overrides the timeout of the dispatcher, None keeps it
+    timeout_seconds: Optional[float] = None
     
     @abstractmethod
     async def handle(self, event: EventType) -> None:
@@ -1,15 +1,29 @@
 """Event system setup and configuration"""
 import logging
+from app.core.config import settings
 from app.core.common.domain.events.event_dispatcher import event_dispatcher
 from app.core.users.application.event_handlers.achievement_handler import AchievementHandler
 from app.core.users.application.event_handlers.analytics_handler import AnalyticsHandler
+from app.core.users.domain.events.user_leveled_up_event import UserLeveledUpEvent
+from app.core.dialogues.domain.events.practice_completed_event import PracticeCompletedEvent
 
 logger = logging.getLogger(__name__)
 
+# Events rebuilt from the outbox, by event_type
+EVENT_TYPES = {
+    "user.leveled_up": UserLeveledUpEvent,
+    "dialogue.practice_completed": PracticeCompletedEvent,
+}
+
 
 def setup_event_handlers():
     """Register all event handlers with the global event dispatcher"""
     try:
+        event_dispatcher.configure(
+            concurrent=settings.EVENT_DISPATCH_CONCURRENT,
+            handler_timeout_seconds=settings.EVENT_HANDLER_TIMEOUT_SECONDS
+        )
+
         # Register achievement handler for user level up events
         achievement_handler = AchievementHandler()
         event_dispatcher.register_handler(achievement_handler)
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from .domain_event import DomainEvent
+
+
+class OutboxRepository(ABC):
+    """
+    Durable store of the domain events waiting to be dispatched. Events are
+    written with the aggregate change that raised them and keyed by their
+    event_id, so writing the same event twice stores it once.
+    """
+
+    @abstractmethod
+    async def add(self, events: List[DomainEvent], session: Any = None) -> None:
+        """Store the events, within the transaction of `session` when given"""
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, owner: str, limit: int, lease_seconds: int, max_attempts: int) -> List[Dict[str, Any]]:
+        """
+        Lease up to `limit` due events to `owner`, oldest first. Events of a
+        relay that died are claimed again once their lease expires, as long
+        as they have attempts left, and are failed otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_dispatched(self, event_ids: List[str], owner: str) -> None:
+        pass
+
+    @abstractmethod
+    async def retry(self, event_id: str, owner: str, error: str, retry_at: datetime) -> None:
+        pass
+
+    @abstractmethod
+    async def fail(self, event_id: str, owner: str, error: str) -> None:
+        """Stop dispatching the event, it stays stored for investigation and replay"""
+        pass
+
+    @abstractmethod
+    async def find_failed(self, limit: int) -> List[Dict[str, Any]]:
+        """The most recent failed events, newest first"""
+        pass
+
+    @abstractmethod
+    async def replay(self, event_ids: Optional[List[str]] = None) -> int:
+        """Dispatch failed events, or the given ones, again. Returns how many were queued"""
+        pass
@@ -27,9 +27,26 @@ class Repository(Generic[T], ABC):
         pass
     
     @abstractmethod
-    async def find_with_filters(self, filters: Dict[str, Any], skip: int = 0, limit: int = 20) -> List[T]:
-        """Find entities matching the provided filters"""
+    async def find_with_filters(
+        self,
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> List[T]:
+        """Find entities matching the provided filters, starting after the `after` cursor"""
         pass
+
+    def next_cursor(
+        self,
+        entities: List[T],
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> Optional[str]:
+        """Cursor of the page following `entities`, None when there are no more pages"""
+        return None
     
     @abstractmethod
     async def delete(self, id: str) -> bool:
@@ -0,0 +1,58 @@
+from typing import Any, Dict, Iterable
+from app.core.common.domain.entity import Entity
+
+
+def build_partial_update(entity: Entity, exclude: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Build the smallest update document that brings the stored entity to its
+    current state.
+
+    Nested documents are compared field by field and written with dotted
+    paths, lists that only had items appended become a $push. Entities that
+    were never loaded or saved get a $set of every field.
+    Returns an empty dict when nothing changed.
+    """
+    current = entity.entity_dump()
+    persisted = entity.get_persisted_state()
+    set_doc: Dict[str, Any] = {}
+    push_doc: Dict[str, Any] = {}
+
+    for field in exclude:
+        current.pop(field, None)
+
+    if persisted is None:
+        return {"$set": current} if current else {}
+
+    for field, value in current.items():
+        _diff(field, persisted.get(field, _MISSING), value, set_doc, push_doc)
+
+    update: Dict[str, Any] = {}
+    if set_doc:
+        update["$set"] = set_doc
+    if push_doc:
+        update["$push"] = push_doc
+    return update
+
+
+_MISSING = object()
+
+
+def _are_field_names(doc: Dict[str, Any]) -> bool:
+    """Keys that can be used in a dotted path"""
+    return all(isinstance(key, str) and key and "." not in key and not key.startswith("$") for key in doc)
+
+
+def _diff(path: str, old: Any, new: Any, set_doc: Dict[str, Any], push_doc: Dict[str, Any]) -> None:
+    if old is not _MISSING and old == new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict) and old and set(old) <= set(new) and _are_field_names(new):
+        for key, value in new.items():
+            _diff(f"{path}.{key}", old.get(key, _MISSING), value, set_doc, push_doc)
+        return
+
+    if isinstance(old, list) and isinstance(new, list) and old and len(new) > len(old) and new[:len(old)] == old:
+        push_doc[path] = {"$each": new[len(old):]}
+        return
+
+    set_doc[path] = new
@@ -0,0 +1,5 @@
+from .outbox_mongo_repo import OutboxMongoRepository
+
+__all__ = (
+  "OutboxMongoRepository",
+)
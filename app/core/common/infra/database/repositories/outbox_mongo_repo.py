@@ -0,0 +1,162 @@
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError
+import logging
+
+from app.integration.mongo import Mongo
+from app.core.config import settings
+from app.core.common.domain.events import DomainEvent, OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+# Duplicate _id, the event is already stored
+DUPLICATE_KEY = 11000
+
+
+class OutboxStatus:
+    PENDING = "pending"
+    DISPATCHED = "dispatched"
+    FAILED = "failed"
+
+
+class OutboxMongoRepository(OutboxRepository):
+    """MongoDB implementation of the OutboxRepository, documents are keyed by event_id"""
+    collection_name = "outbox_events"
+    indexes = [
+        # The relay polls for due pending events, oldest first
+        IndexModel([("status", ASCENDING), ("available_at", ASCENDING)], name="status_available_at"),
+        IndexModel([("claim_id", ASCENDING)], name="claim_id"),
+        # Dispatched events are kept for a while to replay them, then removed
+        IndexModel(
+            [("dispatched_at", ASCENDING)],
+            name="dispatched_at_ttl",
+            expireAfterSeconds=settings.OUTBOX_RETENTION_SECONDS
+        ),
+    ]
+
+    async def add(self, events: List[DomainEvent], session: Any = None) -> None:
+        if not events:
+            return
+
+        now = datetime.now(timezone.utc)
+        docs = [self._to_document(event, now) for event in events]
+        try:
+            await Mongo.outbox_events.insert_many(docs, ordered=False, session=session)
+        except BulkWriteError as e:
+            # The same event written again, by a retried request for example
+            if any(error["code"] != DUPLICATE_KEY for error in e.details.get("writeErrors", [])):
+                raise
+
+    async def claim_batch(self, owner: str, limit: int, lease_seconds: int, max_attempts: int) -> List[Dict[str, Any]]:
+        """
+        Mongo has no multi document find-and-modify: the due events are listed,
+        then leased with a claim id that only the events still due get, and
+        read back by that claim id. Concurrent relays never claim the same event.
+        An event whose lease expired on its last attempt is failed instead.
+        """
+        now = datetime.now(timezone.utc)
+        await Mongo.outbox_events.update_many(
+            {
+                "status": OutboxStatus.PENDING,
+                "lease_expires_at": {"$lt": now},
+                "attempts": {"$gte": max_attempts},
+            },
+            {"$set": {
+                "status": OutboxStatus.FAILED,
+                "error": "Lease expired on the last attempt",
+                **self._no_lease(),
+            }}
+        )
+
+        due = {
+            "status": OutboxStatus.PENDING,
+            "available_at": {"$lte": now},
+            "attempts": {"$lt": max_attempts},
+            "$or": [{"lease_expires_at": None}, {"lease_expires_at": {"$lt": now}}],
+        }
+        cursor = Mongo.outbox_events.find(due, {"_id": 1}).sort("available_at", ASCENDING).limit(limit)
+        ids = [doc["_id"] async for doc in cursor]
+        if not ids:
+            return []
+
+        claim_id = ObjectId()
+        await Mongo.outbox_events.update_many(
+            {**due, "_id": {"$in": ids}},
+            {
+                "$set": {
+                    "claim_id": claim_id,
+                    "lease_owner": owner,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                },
+                "$inc": {"attempts": 1},
+            }
+        )
+        cursor = Mongo.outbox_events.find({"claim_id": claim_id}).sort("available_at", ASCENDING)
+        return [doc async for doc in cursor]
+
+    async def mark_dispatched(self, event_ids: List[str], owner: str) -> None:
+        await Mongo.outbox_events.update_many(
+            {"_id": {"$in": event_ids}, "lease_owner": owner},
+            {"$set": {
+                "status": OutboxStatus.DISPATCHED,
+                "dispatched_at": datetime.now(timezone.utc),
+                "error": None,
+                **self._no_lease(),
+            }}
+        )
+
+    async def retry(self, event_id: str, owner: str, error: str, retry_at: datetime) -> None:
+        await Mongo.outbox_events.update_one(
+            {"_id": event_id, "lease_owner": owner},
+            {"$set": {"available_at": retry_at, "error": error, **self._no_lease()}}
+        )
+
+    async def fail(self, event_id: str, owner: str, error: str) -> None:
+        await Mongo.outbox_events.update_one(
+            {"_id": event_id, "lease_owner": owner},
+            {"$set": {"status": OutboxStatus.FAILED, "error": error, **self._no_lease()}}
+        )
+
+    async def find_failed(self, limit: int) -> List[Dict[str, Any]]:
+        cursor = Mongo.outbox_events.find({"status": OutboxStatus.FAILED}).sort("occurred_at", DESCENDING).limit(limit)
+        return [doc async for doc in cursor]
+
+    async def replay(self, event_ids: Optional[List[str]] = None) -> int:
+        query = {"_id": {"$in": event_ids}} if event_ids is not None else {"status": OutboxStatus.FAILED}
+        result = await Mongo.outbox_events.update_many(
+            query,
+            {
+                "$set": {
+                    "status": OutboxStatus.PENDING,
+                    "available_at": datetime.now(timezone.utc),
+                    "attempts": 0,
+                    "error": None,
+                    **self._no_lease(),
+                },
+                "$unset": {"dispatched_at": ""},
+            }
+        )
+        return result.modified_count
+
+    @staticmethod
+    def _to_document(event: DomainEvent, now: datetime) -> Dict[str, Any]:
+        data = event.to_dict()
+        return {
+            "_id": data["event_id"],
+            "event_type": data["event_type"],
+            "aggregate_id": data["aggregate_id"],
+            "occurred_at": event.occurred_at,
+            "payload": data["payload"],
+            "status": OutboxStatus.PENDING,
+            "attempts": 0,
+            "available_at": now,
+            "created_at": now,
+            "error": None,
+            **OutboxMongoRepository._no_lease(),
+        }
+
+    @staticmethod
+    def _no_lease() -> Dict[str, Any]:
+        return {"claim_id": None, "lease_owner": None, "lease_expires_at": None}
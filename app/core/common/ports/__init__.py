@@ -1,8 +1,9 @@
 from .subtitle_movies import SubtitleMovies
-from .audio_processor import AudioProcessor, AudioTranscriptResult
+from .audio_processor import AudioProcessor, AudioTranscriptResult, AudioProcessorBusyError
 
 __all__ = (
   "SubtitleMovies",
   "AudioProcessor",
-  "AudioTranscriptResult"
+  "AudioTranscriptResult",
+  "AudioProcessorBusyError",
 )
\ No newline at end of file
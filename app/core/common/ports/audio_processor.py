@@ -2,20 +2,54 @@ from abc import ABC, abstractmethod
 from pydub import AudioSegment
 import io
 from pydantic import BaseModel
-from typing import Dict
+from typing import AsyncIterator, Dict
+from app.util.webm import get_webm_duration_us
 
 class AudioTranscriptResult(BaseModel):
     transcribed_text: str
     words: list[Dict]
     confidence: float
 
+class AudioProcessorBusyError(Exception):
+    """Raised when the audio processor has no free capacity to take a new request"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Audio processor is saturated, retry after {retry_after}s")
+        self.retry_after = retry_after
+
 class AudioProcessor(ABC):
 
     @abstractmethod
     async def process_audio_transcript(cls, audio_data: bytes) -> AudioTranscriptResult:
         pass
 
+    async def process_audio_stream(cls, chunks: AsyncIterator[bytes]) -> AudioTranscriptResult:
+        """
+        Transcribe audio received as a stream of chunks.
+        Processors without native streaming support buffer the chunks.
+        """
+        audio_data = bytearray()
+        async for chunk in chunks:
+            audio_data += chunk
+        return await cls.process_audio_transcript(bytes(audio_data))
+
+    def config_fingerprint(self) -> str:
+        """
+        Identify the recognition settings, results produced with a different
+        configuration must not be served from a cache
+        """
+        return type(self).__name__
+
+    def shutdown(self) -> None:
+        """Release resources held by the processor"""
+        pass
+
     def _get_audio_duration(self, audio_data: bytes) -> float:
+        # Reading the container header avoids spawning ffmpeg to decode the whole clip
+        duration_us = get_webm_duration_us(audio_data)
+        if duration_us is not None:
+            return duration_us / 1_000_000
+
         audio_segment = AudioSegment.from_file(io.BytesIO(audio_data), format="webm")
         duration = len(audio_segment) / 1000.0  # Convert to seconds
-        return duration
\ No newline at end of file
+        return duration
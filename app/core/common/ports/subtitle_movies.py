@@ -1,9 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import List
-from app.core.movies.application.dto.movie_dto import MovieSearchOut
+from typing import Callable, List, Optional
+from app.core.movies.application.dto.movie_dto import MovieSearchOut, MovieIn
 
 class SubtitleMovies(ABC):
 
     @abstractmethod
     async def search_movies(cls, query: str) -> List[MovieSearchOut]:
         pass
+
+    @abstractmethod
+    async def get_subtitles(
+        cls,
+        imdb_id: str,
+        language: str = "en",
+        on_line: Optional[Callable[[str], None]] = None
+    ) -> MovieIn:
+        """
+        Download the best rated subtitle of a movie. `on_line` receives each
+        line of the content as soon as it is downloaded.
+        """
+        pass
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
+from typing import List, Optional
 
 class Settings(BaseSettings):
     # API Settings
@@ -15,18 +16,114 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URL: str = "mongodb://localhost:27017"
     DATABASE_NAME: str = "english_practice_db"
+    MONGO_ENSURE_INDEXES: bool = True
+
+    # Authenticated users are cached per worker, a change made on another worker is seen after the TTL
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
 
     # Google OAuth
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
+    # ID tokens are verified locally, the signing keys are cached for their max-age
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_JWKS_DEFAULT_MAX_AGE_SECONDS: int = 60 * 60
+    GOOGLE_JWKS_REFRESH_AHEAD_SECONDS: int = 5 * 60
+    GOOGLE_JWKS_MIN_REFRESH_INTERVAL_SECONDS: int = 60
+    GOOGLE_ID_TOKEN_CLOCK_SKEW_SECONDS: int = 5
     
     # OpenSubtitles
     OPENSUBTITLES_API_KEY: str
     OPENSUBTITLES_API_URL: str = "https://api.opensubtitles.com/api/v1"
+    SUBTITLE_DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+    SUBTITLE_DOWNLOAD_MAX_BYTES: int = 5 * 1024 * 1024
+
+    # Outgoing HTTP (shared aiohttp session)
+    HTTP_CLIENT_LIMIT: int = 100
+    HTTP_CLIENT_LIMIT_PER_HOST: int = 20
+    HTTP_CLIENT_DNS_CACHE_SECONDS: int = 5 * 60
+    HTTP_CLIENT_KEEPALIVE_SECONDS: float = 30.0
+    HTTP_CLIENT_TOTAL_TIMEOUT_SECONDS: float = 30.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_READ_TIMEOUT_SECONDS: float = 15.0
+    HTTP_CLIENT_MAX_RETRIES: int = 3
+    HTTP_CLIENT_RETRY_BACKOFF_SECONDS: float = 0.5
+    HTTP_CLIENT_RETRY_BACKOFF_MAX_SECONDS: float = 10.0
 
     # Movie Service
     MOVIE_SERVICE: str = "OpenSubTitles"
 
+    # Movie search cache, expired results are served for STALE_SECONDS more while they are refreshed
+    MOVIE_SEARCH_CACHE_ENABLED: bool = True
+    MOVIE_SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    MOVIE_SEARCH_CACHE_TTL_SECONDS: int = 10 * 60
+    MOVIE_SEARCH_CACHE_STALE_SECONDS: int = 0
+
+    # Audio Processor
+    AUDIO_PROCESSOR: str = "Google"
+    AUDIO_PROCESSOR_MAX_WORKERS: int = 8
+    AUDIO_PROCESSOR_MAX_CONCURRENCY: int = 8
+    AUDIO_PROCESSOR_ACQUIRE_TIMEOUT_SECONDS: float = 5.0
+    AUDIO_PROCESSOR_RETRY_AFTER_SECONDS: int = 5
+
+    # Fake Audio Processor (AUDIO_PROCESSOR=Fake, load tests only)
+    FAKE_AUDIO_PROCESSOR_LATENCY_MEAN_SECONDS: float = 0.0
+    FAKE_AUDIO_PROCESSOR_LATENCY_STDDEV_SECONDS: float = 0.0
+    FAKE_AUDIO_PROCESSOR_LATENCY_DISTRIBUTION: str = "lognormal"
+    FAKE_AUDIO_PROCESSOR_ERROR_RATE: float = 0.0
+    FAKE_AUDIO_PROCESSOR_BUSY_RATE: float = 0.0
+    FAKE_AUDIO_PROCESSOR_SEED: Optional[int] = None
+
+    # Audio Upload
+    AUDIO_UPLOAD_PROBE_BYTES: int = 64 * 1024
+    AUDIO_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    AUDIO_UPLOAD_MAX_DURATION_SECONDS: int = 300
+
+    # Transcription Cache
+    TRANSCRIPTION_CACHE_ENABLED: bool = False
+    TRANSCRIPTION_CACHE_MAX_ENTRIES: int = 1024
+    TRANSCRIPTION_CACHE_TTL_SECONDS: int = 60 * 60
+    TRANSCRIPTION_CACHE_MONGO_ENABLED: bool = False
+    TRANSCRIPTION_CACHE_MONGO_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
+    # Process pool for CPU bound work (subtitle parsing), 0 runs it in the event loop
+    PROCESS_POOL_MAX_WORKERS: int = 2
+
+    # Background Jobs
+    JOB_RUNNER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 2
+    JOB_LEASE_SECONDS: int = 60
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: float = 5.0
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = 5 * 60
+
+    # Domain events, handlers run concurrently unless they share an ordering key
+    EVENT_DISPATCH_CONCURRENT: bool = True
+    EVENT_HANDLER_TIMEOUT_SECONDS: float = 10.0
+
+    # Background event bus, the queued event types are handled after the response.
+    # Only used with OUTBOX_ENABLED=False, the outbox relay handles them otherwise
+    EVENT_BUS_ENABLED: bool = False
+    EVENT_BUS_QUEUED_EVENT_TYPES: List[str] = ["dialogue.practice_completed", "user.leveled_up"]
+    EVENT_BUS_CONSUMERS: int = 2
+    EVENT_BUS_MAX_SIZE: int = 1000
+    # block, drop_newest, drop_oldest or inline
+    EVENT_BUS_OVERFLOW_POLICY: str = "inline"
+    EVENT_BUS_PUT_TIMEOUT_SECONDS: float = 0.1
+    EVENT_BUS_DRAIN_TIMEOUT_SECONDS: float = 10.0
+
+    # Transactional outbox, the events of the practices are stored with the progress and relayed
+    OUTBOX_ENABLED: bool = True
+    OUTBOX_RELAY_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_LEASE_SECONDS: int = 60
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BACKOFF_SECONDS: float = 5.0
+    OUTBOX_RETRY_BACKOFF_MAX_SECONDS: float = 5 * 60
+    OUTBOX_RETENTION_SECONDS: int = 7 * 24 * 60 * 60
+
     model_config = SettingsConfigDict(env_file=os.getenv("ENV_FILE", ".env"))
 
 settings = Settings()
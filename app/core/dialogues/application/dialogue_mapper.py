@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from app.core.dialogues.application.dto.dialogue_dto import DialogueIn, DialogueOut
+from app.core.dialogues.application.dto.dialogue_dto import DialogueIn, DialogueOut, DialogueSummaryOut
 from app.core.dialogues.domain.dialogue_entity import DialogueEntity, DialogueLine, DialogueMovie
 
 class DialogueMapper:
@@ -81,10 +81,22 @@ class DialogueMapper:
                 end_time=line_data["end_time"]
             ))
         
-        return DialogueEntity.create(
+        entity = DialogueEntity.create(
             id=str(doc["_id"]),
             movie=movie,
             difficulty_level=doc["difficulty_level"],
             duration_seconds=doc["duration_seconds"],
-            lines=lines
+            lines=lines,
+            scene_key=doc.get("scene_key")
         )
+        entity.mark_persisted(doc)
+        return entity
+
+    @staticmethod
+    def from_summary_document_to_dto(doc: Dict[str, Any]) -> DialogueSummaryOut:
+        """Convert a document projected with the summary fields directly to the DTO"""
+        doc.pop("score", None)
+        if "characters" in doc:
+            doc["characters"] = sorted(doc["characters"])
+        return DialogueSummaryOut(**doc)
+
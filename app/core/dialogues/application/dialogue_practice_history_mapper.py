@@ -55,7 +55,7 @@ class DialoguePracticeHistoryMapper:
             except Exception as e:
                 completed_at = datetime.now(timezone.utc)
 
-        return DialoguePracticeHistoryEntity.create(
+        entity = DialoguePracticeHistoryEntity.create(
             id=str(doc["_id"]),
             dialogue_id=doc["dialogue_id"],
             user_id=doc["user_id"],
@@ -66,3 +66,5 @@ class DialoguePracticeHistoryMapper:
             character_played=doc.get("character_played", ""),
             xp_earned=doc.get("xp_earned", 0)
         )
+        entity.mark_persisted(doc)
+        return entity
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from app.core.common.application.dto import MongoObjectId
 
@@ -8,6 +8,8 @@ class DialogueLine(BaseModel):
     text: str
     start_time: float
     end_time: float
+    # [start, end) character offsets of the search matches, only set on search results
+    highlights: Optional[List[Tuple[int, int]]] = None
 
 class DialogueMovie(BaseModel): 
     imdb_id: str
@@ -28,6 +30,21 @@ class DialogueOut(DialogueIn):
         arbitrary_types_allowed=True,
     )
 
+class DialogueSummaryOut(BaseModel):
+    """Listing entry without the lines, fields that were not requested stay unset"""
+    id: Optional[MongoObjectId] = Field(alias="_id", default=None)
+    movie: Optional[DialogueMovie] = None
+    difficulty_level: Optional[int] = None
+    duration_seconds: Optional[float] = None
+    line_count: Optional[int] = None
+    preview: Optional[str] = None
+    characters: Optional[List[str]] = None
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+    )
+
 class DialoguePracticeHistoryIn(BaseModel):
     dialogue_id: str
     user_id: str
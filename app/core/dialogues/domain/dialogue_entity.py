@@ -1,3 +1,5 @@
+import hashlib
+import json
 from typing import List, Any, Optional
 from app.core.common.domain.entity import Entity
 from app.core.common.domain.value_objects import Uuid
@@ -29,11 +31,14 @@ class DialogueEntity(Entity):
         duration_seconds: float,
         lines: List[DialogueLine],
         movie: Optional[DialogueMovie] = None,
-        id: Uuid = None
+        id: Uuid = None,
+        scene_key: Optional[str] = None
     ):
+        super().__init__()
         self.id = id
+        self.scene_key = scene_key
         self.movie = movie
-        self.difficulty_level = difficulty_level if difficulty_level is not None else self._calculate_difficulty(lines)
+        self.difficulty_level = difficulty_level if difficulty_level is not None else self.calculate_difficulty(lines)
         self.duration_seconds = duration_seconds
         self.lines = lines
         self._validate()
@@ -43,9 +48,19 @@ class DialogueEntity(Entity):
         lines: List[DialogueLine],
         difficulty_level: Optional[int] = None,
         movie: Optional[DialogueMovie] = None,
-        id: str = None
+        id: str = None,
+        scene_key: Optional[str] = None
     ) -> "DialogueEntity":
-        return DialogueEntity(difficulty_level, duration_seconds, lines, movie, Uuid(id))
+        return DialogueEntity(difficulty_level, duration_seconds, lines, movie, Uuid(id), scene_key)
+
+    @staticmethod
+    def build_scene_key(imdb_id: str, lines: List[DialogueLine]) -> str:
+        """Identity of a scene extracted from a movie subtitle, the same lines always give the same key"""
+        content = json.dumps(
+            [imdb_id, [[line.character, line.text, line.start_time, line.end_time] for line in lines]],
+            ensure_ascii=False
+        )
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
     
     def _validate(self) -> None:
         self._validate_difficulty_level()
@@ -64,7 +79,7 @@ class DialogueEntity(Entity):
             raise ValueError("Duration doesn't match the dialogue lines timing")
             
     @classmethod
-    def _calculate_difficulty(cls, dialogue_lines: List[DialogueLine]) -> int:
+    def calculate_difficulty(cls, dialogue_lines: List[DialogueLine]) -> int:
         """
         Calculate difficulty level (1-5) based on:
         - Vocabulary complexity
@@ -125,7 +140,7 @@ class DialogueEntity(Entity):
 
     def entity_dump(self) -> dict[str, Any]:
         """Convert entity to dictionary for persistence"""
-        return {
+        doc = {
             "movie": {
                 "imdb_id": self.movie.imdb_id,
                 "title": self.movie.title,
@@ -141,4 +156,7 @@ class DialogueEntity(Entity):
                     "end_time": line.end_time
                 } for line in self.lines
             ]
-        }
\ No newline at end of file
+        }
+        if self.scene_key:
+            doc["scene_key"] = self.scene_key
+        return doc
\ No newline at end of file
@@ -16,6 +16,7 @@ class DialoguePracticeHistoryEntity(Entity):
         xp_earned: XpPoints = XpPoints(0),
         id: Uuid = None
     ):
+        super().__init__()
         self.id = id
         self.dialogue_id = dialogue_id
         self.user_id = user_id
@@ -1,15 +1,55 @@
 from typing import List, Dict, Any, Optional
+import re
 from bson import ObjectId
+from pymongo import ASCENDING, TEXT, DeleteMany, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 import logging
 
 from app.integration.mongo import Mongo
+from app.core.common.infra.database.partial_update import build_partial_update
 from app.core.dialogues.domain import DialogueEntity, DialogueRepository
 from app.core.dialogues.application import DialogueMapper
+from app.util.text_search import to_mongo_text_search
+from app.util.cursor import InvalidCursorError, decode_cursor, encode_cursor, with_keyset
 
 logger = logging.getLogger(__name__)
 
 class DialogueMongoRepository(DialogueRepository):
     """MongoDB implementation of the DialogueRepository"""
+    collection_name = "dialogues"
+    indexes = [
+        IndexModel([("movie.imdb_id", ASCENDING)], name="movie_imdb_id"),
+        # Scenes extracted from a movie subtitle, older dialogues have no key
+        IndexModel(
+            [("scene_key", ASCENDING)],
+            name="scene_key_unique",
+            unique=True,
+            partialFilterExpression={"scene_key": {"$type": "string"}}
+        ),
+        IndexModel(
+            [("movie.title", TEXT), ("lines.text", TEXT)],
+            name="dialogue_text",
+            weights={"movie.title": 3, "lines.text": 1},
+            default_language="english",
+            # movie.language holds subtitle codes the text index may not support,
+            # point the per-document language override to a field that is never set
+            language_override="text_search_language"
+        ),
+    ]
+    # Listing order outside of the text search, ranked results are paged by offset
+    sort = [("_id", ASCENDING)]
+    # Summary fields computed by the server from the lines array
+    SUMMARY_PROJECTION = {
+        "movie": 1,
+        "difficulty_level": 1,
+        "duration_seconds": 1,
+        "line_count": {"$size": {"$ifNull": ["$lines", []]}},
+        "preview": {"$ifNull": [{"$arrayElemAt": ["$lines.text", 0]}, ""]},
+        "characters": {"$setDifference": [{"$setUnion": [{"$ifNull": ["$lines.character", []]}]}, ["", None]]},
+    }
+    # Mongo error codes
+    INDEX_NOT_FOUND = 27
+    DUPLICATE_KEY = 11000
     
     async def create(self, entity: DialogueEntity) -> DialogueEntity:
         """Create a new dialogue document"""
@@ -17,6 +57,7 @@ class DialogueMongoRepository(DialogueRepository):
         result = await Mongo.dialogues.insert_one(doc)
 
         entity.id = str(result.inserted_id)
+        entity.mark_persisted()
         return entity
     
     async def create_many(self, entities: List[DialogueEntity]) -> List[DialogueEntity]:
@@ -30,18 +71,51 @@ class DialogueMongoRepository(DialogueRepository):
         for i, entity in enumerate(entities):
             if i < len(result.inserted_ids):
                 entity.id = str(result.inserted_ids[i])
+                entity.mark_persisted()
                 
         return entities
     
+    async def replace_movie_dialogues(self, imdb_id: str, entities: List[DialogueEntity]) -> int:
+        """
+        Make the movie dialogues match the given scenes in one bulk write.
+        Scenes are upserted by scene_key: a stored scene keeps its document
+        (and the practice history pointing to it) and gets the fields derived
+        by the current parser, such as difficulty_level, and the ones that are
+        gone, including dialogues stored before scene keys, are deleted.
+        The write is one transaction on a replica set, on a standalone server
+        readers may briefly see the new scenes next to the ones being deleted.
+        Returns the number of dialogues of the movie.
+        """
+        scenes = {entity.scene_key: entity for entity in entities}
+        operations = [
+            UpdateOne({"scene_key": scene_key}, {"$set": entity.entity_dump()}, upsert=True)
+            for scene_key, entity in scenes.items()
+        ]
+        operations.append(DeleteMany({"movie.imdb_id": imdb_id, "scene_key": {"$nin": list(scenes)}}))
+
+        async def write(session) -> None:
+            await Mongo.dialogues.bulk_write(operations, ordered=False, session=session)
+
+        try:
+            await Mongo.run_in_transaction(write)
+        except BulkWriteError as e:
+            if any(error["code"] != self.DUPLICATE_KEY for error in e.details.get("writeErrors", [])):
+                raise
+            # A concurrent run inserted the same scene first, the upserts now update it
+            await Mongo.run_in_transaction(write)
+
+        return len(scenes)
+
     async def update(self, id: str, entity: DialogueEntity) -> DialogueEntity:
         """Update an existing dialogue document"""
-        doc = entity.entity_dump()
+        update = build_partial_update(entity)
+        if update:
+            await Mongo.dialogues.update_one(
+                {"_id": ObjectId(id)},
+                update
+            )
 
-        await Mongo.dialogues.update_one(
-            {"_id": ObjectId(id)},
-            {"$set": doc}
-        )
-        
+        entity.mark_persisted()
         return entity
     
     async def find_by_id(self, id: str) -> Optional[DialogueEntity]:
@@ -54,24 +128,109 @@ class DialogueMongoRepository(DialogueRepository):
         self, 
         filters: Dict[str, Any], 
         skip: int = 0, 
-        limit: int = 20
+        limit: int = 20,
+        after: Optional[str] = None
     ) -> List[DialogueEntity]:
-        """Find dialogues matching the provided filters"""
+        """
+        Find dialogues matching the provided filters.
+        `search` uses the text index, ranked by relevance (search_mode="text"),
+        or a case-insensitive substring match (search_mode="regex").
+        Unranked listings are in _id order.
+        """
+        docs = await self._find_documents(filters, skip, limit, after)
+        return [DialogueMapper.from_document_to_entity(doc) for doc in docs]
+
+    async def find_summaries_with_filters(
+        self,
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Same listing as find_with_filters, projected to the summary fields
+        (all of them when `fields` is empty) so the lines never leave the server
+        """
+        projection = {
+            field: expression for field, expression in self.SUMMARY_PROJECTION.items()
+            if not fields or field in fields
+        }
+        return await self._find_documents(filters, skip, limit, after, projection)
+
+    async def _find_documents(
+        self,
+        filters: Dict[str, Any],
+        skip: int,
+        limit: int,
+        after: Optional[str],
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         query = {}
-        
-        if "search" in filters and filters["search"]:
-            search = filters["search"]
-            query["$or"] = [
-                {"movie.title": {"$regex": search, "$options": "i"}},
-                {"lines.text": {"$regex": search, "$options": "i"}},
-            ]
-        
+        keyset = None
+
+        if after:
+            cursor_data = decode_cursor(after)
+            if self._is_ranked(filters) != ("o" in cursor_data):
+                raise InvalidCursorError("Cursor does not match the listing order")
+            skip += cursor_data.get("o", 0)
+            keyset = cursor_data.get("k")
+
         if "imdb_id" in filters and filters["imdb_id"]:
             query["movie.imdb_id"] = filters["imdb_id"]
 
-        cursor = Mongo.dialogues.find(query).skip(skip).limit(limit)
+        search = filters.get("search")
+        if self._is_ranked(filters):
+            text_search = to_mongo_text_search(search)
+            if not text_search:
+                return []
+
+            try:
+                cursor = Mongo.dialogues.find(
+                    {**query, "$text": {"$search": text_search}},
+                    {**(projection or {}), "score": {"$meta": "textScore"}}
+                ).sort([("score", {"$meta": "textScore"})]).skip(skip).limit(limit)
+                return [doc async for doc in cursor]
+            except OperationFailure as e:
+                if e.code != self.INDEX_NOT_FOUND:
+                    raise
+                logger.warning("Dialogue text index not found, falling back to regex search")
+
+        if search:
+            pattern = re.escape(search)
+            query["$or"] = [
+                {"movie.title": {"$regex": pattern, "$options": "i"}},
+                {"lines.text": {"$regex": pattern, "$options": "i"}},
+            ]
+
+        if keyset:
+            query = with_keyset(query, self.sort, keyset)
+
+        cursor = Mongo.dialogues.find(query, projection).sort(self.sort).skip(skip).limit(limit)
+
+        return [doc async for doc in cursor]
+
+    def next_cursor(
+        self,
+        entities: List[DialogueEntity],
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> Optional[str]:
+        """Cursor after the last dialogue (entity or summary) of a full page"""
+        if not entities or len(entities) < limit:
+            return None
+
+        if self._is_ranked(filters):
+            offset = decode_cursor(after).get("o", 0) if after else 0
+            return encode_cursor(offset=offset + skip + len(entities))
+
+        return encode_cursor([ObjectId(str(entities[-1].id))])
 
-        return [DialogueMapper.from_document_to_entity(doc) async for doc in cursor]
+    @staticmethod
+    def _is_ranked(filters: Dict[str, Any]) -> bool:
+        return bool(filters.get("search")) and filters.get("search_mode", "text") == "text"
     
     async def delete(self, id: str) -> bool:
         """Delete a dialogue by its ID"""
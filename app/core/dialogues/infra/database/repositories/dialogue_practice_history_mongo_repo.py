@@ -1,23 +1,40 @@
 from typing import List, Dict, Any, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
 import logging
 
 from app.integration.mongo import Mongo
+from app.core.common.infra.database.partial_update import build_partial_update
 from app.core.dialogues.domain import DialoguePracticeHistoryEntity, DialoguePracticeHistoryRepository
 from app.core.dialogues.application import DialogueMapper, DialoguePracticeHistoryMapper
+from app.util.cursor import decode_cursor, encode_cursor, with_keyset
 
 logger = logging.getLogger(__name__)
 
 class DialoguePracticeHistoryMongoRepository(DialoguePracticeHistoryRepository):
     """MongoDB implementation of the DialoguePracticeHistoryRepository"""
+    collection_name = "dialogue_practice_history"
+    indexes = [
+        # Practice history is always listed per user, newest or best first,
+        # _id breaks ties so cursors can resume from the exact position
+        IndexModel(
+            [("user_id", ASCENDING), ("completed_at", DESCENDING), ("_id", DESCENDING)],
+            name="user_id_completed_at_id"
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("xp_earned", DESCENDING), ("_id", DESCENDING)],
+            name="user_id_xp_earned_id"
+        ),
+    ]
     
-    async def create(self, entity: DialoguePracticeHistoryEntity) -> DialoguePracticeHistoryEntity:
-        """Create a new practice history document"""
+    async def create(self, entity: DialoguePracticeHistoryEntity, session: Any = None) -> DialoguePracticeHistoryEntity:
+        """Create a new practice history document, within the transaction of `session` when given"""
         doc = entity.entity_dump()
         
-        result = await Mongo.dialogue_practice_history.insert_one(doc)
+        result = await Mongo.dialogue_practice_history.insert_one(doc, session=session)
         
         entity.id = str(result.inserted_id)
+        entity.mark_persisted()
         return entity
     
     async def create_many(self, entities: List[DialoguePracticeHistoryEntity]) -> List[DialoguePracticeHistoryEntity]:
@@ -32,18 +49,20 @@ class DialoguePracticeHistoryMongoRepository(DialoguePracticeHistoryRepository):
         for i, entity in enumerate(entities):
             if i < len(result.inserted_ids):
                 entity.id = str(result.inserted_ids[i])
+                entity.mark_persisted()
                 
         return entities
     
     async def update(self, id: str, entity: DialoguePracticeHistoryEntity) -> DialoguePracticeHistoryEntity:
         """Update an existing practice history document"""
-        doc = entity.entity_dump()
-            
-        await Mongo.dialogue_practice_history.update_one(
-            {"_id": ObjectId(id)},
-            {"$set": doc}
-        )
-        
+        update = build_partial_update(entity)
+        if update:
+            await Mongo.dialogue_practice_history.update_one(
+                {"_id": ObjectId(id)},
+                update
+            )
+
+        entity.mark_persisted()
         return entity
     
     async def find_by_id(self, id: str) -> Optional[DialoguePracticeHistoryEntity]:
@@ -61,9 +80,10 @@ class DialoguePracticeHistoryMongoRepository(DialoguePracticeHistoryRepository):
         filters: Dict[str, Any], 
         skip: int = 0, 
         limit: int = 20,
-        include_dialogue: bool = False
+        include_dialogue: bool = False,
+        after: Optional[str] = None
     ) -> List[DialoguePracticeHistoryEntity]:
-        """Find practice histories matching the provided filters"""
+        """Find practice histories matching the provided filters, ordered by `sort_field` and _id"""
         query = {}
         
         if "user_id" in filters and filters["user_id"]:
@@ -72,13 +92,14 @@ class DialoguePracticeHistoryMongoRepository(DialoguePracticeHistoryRepository):
         if "dialogue_id" in filters and filters["dialogue_id"]:
             query["dialogue_id"] = filters["dialogue_id"]
             
-        sort_field = filters.get("sort_field", "completed_at")
-        sort_direction = -1 if filters.get("sort_desc", True) else 1
+        sort = self._sort_of(filters)
+        if after:
+            query = with_keyset(query, sort, decode_cursor(after).get("k", []))
 
         if include_dialogue:
-            return await self._find_with_dialogues(query, sort_field, sort_direction, skip, limit)
+            return await self._find_with_dialogues(query, sort, skip, limit)
         else:
-            cursor = Mongo.dialogue_practice_history.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
+            cursor = Mongo.dialogue_practice_history.find(query).sort(sort).skip(skip).limit(limit)
             docs = []
             async for doc in cursor:
                 docs.append(doc)
@@ -86,17 +107,39 @@ class DialoguePracticeHistoryMongoRepository(DialoguePracticeHistoryRepository):
             return [DialoguePracticeHistoryMapper.from_document_to_entity(doc) for doc in docs]
                 
     
+    def next_cursor(
+        self,
+        entities: List[DialoguePracticeHistoryEntity],
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> Optional[str]:
+        """Cursor after the last practice history of a full page"""
+        if not entities or len(entities) < limit:
+            return None
+
+        last = entities[-1]
+        sort_field, _ = self._sort_of(filters)[0]
+        return encode_cursor([last.entity_dump()[sort_field], ObjectId(str(last.id))])
+
+    @staticmethod
+    def _sort_of(filters: Dict[str, Any]) -> List[tuple]:
+        sort_field = filters.get("sort_field", "completed_at")
+        sort_direction = DESCENDING if filters.get("sort_desc", True) else ASCENDING
+        return [(sort_field, sort_direction), ("_id", sort_direction)]
+    
     async def delete(self, id: str) -> bool:
         """Delete a practice history by its ID"""
         result = await Mongo.dialogue_practice_history.delete_one({"_id": ObjectId(id)})
         return result.deleted_count > 0
     
-    async def _find_with_dialogues(self, query: Dict, sort_field: str, sort_direction: int, skip: int, limit: int) -> List[DialoguePracticeHistoryEntity]:
+    async def _find_with_dialogues(self, query: Dict, sort: List[tuple], skip: int, limit: int) -> List[DialoguePracticeHistoryEntity]:
         """Find practice histories with their associated dialogues"""
         
         pipeline = [
             {"$match": query},
-            {"$sort": {sort_field: sort_direction}},
+            {"$sort": dict(sort)},
             {"$skip": skip},
             {"$limit": limit},
             {
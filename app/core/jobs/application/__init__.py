@@ -0,0 +1,5 @@
+from .job_mapper import JobMapper
+
+__all__ = (
+  "JobMapper",
+)
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Any, Dict, Optional
+from datetime import datetime
+from app.core.common.application.dto import MongoObjectId
+
+class JobOut(BaseModel):
+    id: Optional[MongoObjectId] = Field(alias="_id", default=None)
+    type: str
+    status: str
+    attempts: int
+    max_attempts: int
+    progress: Dict[str, Any] = {}
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    run_at: datetime
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+    )
@@ -0,0 +1,38 @@
+import copy
+from typing import Dict, Any
+from app.core.jobs.application.dto.job_dto import JobOut
+from app.core.jobs.domain import JobEntity
+
+class JobMapper:
+    @staticmethod
+    def to_dto(entity: JobEntity) -> JobOut:
+        """Convert entity to DTO"""
+        job_dict = entity.entity_dump()
+        if entity.id:
+            job_dict["_id"] = str(entity.id)
+
+        return JobOut(**job_dict)
+
+    @staticmethod
+    def from_document_to_entity(doc: Dict[str, Any]) -> JobEntity:
+        """Convert MongoDB document directly to entity"""
+        # The document becomes the stored state, the entity gets its own copy of the nested values
+        entity = JobEntity.create(
+            id=str(doc["_id"]),
+            type=doc["type"],
+            payload=copy.deepcopy(doc.get("payload", {})),
+            key=doc.get("key"),
+            status=doc["status"],
+            attempts=doc.get("attempts", 0),
+            max_attempts=doc["max_attempts"],
+            run_at=doc["run_at"],
+            created_at=doc["created_at"],
+            updated_at=doc["updated_at"],
+            lease_owner=doc.get("lease_owner"),
+            lease_expires_at=doc.get("lease_expires_at"),
+            progress=copy.deepcopy(doc.get("progress")),
+            result=copy.deepcopy(doc.get("result")),
+            error=doc.get("error")
+        )
+        entity.mark_persisted(doc)
+        return entity
@@ -0,0 +1,8 @@
+from .job_entity import JobEntity, JobStatus
+from .job_repo import JobRepository
+
+__all__ = (
+    "JobEntity",
+    "JobStatus",
+    "JobRepository",
+)
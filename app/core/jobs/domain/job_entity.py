@@ -0,0 +1,113 @@
+from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from app.core.common.domain.entity import Entity
+from app.core.common.domain.value_objects import Uuid
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    ACTIVE = (PENDING, RUNNING)
+
+class JobEntity(Entity):
+    def __init__(
+        self,
+        type: str,
+        payload: Dict[str, Any],
+        key: Optional[str],
+        status: str,
+        attempts: int,
+        max_attempts: int,
+        run_at: datetime,
+        created_at: datetime,
+        updated_at: datetime,
+        lease_owner: Optional[str] = None,
+        lease_expires_at: Optional[datetime] = None,
+        progress: Optional[Dict[str, Any]] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        id: Uuid = None
+    ):
+        super().__init__()
+        self.id = id
+        self.type = type
+        self.payload = payload
+        self.key = key
+        self.status = status
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.run_at = run_at
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.lease_owner = lease_owner
+        self.lease_expires_at = lease_expires_at
+        self.progress = progress or {}
+        self.result = result
+        self.error = error
+        self._validate()
+
+    def create(
+        type: str,
+        payload: Dict[str, Any],
+        max_attempts: int,
+        key: Optional[str] = None,
+        status: str = JobStatus.PENDING,
+        attempts: int = 0,
+        run_at: Optional[datetime] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        lease_owner: Optional[str] = None,
+        lease_expires_at: Optional[datetime] = None,
+        progress: Optional[Dict[str, Any]] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        id: str = None
+    ) -> "JobEntity":
+        now = datetime.now(timezone.utc)
+        return JobEntity(
+            type=type,
+            payload=payload,
+            key=key,
+            status=status,
+            attempts=attempts,
+            max_attempts=max_attempts,
+            run_at=run_at or now,
+            created_at=created_at or now,
+            updated_at=updated_at or now,
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+            progress=progress,
+            result=result,
+            error=error,
+            id=Uuid(id)
+        )
+
+    def can_retry(self) -> bool:
+        return self.attempts < self.max_attempts
+
+    def _validate(self) -> None:
+        if not self.type:
+            raise ValueError("Job type must be provided")
+        if self.max_attempts < 1:
+            raise ValueError("A job must allow at least one attempt")
+
+    def entity_dump(self) -> Dict[str, Any]:
+        """Convert entity to dictionary for persistence"""
+        return {
+            "type": self.type,
+            "payload": self.payload,
+            "key": self.key,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_at": self.run_at,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "lease_owner": self.lease_owner,
+            "lease_expires_at": self.lease_expires_at,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error
+        }
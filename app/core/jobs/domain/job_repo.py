@@ -0,0 +1,47 @@
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime
+from app.core.common.domain.repository import Repository
+from app.core.jobs.domain import JobEntity
+
+class JobRepository(Repository[JobEntity]):
+
+    async def find_active_by_key(self, key: str) -> Optional[JobEntity]:
+        """Pending or running job with the given deduplication key"""
+        pass
+
+    async def create_or_find_active(self, entity: JobEntity) -> Tuple[JobEntity, bool]:
+        """
+        Atomically create the job unless a pending or running job has the same
+        key, that job is returned instead. The bool tells whether the job was created.
+        """
+        pass
+
+    async def claim_next(self, owner: str, lease_seconds: int) -> Optional[JobEntity]:
+        """
+        Atomically take the next due job, pending or with an expired lease,
+        and lease it to `owner`. Counts as an attempt. A job whose lease
+        expired on its last attempt is failed instead.
+        """
+        pass
+
+    async def renew_lease(self, id: str, owner: str, lease_seconds: int) -> bool:
+        """Extend the lease, False when `owner` lost it"""
+        pass
+
+    async def update_progress(self, id: str, owner: str, progress: Dict[str, Any], lease_seconds: int) -> bool:
+        """Merge `progress` into the job progress, renewing the lease"""
+        pass
+
+    async def complete(self, id: str, owner: str, result: Dict[str, Any]) -> bool:
+        pass
+
+    async def retry(self, id: str, owner: str, error: str, run_at: datetime) -> bool:
+        """Release the job back to pending, due at `run_at`"""
+        pass
+
+    async def fail(self, id: str, owner: str, error: str) -> bool:
+        pass
+
+    async def release(self, id: str, owner: str) -> bool:
+        """Give the job back without counting the attempt, used on shutdown"""
+        pass
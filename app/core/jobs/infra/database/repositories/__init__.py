@@ -0,0 +1,5 @@
+from .job_mongo_repo import JobMongoRepository
+
+__all__ = (
+  "JobMongoRepository",
+)
@@ -0,0 +1,218 @@
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+import logging
+
+from app.integration.mongo import Mongo
+from app.core.common.infra.database.partial_update import build_partial_update
+from app.core.jobs.domain import JobEntity, JobRepository, JobStatus
+from app.core.jobs.application import JobMapper
+
+logger = logging.getLogger(__name__)
+
+class JobMongoRepository(JobRepository):
+    """MongoDB implementation of the JobRepository"""
+    collection_name = "jobs"
+    indexes = [
+        # Workers poll for due pending jobs and expired leases
+        IndexModel([("status", ASCENDING), ("run_at", ASCENDING)], name="status_run_at"),
+        IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)], name="status_lease_expires_at"),
+        IndexModel([("key", ASCENDING), ("status", ASCENDING)], name="key_status"),
+        # active_key holds the key while the job is pending or running, one active job per key
+        IndexModel(
+            [("active_key", ASCENDING)],
+            name="active_key_unique",
+            unique=True,
+            partialFilterExpression={"active_key": {"$type": "string"}}
+        ),
+    ]
+
+    async def create(self, entity: JobEntity) -> JobEntity:
+        """Create a new job document"""
+        doc = entity.entity_dump()
+        result = await Mongo.jobs.insert_one(doc)
+
+        entity.id = str(result.inserted_id)
+        entity.mark_persisted()
+        return entity
+
+    async def create_or_find_active(self, entity: JobEntity) -> Tuple[JobEntity, bool]:
+        """
+        Create the job unless a pending or running job has the same key, that
+        job is returned instead. The unique active_key index keeps concurrent
+        calls from creating two. The bool tells whether the job was created.
+        """
+        doc = {**entity.entity_dump(), "active_key": entity.key}
+
+        for attempt in range(2):
+            try:
+                result = await Mongo.jobs.insert_one(doc)
+                break
+            except DuplicateKeyError:
+                if (active := await self.find_active_by_key(entity.key)) is not None:
+                    return active, False
+                # The active job finished in between, the retry creates this one
+                if attempt:
+                    raise
+
+        entity.id = str(result.inserted_id)
+        entity.mark_persisted()
+        return entity, True
+
+    async def create_many(self, entities: List[JobEntity]) -> List[JobEntity]:
+        """Create multiple job documents"""
+        if not entities:
+            return []
+
+        docs = [entity.entity_dump() for entity in entities]
+        result = await Mongo.jobs.insert_many(docs)
+
+        for i, entity in enumerate(entities):
+            if i < len(result.inserted_ids):
+                entity.id = str(result.inserted_ids[i])
+                entity.mark_persisted()
+
+        return entities
+
+    async def update(self, id: str, entity: JobEntity) -> JobEntity:
+        """Update an existing job document"""
+        update = build_partial_update(entity)
+        if update:
+            await Mongo.jobs.update_one(
+                {"_id": ObjectId(id)},
+                update
+            )
+
+        entity.mark_persisted()
+        return entity
+
+    async def find_by_id(self, id: str) -> Optional[JobEntity]:
+        """Find a job by its ID"""
+        if not ObjectId.is_valid(id):
+            return None
+        doc = await Mongo.jobs.find_one({"_id": ObjectId(id)})
+        return JobMapper.from_document_to_entity(doc) if doc else None
+
+    async def find_active_by_key(self, key: str) -> Optional[JobEntity]:
+        """Pending or running job with the given deduplication key"""
+        doc = await Mongo.jobs.find_one({"key": key, "status": {"$in": list(JobStatus.ACTIVE)}})
+        return JobMapper.from_document_to_entity(doc) if doc else None
+
+    async def find_with_filters(
+        self,
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> List[JobEntity]:
+        """Find jobs matching the provided filters, oldest first"""
+        query = {key: value for key, value in filters.items() if value is not None}
+        cursor = Mongo.jobs.find(query).sort("created_at", ASCENDING).skip(skip).limit(limit)
+
+        return [JobMapper.from_document_to_entity(doc) async for doc in cursor]
+
+    async def claim_next(self, owner: str, lease_seconds: int) -> Optional[JobEntity]:
+        """
+        Atomically take the next due job and lease it to `owner`. Running jobs
+        whose lease expired belong to a worker that died, they are taken again
+        while they have attempts left and failed otherwise.
+        """
+        now = datetime.now(timezone.utc)
+        expired = {"status": JobStatus.RUNNING, "lease_expires_at": {"$lt": now}}
+        await Mongo.jobs.update_many(
+            {**expired, "$expr": {"$gte": ["$attempts", "$max_attempts"]}},
+            {
+                "$set": {
+                    "status": JobStatus.FAILED,
+                    "error": "Lease expired on the last attempt",
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": now,
+                },
+                "$unset": {"active_key": ""},
+            }
+        )
+
+        doc = await Mongo.jobs.find_one_and_update(
+            {"$or": [
+                {"status": JobStatus.PENDING, "run_at": {"$lte": now}},
+                {**expired, "$expr": {"$lt": ["$attempts", "$max_attempts"]}},
+            ]},
+            {
+                "$set": {
+                    "status": JobStatus.RUNNING,
+                    "lease_owner": owner,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+        return JobMapper.from_document_to_entity(doc) if doc else None
+
+    async def renew_lease(self, id: str, owner: str, lease_seconds: int) -> bool:
+        """Extend the lease, False when `owner` lost it"""
+        return await self._update_leased(id, owner, {"$set": self._lease(lease_seconds)})
+
+    async def update_progress(self, id: str, owner: str, progress: Dict[str, Any], lease_seconds: int) -> bool:
+        """Merge `progress` into the job progress, renewing the lease"""
+        return await self._update_leased(id, owner, {"$set": {
+            **{f"progress.{key}": value for key, value in progress.items()},
+            **self._lease(lease_seconds),
+        }})
+
+    async def complete(self, id: str, owner: str, result: Dict[str, Any]) -> bool:
+        return await self._finish(id, owner, {"status": JobStatus.SUCCEEDED, "result": result, "error": None}, done=True)
+
+    async def retry(self, id: str, owner: str, error: str, run_at: datetime) -> bool:
+        """Release the job back to pending, due at `run_at`"""
+        return await self._finish(id, owner, {"status": JobStatus.PENDING, "run_at": run_at, "error": error})
+
+    async def fail(self, id: str, owner: str, error: str) -> bool:
+        return await self._finish(id, owner, {"status": JobStatus.FAILED, "error": error}, done=True)
+
+    async def release(self, id: str, owner: str) -> bool:
+        """Give the job back without counting the attempt, used on shutdown"""
+        return await self._update_leased(id, owner, {
+            "$set": {
+                "status": JobStatus.PENDING,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "updated_at": datetime.now(timezone.utc),
+            },
+            "$inc": {"attempts": -1},
+        })
+
+    async def delete(self, id: str) -> bool:
+        """Delete a job by its ID"""
+        result = await Mongo.jobs.delete_one({"_id": ObjectId(id)})
+        return result.deleted_count > 0
+
+    async def _finish(self, id: str, owner: str, fields: Dict[str, Any], done: bool = False) -> bool:
+        update = {"$set": {
+            **fields,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "updated_at": datetime.now(timezone.utc),
+        }}
+        if done:
+            # A job with the same key can be enqueued again
+            update["$unset"] = {"active_key": ""}
+        return await self._update_leased(id, owner, update)
+
+    async def _update_leased(self, id: str, owner: str, update: Dict[str, Any]) -> bool:
+        """Apply the update only while `owner` still holds the job"""
+        result = await Mongo.jobs.update_one(
+            {"_id": ObjectId(id), "status": JobStatus.RUNNING, "lease_owner": owner},
+            update
+        )
+        return result.matched_count > 0
+
+    @staticmethod
+    def _lease(lease_seconds: int) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        return {"lease_expires_at": now + timedelta(seconds=lease_seconds), "updated_at": now}
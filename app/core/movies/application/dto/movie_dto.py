@@ -1,4 +1,4 @@
-from app.core.common.application.dto import BaseModel, Field, MongoObjectId, PyObjectId
+from app.core.common.application.dto import BaseModel, Field, MongoObjectId, PyObjectId, Optional
 from datetime import datetime
 
 class MovieBase(BaseModel):
@@ -19,7 +19,11 @@ class MovieIn(MovieBase):
     upload_date: datetime
     language: str = "en"
     id: PyObjectId = Field(alias="_id", default=None)
-    content: str
+    content: Optional[str] = None
+    content_id: Optional[str] = None
+    content_hash: Optional[str] = None
+    parser_version: Optional[int] = None
+    dialogues_count: int = 0
 
 class MovieOut(MovieBase):
     all_movie_info: dict
@@ -27,4 +31,7 @@ class MovieOut(MovieBase):
     upload_date: datetime
     language: str = "en"
     id: MongoObjectId = Field(alias="_id", default=None)
-    content: str
+    content_id: Optional[str] = None
+    content_hash: Optional[str] = None
+    parser_version: Optional[int] = None
+    dialogues_count: int = 0
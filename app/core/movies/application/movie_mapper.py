@@ -1,3 +1,4 @@
+import copy
 from typing import Dict, Any
 from dateutil import parser
 from datetime import datetime
@@ -20,7 +21,11 @@ class MovieMapper:
             content=movie_dto.content,
             language=movie_dto.language,
             machine_translated=movie_dto.machine_translated,
-            ai_translated=movie_dto.ai_translated
+            ai_translated=movie_dto.ai_translated,
+            content_hash=movie_dto.content_hash,
+            parser_version=movie_dto.parser_version,
+            dialogues_count=movie_dto.dialogues_count,
+            content_id=movie_dto.content_id
         )
     
     @staticmethod
@@ -34,10 +39,13 @@ class MovieMapper:
             "subtitle_id": entity.subtitle_id,
             "all_movie_info": entity.all_movie_info,
             "upload_date": entity.upload_date,
-            "content": entity.content,
+            "content_id": entity.content_id,
             "language": entity.language,
             "machine_translated": entity.machine_translated,
-            "ai_translated": entity.ai_translated
+            "ai_translated": entity.ai_translated,
+            "content_hash": entity.content_hash,
+            "parser_version": entity.parser_version,
+            "dialogues_count": entity.dialogues_count
         }
         
         if entity.id:
@@ -49,17 +57,23 @@ class MovieMapper:
     def from_document_to_entity(doc: Dict[str, Any]) -> MovieEntity:
         """Convert MongoDB document directly to entity"""
         
-        return MovieEntity.create(
+        # The document becomes the stored state, the entity gets its own copy of the nested values
+        entity = MovieEntity.create(
             id=str(doc["_id"]),
             title=doc["title"],
             year=doc["year"],
             feature_type=doc["feature_type"],
             imdb_id=doc["imdb_id"],
             subtitle_id=doc["subtitle_id"],
-            all_movie_info=doc["all_movie_info"],
+            all_movie_info=copy.deepcopy(doc["all_movie_info"]),
             upload_date=doc["upload_date"] if isinstance(doc["upload_date"], datetime) else parser.parse(doc["upload_date"]),
-            content=doc["content"],
             language=doc.get("language", "en"),
             machine_translated=doc.get("machine_translated", False),
-            ai_translated=doc.get("ai_translated", False)
+            ai_translated=doc.get("ai_translated", False),
+            content_hash=doc.get("content_hash"),
+            parser_version=doc.get("parser_version"),
+            dialogues_count=doc.get("dialogues_count", 0),
+            content_id=doc.get("content_id")
         )
+        entity.mark_persisted(doc)
+        return entity
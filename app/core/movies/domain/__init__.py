@@ -1,7 +1,9 @@
 from .movie_entity import MovieEntity
 from .movie_repo import MovieRepository
+from .subtitle_content_repo import SubtitleContentRepository
 
 __all__ = (
     "MovieEntity",
     "MovieRepository",
-)
\ No newline at end of file
+    "SubtitleContentRepository",
+)
@@ -1,4 +1,5 @@
-from typing import Any, Dict
+import hashlib
+from typing import Any, Dict, Optional
 from datetime import datetime
 from app.core.common.domain.entity import Entity
 from app.core.common.domain.value_objects import Uuid
@@ -13,12 +14,17 @@ class MovieEntity(Entity):
         subtitle_id: str,
         all_movie_info: Dict[str, Any],
         upload_date: datetime,
-        content: str,
+        content: Optional[str] = None,
         language: str = "en",
         machine_translated: bool = False,
         ai_translated: bool = False,
-        id: Uuid = None
+        id: Uuid = None,
+        content_hash: Optional[str] = None,
+        parser_version: Optional[int] = None,
+        dialogues_count: int = 0,
+        content_id: Optional[str] = None
     ):
+        super().__init__()
         self.id = id
         self.title = title
         self.year = year
@@ -27,10 +33,16 @@ class MovieEntity(Entity):
         self.subtitle_id = subtitle_id
         self.all_movie_info = all_movie_info
         self.upload_date = upload_date
+        # The raw subtitle is stored apart and only loaded to process the movie
         self.content = content
+        self.content_id = content_id
         self.language = language
         self.machine_translated = machine_translated
         self.ai_translated = ai_translated
+        # Last dialogue processing run, keyed by the content hash and the parser version
+        self.content_hash = content_hash
+        self.parser_version = parser_version
+        self.dialogues_count = dialogues_count
         self._validate()
 
     def create(
@@ -41,11 +53,15 @@ class MovieEntity(Entity):
         subtitle_id: str,
         all_movie_info: Dict[str, Any],
         upload_date: datetime,
-        content: str,
+        content: Optional[str] = None,
         language: str = "en",
         machine_translated: bool = False,
         ai_translated: bool = False,
-        id: str = None
+        id: str = None,
+        content_hash: Optional[str] = None,
+        parser_version: Optional[int] = None,
+        dialogues_count: int = 0,
+        content_id: Optional[str] = None
     ):
         return MovieEntity(
             title=title,
@@ -59,9 +75,25 @@ class MovieEntity(Entity):
             language=language,
             machine_translated=machine_translated,
             ai_translated=ai_translated,
-            id=Uuid(id)
+            id=Uuid(id),
+            content_hash=content_hash,
+            parser_version=parser_version,
+            dialogues_count=dialogues_count,
+            content_id=content_id
         )
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        return hashlib.sha256(content.encode()).hexdigest()
     
+    def is_processed(self, content_hash: str, parser_version: int) -> bool:
+        return self.content_hash == content_hash and self.parser_version == parser_version
+
+    def mark_processed(self, content_hash: str, parser_version: int, dialogues_count: int) -> None:
+        self.content_hash = content_hash
+        self.parser_version = parser_version
+        self.dialogues_count = dialogues_count
+
     def _validate(self) -> None:
         self._validate_imdb_id()
     
@@ -79,8 +111,11 @@ class MovieEntity(Entity):
             "subtitle_id": self.subtitle_id,
             "all_movie_info": self.all_movie_info,
             "upload_date": self.upload_date,
-            "content": self.content,
+            "content_id": self.content_id,
             "language": self.language,
             "machine_translated": self.machine_translated,
-            "ai_translated": self.ai_translated
+            "ai_translated": self.ai_translated,
+            "content_hash": self.content_hash,
+            "parser_version": self.parser_version,
+            "dialogues_count": self.dialogues_count
         }
\ No newline at end of file
@@ -1,5 +1,13 @@
+from typing import Optional
 from app.core.common.domain.repository import Repository
 from app.core.movies.domain import MovieEntity
 
 class MovieRepository(Repository[MovieEntity]):
-    pass
\ No newline at end of file
+
+    async def find_inline_content(self, id: str) -> Optional[str]:
+        """Content of a movie stored before the content moved out of the movie documents"""
+        pass
+
+    async def detach_inline_content(self, id: str, content_id: str) -> None:
+        """Replace the inline content by a reference to the stored content"""
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC
+from typing import Optional
+
+class SubtitleContentRepository(ABC):
+    """Raw subtitle files, stored once per content hash outside the movie documents"""
+
+    async def save(self, content: str) -> str:
+        """Store the content unless it is already stored, returns its id (the content hash)"""
+        pass
+
+    async def find_by_id(self, id: str) -> Optional[str]:
+        pass
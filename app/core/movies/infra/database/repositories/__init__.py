@@ -1,5 +1,7 @@
 from .movie_processed_mongo_repo import MovieProcessedMongoRepository
+from .subtitle_content_mongo_repo import SubtitleContentMongoRepository
 
 __all__ = (
   "MovieProcessedMongoRepository",
-)
\ No newline at end of file
+  "SubtitleContentMongoRepository",
+)
@@ -1,15 +1,26 @@
 from typing import List, Dict, Any, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
 import logging
 
 from app.integration.mongo import Mongo
+from app.core.common.infra.database.partial_update import build_partial_update
 from app.core.movies.domain import MovieEntity, MovieRepository
 from app.core.movies.application import MovieMapper
+from app.util.cursor import decode_cursor, encode_cursor, with_keyset
 
 logger = logging.getLogger(__name__)
 
 class MovieProcessedMongoRepository(MovieRepository):
     """MongoDB implementation of the MovieProcessedMongoRepository"""
+    collection_name = "movies_processed"
+    indexes = [
+        IndexModel([("imdb_id", ASCENDING)], name="imdb_id"),
+    ]
+    # Listing order, the cursor holds the _id of the last movie of a page
+    sort = [("_id", ASCENDING)]
+    # Movies stored before the content moved to subtitle_contents may still have it inline
+    projection = {"content": 0}
     
     async def create(self, entity: MovieEntity) -> MovieEntity:
         """Create a new movie document"""
@@ -17,6 +28,7 @@ class MovieProcessedMongoRepository(MovieRepository):
         result = await Mongo.movies_processed.insert_one(doc)
         
         entity.id = str(result.inserted_id)
+        entity.mark_persisted()
         return entity
     
     async def create_many(self, entities: List[MovieEntity]) -> List[MovieEntity]:
@@ -31,37 +43,40 @@ class MovieProcessedMongoRepository(MovieRepository):
         for i, entity in enumerate(entities):
             if i < len(result.inserted_ids):
                 entity.id = str(result.inserted_ids[i])
+                entity.mark_persisted()
                 
         return entities
     
     async def update(self, id: str, entity: MovieEntity) -> MovieEntity:
         """Update an existing movie document"""
-        doc = entity.entity_dump()
-            
-        await Mongo.movies_processed.update_one(
-            {"_id": ObjectId(id)},
-            {"$set": doc}
-        )
-        
+        update = build_partial_update(entity)
+        if update:
+            await Mongo.movies_processed.update_one(
+                {"_id": ObjectId(id)},
+                update
+            )
+
+        entity.mark_persisted()
         return entity
     
     async def find_by_id(self, id: str) -> Optional[MovieEntity]:
         """Find a movie by its ID"""
-        doc = await Mongo.movies_processed.find_one({"_id": ObjectId(id)})
+        doc = await Mongo.movies_processed.find_one({"_id": ObjectId(id)}, self.projection)
         return MovieMapper.from_document_to_entity(doc) if doc else None
     
     async def find_by_imdb_id(self, imdb_id: str) -> Optional[MovieEntity]:
         """Find a movie by IMDB ID"""
-        doc = await Mongo.movies_processed.find_one({"imdb_id": imdb_id})
+        doc = await Mongo.movies_processed.find_one({"imdb_id": imdb_id}, self.projection)
         return MovieMapper.from_document_to_entity(doc) if doc else None
     
     async def find_with_filters(
         self, 
         filters: Dict[str, Any], 
         skip: int = 0, 
-        limit: int = 20
+        limit: int = 20,
+        after: Optional[str] = None
     ) -> List[MovieEntity]:
-        """Find movies matching the provided filters"""
+        """Find movies matching the provided filters, in _id order"""
         query = {}
         
         if "title" in filters and filters["title"]:
@@ -74,10 +89,37 @@ class MovieProcessedMongoRepository(MovieRepository):
             if key not in ["title", "imdb_id"] and value is not None:
                 query[key] = value
         
-        cursor = Mongo.movies_processed.find(query).skip(skip).limit(limit)
+        if after:
+            query = with_keyset(query, self.sort, decode_cursor(after).get("k", []))
+
+        cursor = Mongo.movies_processed.find(query, self.projection).sort(self.sort).skip(skip).limit(limit)
         
         return [MovieMapper.from_document_to_entity(doc) async for doc in cursor]
     
+    def next_cursor(
+        self,
+        entities: List[MovieEntity],
+        filters: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[str] = None
+    ) -> Optional[str]:
+        """Cursor after the last movie of a full page"""
+        if not entities or len(entities) < limit:
+            return None
+        return encode_cursor([ObjectId(str(entities[-1].id))])
+    
+    async def find_inline_content(self, id: str) -> Optional[str]:
+        """Content of a movie stored before the content moved to subtitle_contents"""
+        doc = await Mongo.movies_processed.find_one({"_id": ObjectId(id)}, {"content": 1})
+        return doc.get("content") if doc else None
+
+    async def detach_inline_content(self, id: str, content_id: str) -> None:
+        await Mongo.movies_processed.update_one(
+            {"_id": ObjectId(id)},
+            {"$set": {"content_id": content_id}, "$unset": {"content": ""}}
+        )
+
     async def delete(self, id: str) -> bool:
         """Delete a movie by its ID"""
         result = await Mongo.movies_processed.delete_one({"_id": ObjectId(id)})
@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+from typing import Optional
+import logging
+
+from pymongo.errors import DuplicateKeyError
+
+from app.integration.mongo import Mongo
+from app.core.movies.domain import MovieEntity, SubtitleContentRepository
+from app.util.compression import compress, decompress
+
+logger = logging.getLogger(__name__)
+
+class SubtitleContentMongoRepository(SubtitleContentRepository):
+    """
+    Compressed raw subtitles, one document per content hash (_id), so a file
+    shared by several movies or languages is stored once
+    """
+    collection_name = "subtitle_contents"
+    # Looked up by _id only
+    indexes = []
+
+    async def save(self, content: str) -> str:
+        content_id = MovieEntity.hash_content(content)
+        raw = content.encode()
+        encoding, data = compress(raw)
+
+        try:
+            await Mongo.subtitle_contents.update_one(
+                {"_id": content_id},
+                {"$setOnInsert": {
+                    "encoding": encoding,
+                    "data": data,
+                    "size": len(raw),
+                    "stored_size": len(data),
+                    "created_at": datetime.now(timezone.utc),
+                }},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # Stored concurrently by another writer, same content
+            pass
+
+        return content_id
+
+    async def find_by_id(self, id: str) -> Optional[str]:
+        doc = await Mongo.subtitle_contents.find_one({"_id": id}, {"encoding": 1, "data": 1})
+        if doc is None:
+            return None
+        return decompress(doc["data"], doc["encoding"]).decode()
@@ -1,5 +1,7 @@
 from .user_mapper import UserMapper
+from .principal_cache import PrincipalCache
 
 __all__ = (
   "UserMapper",
+  "PrincipalCache",
 )
\ No newline at end of file
@@ -36,6 +36,12 @@ class UserOut(UserIn):
     id: MongoObjectId = Field(default_factory=MongoObjectId, alias="_id")
     model_config = {"populate_by_name": True}
 
+class UserPrincipal(BaseModel):
+    """The authenticated user, enough for the endpoints that only need to know who is calling"""
+    id: str
+    email: str
+    name: str
+
 class UserUpdate(BaseModel):
     name: Optional[str] = None
     picture: Optional[str] = None
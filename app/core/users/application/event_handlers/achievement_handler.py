@@ -4,13 +4,15 @@ from app.core.common.domain.events.event_handler import EventHandler
 from app.core.users.domain.events.user_leveled_up_event import UserLeveledUpEvent
 from app.core.users.domain.user_entity import Achievement
 from app.core.users.infra.database.repositories import UserMongoRepository
-from app.core.common.domain.value_objects import Uuid
 
 logger = logging.getLogger(__name__)
 
 
 class AchievementHandler(EventHandler):
     """Handles user level up events by creating achievements"""
+
+    # Read-modify-write of the achievements list, concurrent runs would lose achievements
+    ordering_key = "user.achievements"
     
     def __init__(self):
         self.user_repo = UserMongoRepository()
@@ -30,8 +32,13 @@ class AchievementHandler(EventHandler):
                 return
             
             if event.new_level % 2 == 0:
+                # Relayed events are delivered at least once, the achievement is keyed by the event
+                if any(achievement.id == event.event_id for achievement in user_entity.achievements):
+                    logger.info(f"Level {event.new_level} achievement of event {event.event_id} already created")
+                    return
+
                 achievement = Achievement(
-                    id=Uuid(),
+                    id=event.event_id,
                     name=f"Level {event.new_level} Achieved",
                     description=f"Congratulations! You've reached level {event.new_level}.",
                     earned_at=event.occurred_at
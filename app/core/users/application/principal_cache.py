@@ -0,0 +1,35 @@
+from typing import Optional
+from app.core.config import settings
+from app.core.users.application.dto.user_dto import UserPrincipal
+from app.util.cache import LRUCache
+
+class PrincipalCache:
+    """
+    Per worker cache of the authenticated users, so validating a token does
+    not read the whole user document on every request.
+
+    Writes through the user repository invalidate the entry of this worker,
+    the other workers see the change once their entry is older than
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS. A TTL of 0 disables the cache.
+    """
+    ttl_seconds: float = settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+    memory = LRUCache(settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES, ttl_seconds)
+
+    @classmethod
+    def get(cls, user_id: str) -> Optional[UserPrincipal]:
+        if cls.ttl_seconds <= 0:
+            return None
+        return cls.memory.get(user_id)
+
+    @classmethod
+    def set(cls, principal: UserPrincipal) -> None:
+        if cls.ttl_seconds > 0:
+            cls.memory.set(principal.id, principal)
+
+    @classmethod
+    def invalidate(cls, user_id: str) -> None:
+        cls.memory.delete(str(user_id))
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.memory.clear()
@@ -1,6 +1,6 @@
 from typing import Dict, Any
 from datetime import timezone
-from app.core.users.application.dto.user_dto import UserIn, UserOut, UserProgress as UserProgressDTO, Achievement as AchievementDTO
+from app.core.users.application.dto.user_dto import UserIn, UserOut, UserPrincipal, UserProgress as UserProgressDTO, Achievement as AchievementDTO
 from app.core.users.domain import UserEntity, UserProgress, Achievement
 
 def ensure_timezone_aware(dt):
@@ -83,6 +83,10 @@ class UserMapper:
             
         return UserOut(**user_dict)
     
+    @staticmethod
+    def to_principal(entity: UserEntity) -> UserPrincipal:
+        return UserPrincipal(id=str(entity.id.value), email=entity.email.value, name=entity.name)
+
     @staticmethod
     def from_document_to_entity(doc: Dict[str, Any]) -> UserEntity:
         """Convert document directly to entity"""
@@ -106,7 +110,7 @@ class UserMapper:
             xp_points=progress_doc.get("xp_points", 0)
         )
 
-        return UserEntity.create(
+        entity = UserEntity.create(
             id=str(doc["_id"]),
             email=doc["email"],
             name=doc["name"],
@@ -117,3 +121,5 @@ class UserMapper:
             last_login=ensure_timezone_aware(doc["last_login"]),
             progress=progress
         )
+        entity.mark_persisted(doc)
+        return entity
@@ -25,6 +25,10 @@ class Achievement:
         return Achievement(Uuid(id), name, description, earned_at)
 
 class UserProgress:
+    LEVEL_BASE_XP = 1000
+    LEVEL_XP_GROWTH = 1.2
+    MAX_LEVEL = 100
+
     def __init__(
         self,
         total_practice_time_seconds: int = 0,
@@ -86,14 +90,25 @@ class UserProgress:
     
     def _calculate_level(self, xp: int) -> int:
         """Calculate user level based on XP"""
-        base_xp = 1000
+        base_xp = self.LEVEL_BASE_XP
         level = 1
         while xp >= base_xp:
             xp -= base_xp
-            base_xp = int(base_xp * 1.2)
+            base_xp = int(base_xp * self.LEVEL_XP_GROWTH)
             level += 1
         return level
 
+    @classmethod
+    def level_thresholds(cls) -> List[int]:
+        """Total XP needed to reach each level from 2 up to MAX_LEVEL, same rule as _calculate_level"""
+        thresholds = []
+        total_xp, base_xp = 0, cls.LEVEL_BASE_XP
+        for _ in range(cls.MAX_LEVEL - 1):
+            total_xp += base_xp
+            thresholds.append(total_xp)
+            base_xp = int(base_xp * cls.LEVEL_XP_GROWTH)
+        return thresholds
+
 class UserEntity(Entity):
     def __init__(
         self,
@@ -1,8 +1,31 @@
-from typing import Optional
+from typing import Any, Optional
 from app.core.common.domain.repository import Repository
 from app.core.users.domain import UserEntity
 
 class UserRepository(Repository[UserEntity]):
 
     async def find_by_google_id(self, google_id: str) -> Optional[UserEntity]:
-        pass
\ No newline at end of file
+        pass
+
+    async def upsert_login(self, entity: UserEntity, key: str = "google_id") -> UserEntity:
+        """
+        Record a login in a single atomic operation. The user matching the
+        `key` field of `entity` gets its last_login updated, or `entity` is
+        created when there is none. Returns the user after the login.
+        """
+        pass
+
+    async def apply_practice_result(
+        self,
+        id: str,
+        pronunciation_score: float,
+        fluency_score: float,
+        xp_earned: int,
+        session: Any = None
+    ) -> Optional[UserEntity]:
+        """
+        Atomically add a practice result to the user progress, within the
+        transaction of `session` when given.
+        Returns the user as it was before the update.
+        """
+        pass
@@ -1,15 +1,29 @@
 from typing import List, Dict, Any, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 import logging
 
 from app.integration.mongo import Mongo
-from app.core.users.domain import UserEntity, UserRepository
-from app.core.users.application import UserMapper
+from app.core.common.infra.database.partial_update import build_partial_update
+from app.core.users.domain import UserEntity, UserRepository, UserProgress
+from app.core.users.application import UserMapper, PrincipalCache
 
 logger = logging.getLogger(__name__)
 
 class UserMongoRepository(UserRepository):
     """MongoDB implementation of the UserRepository"""
+    collection_name = "users"
+    indexes = [
+        # Dev logins have no google_id, only real Google accounts must be unique
+        IndexModel(
+            [("google_id", ASCENDING)],
+            name="google_id_unique",
+            unique=True,
+            partialFilterExpression={"google_id": {"$gt": ""}}
+        ),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ]
     
     async def create(self, entity: UserEntity) -> UserEntity:
         """Create a new user document"""
@@ -18,6 +32,7 @@ class UserMongoRepository(UserRepository):
         result = await Mongo.users.insert_one(doc)
         
         entity.id = str(result.inserted_id)
+        entity.mark_persisted()
         return entity
     
     async def create_many(self, entities: List[UserEntity]) -> List[UserEntity]:
@@ -32,20 +47,102 @@ class UserMongoRepository(UserRepository):
         for i, entity in enumerate(entities):
             if i < len(result.inserted_ids):
                 entity.id = str(result.inserted_ids[i])
+                entity.mark_persisted()
                 
         return entities
     
     async def update(self, id: str, entity: UserEntity) -> UserEntity:
         """Update an existing user document"""
-        doc = entity.entity_dump()
-            
-        await Mongo.users.update_one(
-            {"_id": ObjectId(id)},
-            {"$set": doc}
-        )
-        
+        # Progress is only written through apply_practice_result, writing it here
+        # would overwrite practices applied since the entity was loaded
+        update = build_partial_update(entity, exclude=("progress",))
+        if update:
+            await Mongo.users.update_one(
+                {"_id": ObjectId(id)},
+                update
+            )
+            PrincipalCache.invalidate(id)
+
+        entity.mark_persisted()
         return entity
     
+    async def apply_practice_result(
+        self,
+        id: str,
+        pronunciation_score: float,
+        fluency_score: float,
+        xp_earned: int,
+        session: Any = None
+    ) -> Optional[UserEntity]:
+        """
+        Add a practice result to the user progress in a single atomic update.
+        The running averages and the level are computed by the server, so
+        concurrent practices of the same user never overwrite each other.
+        Returns the user as it was before the update.
+        """
+        total_dialogues = {"$ifNull": ["$progress.total_dialogues", 0]}
+
+        def running_average(field: str, score: float) -> dict:
+            return {
+                "$divide": [
+                    {"$add": [
+                        {"$multiply": [{"$ifNull": [f"$progress.{field}", 0]}, total_dialogues]},
+                        score
+                    ]},
+                    {"$add": [total_dialogues, 1]}
+                ]
+            }
+
+        pipeline = [
+            {"$set": {
+                "progress.total_dialogues": {"$add": [total_dialogues, 1]},
+                "progress.xp_points": {"$add": [{"$ifNull": ["$progress.xp_points", 0]}, xp_earned]},
+                "progress.average_pronunciation_score": running_average("average_pronunciation_score", pronunciation_score),
+                "progress.average_fluency_score": running_average("average_fluency_score", fluency_score),
+            }},
+            {"$set": {
+                "progress.level": {"$add": [1, {"$size": {"$filter": {
+                    "input": UserProgress.level_thresholds(),
+                    "cond": {"$lte": ["$$this", "$progress.xp_points"]}
+                }}}]},
+            }},
+        ]
+
+        doc = await Mongo.users.find_one_and_update(
+            {"_id": ObjectId(id)},
+            pipeline,
+            return_document=ReturnDocument.BEFORE,
+            session=session
+        )
+        if doc is None:
+            return None
+        return UserMapper.from_document_to_entity(doc)
+
+    async def upsert_login(self, entity: UserEntity, key: str = "google_id") -> UserEntity:
+        """
+        Update last_login or create the user in one round trip, the unique
+        google_id and email indexes keep concurrent first logins from
+        creating the same user twice.
+        """
+        profile = entity.entity_dump()
+        last_login = profile.pop("last_login")
+
+        for attempt in range(2):
+            try:
+                doc = await Mongo.users.find_one_and_update(
+                    {key: profile[key]},
+                    {"$setOnInsert": profile, "$set": {"last_login": last_login}},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER
+                )
+                break
+            except DuplicateKeyError:
+                # A concurrent first login inserted the user, the retry updates it
+                if attempt:
+                    raise
+
+        return UserMapper.from_document_to_entity(doc)
+
     async def find_by_id(self, id: str) -> Optional[UserEntity]:
         """Find a user by its ID"""
         if (doc := await Mongo.users.find_one({"_id": ObjectId(id)})) is not None:
@@ -84,4 +181,5 @@ class UserMongoRepository(UserRepository):
     async def delete(self, id: str) -> bool:
         """Delete a user by its ID"""
         result = await Mongo.users.delete_one({"_id": ObjectId(id)})
+        PrincipalCache.invalidate(id)
         return result.deleted_count > 0
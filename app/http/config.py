@@ -8,7 +8,17 @@ from app.config import (
     start_http_client,
     stop_http_client,
     start_audio_processor,
-    stop_audio_processor
+    stop_audio_processor,
+    start_job_runner,
+    stop_job_runner,
+    start_process_pool,
+    stop_process_pool,
+    start_google_id_token_verifier,
+    stop_google_id_token_verifier,
+    start_event_bus,
+    stop_event_bus,
+    start_outbox_relay,
+    stop_outbox_relay
 )
 from contextlib import asynccontextmanager
 from app.core.common.domain.events.event_setup import setup_event_handlers
@@ -19,6 +29,7 @@ from .rest.v1 import (
    movie_v1,
    dialogue_v1,
    user_v1,
+   metrics_v1,
 )
 
 def configure_middlewares(app: FastAPI):
@@ -28,7 +39,7 @@ def configure_middlewares(app: FastAPI):
       allow_credentials=True,
       allow_methods=["*"],
       allow_headers=["*"],
-      expose_headers=["X-Request-ID", "X-Request-Time"],
+      expose_headers=["X-Request-ID", "X-Request-Time", "X-Next-Cursor"],
       max_age=600,  # Seconds
   )
 
@@ -36,11 +47,24 @@ async def startup_event():
     start_logging()
     await start_mongo()
     await start_http_client()
-    start_audio_processor()
+    start_google_id_token_verifier()
+    await start_audio_processor()
+    start_process_pool()
     setup_event_handlers()
+    start_event_bus()
+    await start_outbox_relay()
+    await start_job_runner()
 
 async def shutdown_event():
+    # Workers release their running jobs, Mongo must still be up
+    await stop_job_runner()
+    # Leased outbox events are taken again by another relay once the lease expires
+    await stop_outbox_relay()
+    # Queued events are drained while their handlers can still reach Mongo
+    await stop_event_bus()
+    stop_process_pool()
     await stop_mongo()
+    await stop_google_id_token_verifier()
     await stop_http_client()
     stop_audio_processor()
     await stop_logging()
@@ -56,7 +80,8 @@ def configure_routes(app: FastAPI):
   app.include_router(auth_v1)
   app.include_router(movie_v1)
   app.include_router(dialogue_v1)
-  app.include_router(user_v1)  
+  app.include_router(user_v1)
+  app.include_router(metrics_v1)
 
 def configure_app(app: FastAPI):
 
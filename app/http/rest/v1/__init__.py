@@ -3,6 +3,7 @@ from .auth_rest import auth_v1
 from .movie_rest  import movie_v1
 from .dialogue_rest  import dialogue_v1
 from .user_rest import user_v1
+from .metrics_rest import metrics_v1
 
 __all__ = (
    'health_v1',
@@ -10,4 +11,5 @@ __all__ = (
    'movie_v1',
    'dialogue_v1',
    'user_v1',
+   'metrics_v1',
 )
\ No newline at end of file
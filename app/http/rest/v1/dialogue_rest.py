@@ -1,9 +1,10 @@
 from app.core.config import settings
-from fastapi import APIRouter, File, UploadFile, Depends
+from fastapi import APIRouter, File, UploadFile, Depends, Request, Response, HTTPException, status
 from app.business import DialogueBusiness, AuthBusiness
-from typing import List, Optional
-from app.core.dialogues.application.dto.dialogue_dto import DialogueOut, PracticeResult, DialoguePracticeHistoryOut
-from app.core.users.application.dto.user_dto import UserOut
+from fastapi.responses import JSONResponse
+from typing import List, Literal, Optional, Union
+from app.core.dialogues.application.dto.dialogue_dto import DialogueOut, DialogueSummaryOut, PracticeResult, DialoguePracticeHistoryOut
+from app.core.users.application.dto.user_dto import UserPrincipal
 
 
 dialogue_v1 = APIRouter(
@@ -14,16 +15,36 @@ dialogue_v1 = APIRouter(
 
 @dialogue_v1.get(
     "",
-    response_model=List[DialogueOut],
+    response_model=Union[List[DialogueOut], List[DialogueSummaryOut]],
     status_code=200,
 )
 async def search_dialogues(
+    response: Response,
     search: Optional[str] = None,
     imdb_id: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
-) -> List[DialogueOut]:
-    return await DialogueBusiness.search_dialogues(search, imdb_id, skip, limit)
+    search_mode: Literal["text", "regex"] = "text",
+    after: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    fields: Optional[str] = None,
+) -> Union[List[DialogueOut], List[DialogueSummaryOut]]:
+    if view == "summary" or fields:
+        # Summaries are built straight from the projected documents, serialize
+        # them here so only the requested fields are sent
+        requested = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        page = await DialogueBusiness.search_dialogue_summaries(search, imdb_id, skip, limit, search_mode, after, requested)
+        summary_response = JSONResponse(
+            [summary.model_dump(mode="json", by_alias=True, exclude_unset=True) for summary in page.items]
+        )
+        if page.next_cursor:
+            summary_response.headers["X-Next-Cursor"] = page.next_cursor
+        return summary_response
+
+    page = await DialogueBusiness.search_dialogues(search, imdb_id, skip, limit, search_mode, after)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
 
 @dialogue_v1.get(
     "/{dialogue_id}",
@@ -42,9 +63,34 @@ async def get_dialogue(
 )
 async def practice_dialogue(
     dialogue_id: str,
-    audio: UploadFile = File(...),
-    user: UserOut = Depends(AuthBusiness.get_current_user) 
+    request: Request,
+    audio: Optional[UploadFile] = File(None),
+    user: UserPrincipal = Depends(AuthBusiness.get_current_user) 
 ) -> None:
+    """
+    Accepts the audio either as the multipart field `audio` or as the raw
+    request body (Content-Type audio/* or application/octet-stream). The raw
+    body is streamed to the audio processor without being buffered, and its
+    size and duration limits are enforced while it is read. A multipart upload
+    is spooled whole by the framework before this handler runs, only its
+    Content-Length is checked up front.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.AUDIO_UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Audio exceeds the maximum size of {settings.AUDIO_UPLOAD_MAX_BYTES} bytes"
+        )
+
+    content_type = request.headers.get("content-type", "")
+    if audio is None:
+        if not (content_type.startswith("audio/") or content_type.startswith("application/octet-stream")):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Audio must be sent as the multipart field 'audio' or as the request body"
+            )
+        return await DialogueBusiness.proccess_practice_dialogue_stream(dialogue_id, request.stream(), user)
+
     audio_data = await audio.read()
     return await DialogueBusiness.proccess_practice_dialogue(dialogue_id, audio_data, user)
 
@@ -54,9 +100,14 @@ async def practice_dialogue(
     status_code=200,
 )
 async def list_practice_history(
+    response: Response,
     filter_type: str = 'recent',
     skip: int = 0,
     limit: int = 20,
-    user: UserOut = Depends(AuthBusiness.get_current_user)
+    after: Optional[str] = None,
+    user: UserPrincipal = Depends(AuthBusiness.get_current_user)
 ) -> List[DialoguePracticeHistoryOut]:
-    return await DialogueBusiness.list_practice_history(filter_type, skip, limit, user)
\ No newline at end of file
+    page = await DialogueBusiness.list_practice_history(filter_type, skip, limit, user, after)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
\ No newline at end of file
@@ -0,0 +1,16 @@
+from app.core.config import settings
+from fastapi import APIRouter, Depends
+from app.business import AuthBusiness
+from app.util.metrics import Metrics
+
+
+metrics_v1 = APIRouter(
+    prefix=f"{settings.API_V1_STR}/metrics",
+    tags=["metrics"],
+    dependencies=[Depends(AuthBusiness.validate_auth)]
+)
+
+@metrics_v1.get("", response_description="In-process metrics of this worker")
+async def get_metrics():
+
+    return Metrics.snapshot()
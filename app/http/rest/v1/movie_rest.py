@@ -1,8 +1,9 @@
 from app.core.config import settings
-from fastapi import APIRouter, Depends
-from app.business import MovieBusiness, AuthBusiness
-from typing import List, Dict, Optional
+from fastapi import APIRouter, Depends, Response
+from app.business import MovieBusiness, AuthBusiness, JobBusiness
+from typing import List, Optional
 from app.core.movies.application.dto.movie_dto import MovieSearchOut, MovieOut
+from app.core.jobs.application.dto.job_dto import JobOut
 
 
 movie_v1 = APIRouter(
@@ -23,14 +24,24 @@ async def search_movies(
 
 @movie_v1.post(
     "/{imdb_id}/process",
-    response_model=Dict,
-    status_code=200,
+    response_model=JobOut,
+    status_code=202,
 )
 async def process_movie_dialogues(
     imdb_id: str,
     language: str = "en",
-) -> Dict:
-    return await MovieBusiness.process_movie_dialogues(imdb_id, language)
+) -> JobOut:
+    return await MovieBusiness.enqueue_movie_dialogues_processing(imdb_id, language)
+
+@movie_v1.get(
+    "/jobs/{job_id}",
+    response_model=JobOut,
+    status_code=200,
+)
+async def get_job(
+    job_id: str,
+) -> JobOut:
+    return await JobBusiness.get_job(job_id)
 
 @movie_v1.get(
     "/processed",
@@ -38,8 +49,13 @@ async def process_movie_dialogues(
     status_code=200,
 )
 async def search_processed_movies(
+    response: Response,
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
+    after: Optional[str] = None,
 ) -> List[MovieOut]:
-    return await MovieBusiness.search_processed_movies(search, skip, limit)
+    page = await MovieBusiness.search_processed_movies(search, skip, limit, after)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
@@ -2,7 +2,7 @@ from app.core.config import settings
 from fastapi import APIRouter, Depends
 from app.business import UserBusiness, AuthBusiness
 from typing import List
-from app.core.users.application.dto.user_dto import UserOut
+from app.core.users.application.dto.user_dto import UserOut, UserPrincipal
 
 
 user_v1 = APIRouter(
@@ -17,6 +17,6 @@ user_v1 = APIRouter(
     status_code=200,
 )
 async def get_user_profile(
-    user: UserOut = Depends(AuthBusiness.get_current_user)
+    user: UserPrincipal = Depends(AuthBusiness.get_current_user)
 ) -> UserOut:
     return await UserBusiness.get_user(user.id)
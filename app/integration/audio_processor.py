@@ -1,16 +1,31 @@
-from app.adapters.google_audio_processor import GoogleAudioProcessor
+from app.adapters.cached_audio_processor import CachedAudioProcessor
 from app.core.common.ports import AudioProcessor as AudioProcessorPort
+from app.core.config import settings
+from .mongo import Mongo
+from .connector import get_audio_processor_connector
 
 class AudioProcessor:
     client: AudioProcessorPort = None
 
     @classmethod
-    def _startup(cls) -> None:
+    async def _startup(cls) -> None:
       if cls.client is not None:
           raise RuntimeError("Audio processor has already been started")
 
-      cls.client = GoogleAudioProcessor()
+      cls.client = get_audio_processor_connector()
+
+      if settings.TRANSCRIPTION_CACHE_ENABLED:
+          cls.client = CachedAudioProcessor(
+              cls.client,
+              max_entries=settings.TRANSCRIPTION_CACHE_MAX_ENTRIES,
+              ttl_seconds=settings.TRANSCRIPTION_CACHE_TTL_SECONDS,
+              collection=Mongo.transcription_cache if settings.TRANSCRIPTION_CACHE_MONGO_ENABLED else None,
+          )
 
     @classmethod
     def _shutdown(cls) -> None:
-       pass
\ No newline at end of file
+       if cls.client is None:
+          return
+
+       cls.client.shutdown()
+       cls.client = None
@@ -1,9 +1,37 @@
 from app.core.config import settings
 from app.adapters.open_subtitles import OpenSubTitles
-from app.util.patterns import SubtitleMoviesEnum
+from app.adapters.cached_subtitle_movies import CachedSubtitleMovies
+from app.adapters.google_audio_processor import GoogleAudioProcessor
+from app.adapters.fake_audio_processor import FakeAudioProcessor
+from app.util.patterns import SubtitleMoviesEnum, AudioProcessorsEnum
 
 def get_subtitle_movie_connector():
     if settings.MOVIE_SERVICE == SubtitleMoviesEnum.OPEN_SUBTITLES:
-        return OpenSubTitles()
+        service = OpenSubTitles()
     else:
         raise ValueError("Invalid movie service configuration")
+
+    if settings.MOVIE_SEARCH_CACHE_ENABLED:
+        return CachedSubtitleMovies(
+            service,
+            max_entries=settings.MOVIE_SEARCH_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.MOVIE_SEARCH_CACHE_TTL_SECONDS,
+            stale_seconds=settings.MOVIE_SEARCH_CACHE_STALE_SECONDS,
+        )
+    return service
+
+def get_audio_processor_connector():
+    if settings.AUDIO_PROCESSOR == AudioProcessorsEnum.GOOGLE:
+        return GoogleAudioProcessor()
+    elif settings.AUDIO_PROCESSOR == AudioProcessorsEnum.FAKE:
+        return FakeAudioProcessor(
+            latency_mean_seconds=settings.FAKE_AUDIO_PROCESSOR_LATENCY_MEAN_SECONDS,
+            latency_stddev_seconds=settings.FAKE_AUDIO_PROCESSOR_LATENCY_STDDEV_SECONDS,
+            latency_distribution=settings.FAKE_AUDIO_PROCESSOR_LATENCY_DISTRIBUTION,
+            error_rate=settings.FAKE_AUDIO_PROCESSOR_ERROR_RATE,
+            busy_rate=settings.FAKE_AUDIO_PROCESSOR_BUSY_RATE,
+            retry_after=settings.AUDIO_PROCESSOR_RETRY_AFTER_SECONDS,
+            seed=settings.FAKE_AUDIO_PROCESSOR_SEED,
+        )
+    else:
+        raise ValueError("Invalid audio processor configuration")
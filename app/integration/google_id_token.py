@@ -0,0 +1,140 @@
+import asyncio
+import base64
+import logging
+import re
+import time
+from typing import Any, Dict, Optional
+
+import jwt
+import rsa
+from google.auth import jwt as google_jwt
+
+from app.core.config import settings
+from app.integration.http_client import HttpClient
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class GoogleKeysUnavailableError(Exception):
+    """Raised when no signing key of Google can be used to verify a token"""
+
+
+class GoogleIdTokenVerifier:
+    """
+    Verifies Google ID tokens locally against Google's signing keys (JWKS).
+
+    The keys are kept in memory for the max-age of the certs response and
+    refreshed in the background before they expire, so a login only waits
+    on a fetch when no usable key set is known. A token signed by an
+    unknown key triggers a refresh, at most every
+    GOOGLE_JWKS_MIN_REFRESH_INTERVAL_SECONDS, to pick up key rotations.
+    """
+    ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+    # kid -> PEM encoded public key
+    keys: Dict[str, str] = {}
+    fetched_at: float = 0.0
+    expires_at: float = 0.0
+    _refresh: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _startup(cls) -> None:
+        """Fetch the keys in the background, so the first login does not wait for them"""
+        cls._schedule_refresh()
+
+    @classmethod
+    async def _shutdown(cls) -> None:
+        if cls._refresh is not None and not cls._refresh.done():
+            cls._refresh.cancel()
+            await asyncio.gather(cls._refresh, return_exceptions=True)
+        cls._refresh = None
+
+    @classmethod
+    async def verify(cls, token: str, audience: str) -> Dict[str, Any]:
+        """
+        Return the claims of a valid ID token issued by Google for `audience`.
+        Raises ValueError for an invalid token and GoogleKeysUnavailableError
+        when Google's keys could not be fetched.
+        """
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.PyJWTError as e:
+            raise ValueError(f"Malformed token: {e}")
+
+        keys = await cls._get_keys(kid)
+        if kid not in keys:
+            raise ValueError(f"Token signed by an unknown key: {kid}")
+
+        claims = google_jwt.decode(
+            token,
+            certs={kid: keys[kid]},
+            audience=audience,
+            clock_skew_in_seconds=settings.GOOGLE_ID_TOKEN_CLOCK_SKEW_SECONDS
+        )
+        if claims.get("iss") not in cls.ISSUERS:
+            raise ValueError(f"Wrong issuer: {claims.get('iss')}")
+        return claims
+
+    @classmethod
+    async def _get_keys(cls, kid: Optional[str]) -> Dict[str, str]:
+        now = time.monotonic()
+        if cls.keys and now < cls.expires_at:
+            if kid in cls.keys:
+                if cls.expires_at - now < settings.GOOGLE_JWKS_REFRESH_AHEAD_SECONDS:
+                    cls._schedule_refresh()
+                return cls.keys
+            # Google may have rotated its keys before our copy expired
+            if now - cls.fetched_at < settings.GOOGLE_JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+                return cls.keys
+
+        try:
+            # Shielded, the fetch is shared by every waiting login
+            await asyncio.shield(cls._schedule_refresh())
+        except Exception as e:
+            if not cls.keys:
+                raise GoogleKeysUnavailableError(f"Could not fetch Google signing keys: {e}")
+            logger.warning(f"Google signing keys refresh failed, using the previous keys: {e}")
+        return cls.keys
+
+    @classmethod
+    def _schedule_refresh(cls) -> asyncio.Task:
+        if cls._refresh is None or cls._refresh.done():
+            cls._refresh = asyncio.ensure_future(cls._fetch_keys())
+            cls._refresh.add_done_callback(cls._log_refresh_error)
+        return cls._refresh
+
+    @classmethod
+    async def _fetch_keys(cls) -> None:
+        async with HttpClient.request("GET", settings.GOOGLE_JWKS_URL) as response:
+            if response.status != 200:
+                raise GoogleKeysUnavailableError(f"Google certs returned {response.status}")
+            jwks = await response.json()
+            max_age = cls.parse_max_age(response.headers.get("Cache-Control"))
+
+        cls.keys = {
+            jwk["kid"]: cls.jwk_to_pem(jwk)
+            for jwk in jwks.get("keys", [])
+            if jwk.get("kty") == "RSA" and "kid" in jwk
+        }
+        cls.fetched_at = time.monotonic()
+        cls.expires_at = cls.fetched_at + max_age
+        logger.info(f"Fetched {len(cls.keys)} Google signing keys, valid for {max_age}s")
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Google signing keys refresh failed: {task.exception()}")
+
+    @staticmethod
+    def parse_max_age(cache_control: Optional[str]) -> int:
+        match = MAX_AGE.search(cache_control or "")
+        return int(match.group(1)) if match else settings.GOOGLE_JWKS_DEFAULT_MAX_AGE_SECONDS
+
+    @staticmethod
+    def jwk_to_pem(jwk: Dict[str, str]) -> str:
+        def to_int(value: str) -> int:
+            return int.from_bytes(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)), "big")
+
+        return rsa.PublicKey(to_int(jwk["n"]), to_int(jwk["e"])).save_pkcs1().decode()
@@ -1,7 +1,14 @@
+import asyncio
 import logging
-from typing import Optional
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, FrozenSet, Optional
 
-from aiohttp import ClientSession
+from aiohttp import ClientConnectionError, ClientResponse, ClientSession, ClientTimeout, TCPConnector
+
+from app.core.config import settings
 
 
 logger = logging.getLogger(__name__)
@@ -10,6 +17,11 @@ logger = logging.getLogger(__name__)
 class HttpClient:
     session: Optional[ClientSession] = None
 
+    # Upstream overloaded or briefly unavailable, the request was not processed
+    RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    # Methods that are safe to send again after a connection error or a timeout
+    IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
     @classmethod
     async def startup(cls) -> None:
         if cls.session:
@@ -17,7 +29,13 @@ class HttpClient:
             return
 
         logger.info("Starting HttpClient...")
-        cls.session = ClientSession()
+        connector = TCPConnector(
+            limit=settings.HTTP_CLIENT_LIMIT,
+            limit_per_host=settings.HTTP_CLIENT_LIMIT_PER_HOST,
+            ttl_dns_cache=settings.HTTP_CLIENT_DNS_CACHE_SECONDS,
+            keepalive_timeout=settings.HTTP_CLIENT_KEEPALIVE_SECONDS,
+        )
+        cls.session = ClientSession(connector=connector, timeout=cls.default_timeout())
 
     @classmethod
     async def shutdown(cls) -> None:
@@ -28,3 +46,75 @@ class HttpClient:
         logger.info("Stopping HttpClient...")
         cls.session = None
         await session.close()
+
+    @staticmethod
+    def default_timeout() -> ClientTimeout:
+        return ClientTimeout(
+            total=settings.HTTP_CLIENT_TOTAL_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+            sock_read=settings.HTTP_CLIENT_READ_TIMEOUT_SECONDS,
+        )
+
+    @classmethod
+    @asynccontextmanager
+    async def request(
+        cls,
+        method: str,
+        url: str,
+        max_retries: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[ClientResponse]:
+        """
+        Send a request through the shared session, retrying 429/5xx responses,
+        and connection errors or timeouts of idempotent methods, with jittered
+        exponential backoff. A Retry-After header sets the delay. The last
+        response is returned as is once the retries are exhausted.
+        """
+        max_retries = settings.HTTP_CLIENT_MAX_RETRIES if max_retries is None else max_retries
+        method = method.upper()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                response = await cls.session.request(method, url, **kwargs)
+            except (ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt > max_retries or method not in cls.IDEMPOTENT_METHODS:
+                    raise
+                delay = cls.retry_delay(attempt)
+                logger.warning(f"{method} {url} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status in cls.RETRY_STATUSES and attempt <= max_retries:
+                delay = cls.retry_delay(attempt, response.headers.get("Retry-After"))
+                response.release()
+                logger.warning(f"{method} {url} returned {response.status}, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                yield response
+            finally:
+                response.release()
+            return
+
+    @staticmethod
+    def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before the retry following `attempt` (1 based), capped at HTTP_CLIENT_RETRY_BACKOFF_MAX_SECONDS"""
+        max_delay = settings.HTTP_CLIENT_RETRY_BACKOFF_MAX_SECONDS
+
+        if retry_after:
+            # Delta seconds or an HTTP date
+            try:
+                return min(max(float(retry_after), 0.0), max_delay)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return min(max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0), max_delay)
+            except (TypeError, ValueError):
+                pass
+
+        # Full jitter spreads the retries of concurrent callers
+        return random.uniform(0, min(max_delay, settings.HTTP_CLIENT_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)))
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.jobs.domain import JobEntity
+from app.core.jobs.infra.database.repositories import JobMongoRepository
+from app.util.backoff import exponential_backoff
+from app.util.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+ProgressReporter = Callable[[Dict[str, Any]], Awaitable[None]]
+JobHandler = Callable[[JobEntity, ProgressReporter], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobRunner:
+    """
+    Runs the jobs of the Mongo `jobs` collection with a fixed number of worker
+    tasks. A claimed job is leased to this process and the lease is renewed
+    while the handler runs, jobs of a process that died are taken again once
+    their lease expires. Failures are retried with exponential backoff.
+    """
+    repo = JobMongoRepository()
+    handlers: Dict[str, JobHandler] = {}
+    owner: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    _workers: List[asyncio.Task] = []
+    _wakeup: Optional[asyncio.Event] = None
+    _running: bool = False
+
+    @classmethod
+    def register(cls, job_type: str, handler: JobHandler) -> None:
+        cls.handlers[job_type] = handler
+
+    @classmethod
+    async def _startup(cls) -> None:
+        if cls._workers:
+            raise RuntimeError("Job runner has already been started")
+
+        cls._running = True
+        cls._wakeup = asyncio.Event()
+        cls._workers = [
+            asyncio.create_task(cls._work(), name=f"job-worker-{i}")
+            for i in range(settings.JOB_WORKER_CONCURRENCY)
+        ]
+
+    @classmethod
+    async def _shutdown(cls) -> None:
+        # wait_for may swallow a cancellation racing with a wakeup, the flag still stops the loop
+        cls._running = False
+        for worker in cls._workers:
+            worker.cancel()
+        # Running jobs are released by the workers before they stop
+        await asyncio.gather(*cls._workers, return_exceptions=True)
+        cls._workers = []
+        cls._wakeup = None
+
+    @classmethod
+    def notify(cls) -> None:
+        """Wake the idle workers, called after a job is enqueued by this process"""
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    async def _work(cls) -> None:
+        while cls._running:
+            try:
+                job = await cls.repo.claim_next(cls.owner, settings.JOB_LEASE_SECONDS)
+            except Exception as e:
+                logger.error(f"Error claiming job: {str(e)}")
+                job = None
+
+            if job is None:
+                await cls._wait()
+                continue
+
+            await cls.run_job(job)
+
+    @classmethod
+    async def _wait(cls) -> None:
+        try:
+            await asyncio.wait_for(cls._wakeup.wait(), settings.JOB_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        cls._wakeup.clear()
+
+    @classmethod
+    async def run_job(cls, job: JobEntity) -> None:
+        """Run a job claimed by this process and record the outcome"""
+        job_id = str(job.id)
+        handler = cls.handlers.get(job.type)
+        if handler is None:
+            await cls.repo.fail(job_id, cls.owner, f"No handler for job type {job.type}")
+            return
+
+        async def report(progress: Dict[str, Any]) -> None:
+            await cls.repo.update_progress(job_id, cls.owner, progress, settings.JOB_LEASE_SECONDS)
+
+        renewer = asyncio.create_task(cls._keep_lease(job_id))
+        started_at = time.perf_counter()
+        try:
+            result = await handler(job, report)
+        except asyncio.CancelledError:
+            await asyncio.shield(cls.repo.release(job_id, cls.owner))
+            raise
+        except Exception as e:
+            await cls._handle_failure(job, e)
+        else:
+            await cls.repo.complete(job_id, cls.owner, result or {})
+            Metrics.incr(f"jobs.{job.type}.succeeded")
+        finally:
+            renewer.cancel()
+            Metrics.observe(f"jobs.{job.type}.seconds", time.perf_counter() - started_at)
+
+    @classmethod
+    async def _handle_failure(cls, job: JobEntity, error: Exception) -> None:
+        job_id = str(job.id)
+        message = error.detail if isinstance(error, HTTPException) else str(error)
+        # Client errors (movie or subtitle not found...) will not change on a retry
+        permanent = isinstance(error, HTTPException) and error.status_code < 500
+
+        if permanent or not job.can_retry():
+            logger.error(f"Job {job_id} ({job.type}) failed: {message}")
+            await cls.repo.fail(job_id, cls.owner, message)
+            Metrics.incr(f"jobs.{job.type}.failed")
+            return
+
+        delay = exponential_backoff(
+            job.attempts,
+            settings.JOB_RETRY_BACKOFF_SECONDS,
+            settings.JOB_RETRY_BACKOFF_MAX_SECONDS
+        )
+        logger.warning(f"Job {job_id} ({job.type}) attempt {job.attempts} failed, retrying in {delay}: {message}")
+        await cls.repo.retry(job_id, cls.owner, message, datetime.now(timezone.utc) + delay)
+        Metrics.incr(f"jobs.{job.type}.retried")
+
+    @classmethod
+    async def _keep_lease(cls, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(settings.JOB_LEASE_SECONDS / 3)
+            try:
+                if not await cls.repo.renew_lease(job_id, cls.owner, settings.JOB_LEASE_SECONDS):
+                    logger.warning(f"Lost the lease of job {job_id}")
+                    return
+            except Exception as e:
+                logger.error(f"Error renewing the lease of job {job_id}: {str(e)}")
@@ -1,7 +1,7 @@
 import logging
-from typing import Optional
+from typing import Awaitable, Callable, Optional, TypeVar
 
-from motor.core import AgnosticClient, AgnosticCollection, AgnosticDatabase
+from motor.core import AgnosticClient, AgnosticClientSession, AgnosticCollection, AgnosticDatabase
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from ..core.config import settings
@@ -9,6 +9,8 @@ from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Mongo:
 
@@ -17,6 +19,9 @@ class Mongo:
 
     users: AgnosticCollection = None
 
+    # Multi document transactions need a replica set or a sharded cluster
+    supports_transactions: bool = False
+
     @classmethod
     async def ping(cls) -> None:
         await cls.client.admin.command({"ping": 1})
@@ -26,6 +31,28 @@ class Mongo:
         v = await cls.db.command({"serverStatus": 1})
         return f"Using MongoDB v.{v['version']}"
 
+    @classmethod
+    async def detect_transactions(cls) -> bool:
+        hello = await cls.client.admin.command({"hello": 1})
+        cls.supports_transactions = "setName" in hello or hello.get("msg") == "isdbgrid"
+        return cls.supports_transactions
+
+    @classmethod
+    async def run_in_transaction(cls, callback: Callable[[Optional[AgnosticClientSession]], Awaitable[T]]) -> T:
+        """
+        Await `callback(session)` in a transaction. Write conflicts with a
+        concurrent transaction (TransientTransactionError) run the callback
+        again and an UnknownTransactionCommitResult retries the commit, so
+        the callback may run more than once and must only write through the
+        session. On a standalone server it runs once with session None, its
+        writes are then not atomic.
+        """
+        if not cls.supports_transactions:
+            return await callback(None)
+
+        async with await cls.client.start_session() as session:
+            return await session.with_transaction(callback)
+
     @classmethod
     def _startup(cls) -> None:
         if cls.client is not None:
@@ -38,8 +65,12 @@ class Mongo:
 
         cls.users = cls.db["users"]
         cls.movies_processed = cls.db["movies_processed"]
+        cls.subtitle_contents = cls.db["subtitle_contents"]
         cls.dialogues = cls.db["dialogues"]
         cls.dialogue_practice_history = cls.db["dialogue_practice_history"]
+        cls.transcription_cache = cls.db["transcription_cache"]
+        cls.jobs = cls.db["jobs"]
+        cls.outbox_events = cls.db["outbox_events"]
 
     @classmethod
     def _shutdown(cls) -> None:
@@ -0,0 +1,99 @@
+import logging
+from typing import Any, Dict, List
+
+from pymongo import IndexModel
+
+from app.adapters.cached_audio_processor import CachedAudioProcessor
+from app.core.users.infra.database.repositories import UserMongoRepository
+from app.core.movies.infra.database.repositories import MovieProcessedMongoRepository, SubtitleContentMongoRepository
+from app.core.dialogues.infra.database.repositories import DialogueMongoRepository, DialoguePracticeHistoryMongoRepository
+from app.core.jobs.infra.database.repositories import JobMongoRepository
+from app.core.common.infra.database.repositories import OutboxMongoRepository
+from .mongo import Mongo
+
+logger = logging.getLogger(__name__)
+
+# Repositories, and the adapters owning a collection, declare the indexes their queries rely on
+REPOSITORIES = (
+    UserMongoRepository,
+    MovieProcessedMongoRepository,
+    SubtitleContentMongoRepository,
+    DialogueMongoRepository,
+    DialoguePracticeHistoryMongoRepository,
+    JobMongoRepository,
+    OutboxMongoRepository,
+    CachedAudioProcessor,
+)
+
+
+def get_index_registry() -> Dict[str, List[IndexModel]]:
+    registry: Dict[str, List[IndexModel]] = {}
+    for repository in REPOSITORIES:
+        registry.setdefault(repository.collection_name, []).extend(repository.indexes)
+    return registry
+
+
+async def ensure_indexes() -> None:
+    """
+    Create the declared indexes. Creating an index that already exists with the
+    same definition is a no-op, so this is safe to run on every startup.
+    """
+    for collection_name, indexes in get_index_registry().items():
+        # Collections queried by _id only are still reported
+        if not indexes:
+            continue
+        try:
+            await Mongo.db[collection_name].create_indexes(indexes)
+        except Exception as e:
+            # A conflicting definition or duplicated data must not keep the API down
+            logger.error(f"Error creating indexes for {collection_name}: {str(e)}")
+
+
+async def get_index_report() -> Dict[str, Dict[str, Any]]:
+    """
+    Compare the declared indexes with the ones in the database.
+
+    missing: declared but not created
+    undeclared: created but not declared by any repository
+    unused: created but never used since the server started ($indexStats)
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+
+    for collection_name, indexes in get_index_registry().items():
+        collection = Mongo.db[collection_name]
+        existing = await collection.index_information()
+        existing_keys = {_key_of(info["key"], info.get("weights")): name for name, info in existing.items()}
+        declared_keys = {_key_of(index.document["key"].items()): index.document["name"] for index in indexes}
+
+        usage = {}
+        async for stats in collection.aggregate([{"$indexStats": {}}]):
+            usage[stats["name"]] = stats["accesses"]["ops"]
+
+        report[collection_name] = {
+            "missing": [name for key, name in declared_keys.items() if key not in existing_keys],
+            "undeclared": [
+                name for key, name in existing_keys.items()
+                if key not in declared_keys and name != "_id_"
+            ],
+            "unused": [
+                name for name in existing
+                if name != "_id_" and usage.get(name, 0) == 0
+            ],
+            "usage": usage,
+        }
+
+    return report
+
+
+def _key_of(key, weights: Dict[str, int] = None) -> tuple:
+    key = list(key)
+    # Text indexes are reported as _fts/_ftsx, the indexed fields are in the weights
+    if weights or any(direction == "text" for _, direction in key):
+        fields = weights or [field for field, direction in key if direction == "text"]
+        return tuple((field, "text") for field in sorted(fields))
+
+    # The server may report numeric directions as floats
+    return tuple(
+        (field, int(direction) if isinstance(direction, (int, float)) else direction)
+        for field, direction in key
+    )
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Type
+
+from app.core.config import settings
+from app.core.common.domain.events import DomainEvent, EventDispatcher
+from app.core.common.infra.database.repositories import OutboxMongoRepository
+from app.util.backoff import exponential_backoff
+from app.util.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Dispatches the events of the Mongo `outbox_events` collection, written with
+    the aggregate they come from. Batches are leased to this process, an event
+    whose handlers fail is retried with exponential backoff and the batch of a
+    process that died is taken again once its lease expires: delivery is at
+    least once, handlers deduplicate on the event_id.
+    """
+    repo = OutboxMongoRepository()
+    event_types: Dict[str, Type[DomainEvent]] = {}
+    owner: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    dispatcher: Optional[EventDispatcher] = None
+    _task: Optional[asyncio.Task] = None
+    _wakeup: Optional[asyncio.Event] = None
+    _running: bool = False
+
+    @classmethod
+    async def _startup(cls, dispatcher: EventDispatcher, event_types: Dict[str, Type[DomainEvent]]) -> None:
+        if cls._task is not None:
+            raise RuntimeError("Outbox relay has already been started")
+
+        cls.dispatcher = dispatcher
+        cls.event_types = dict(event_types)
+        cls._running = True
+        cls._wakeup = asyncio.Event()
+        cls._task = asyncio.create_task(cls._relay(), name="outbox-relay")
+
+    @classmethod
+    async def _shutdown(cls) -> None:
+        if cls._task is None:
+            return
+
+        # The batch being dispatched is abandoned, its lease expires and another relay takes it
+        cls._running = False
+        cls._task.cancel()
+        await asyncio.gather(cls._task, return_exceptions=True)
+        cls._task = None
+        cls._wakeup = None
+
+    @classmethod
+    def notify(cls) -> None:
+        """Wake the idle relay, called after events are written to the outbox by this process"""
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    async def _relay(cls) -> None:
+        while cls._running:
+            try:
+                claimed = await cls.relay_batch()
+            except Exception as e:
+                logger.error(f"Error relaying outbox events: {str(e)}")
+                claimed = 0
+
+            # A full batch may not be the last one
+            if claimed < settings.OUTBOX_BATCH_SIZE:
+                await cls._wait()
+
+    @classmethod
+    async def _wait(cls) -> None:
+        try:
+            await asyncio.wait_for(cls._wakeup.wait(), settings.OUTBOX_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        cls._wakeup.clear()
+
+    @classmethod
+    async def relay_batch(cls) -> int:
+        """Claim and dispatch a batch of due events, returns the number of events claimed"""
+        docs = await cls.repo.claim_batch(
+            cls.owner,
+            settings.OUTBOX_BATCH_SIZE,
+            settings.OUTBOX_LEASE_SECONDS,
+            settings.OUTBOX_MAX_ATTEMPTS
+        )
+
+        dispatched = []
+        # In order, the events of an aggregate are handled as they happened
+        for doc in docs:
+            if await cls._dispatch(doc):
+                dispatched.append(doc["_id"])
+
+        if dispatched:
+            await cls.repo.mark_dispatched(dispatched, cls.owner)
+            Metrics.incr("outbox.dispatched", len(dispatched))
+        return len(docs)
+
+    @classmethod
+    async def _dispatch(cls, doc: Dict[str, Any]) -> bool:
+        event_id = doc["_id"]
+        event_class = cls.event_types.get(doc["event_type"])
+        if event_class is None:
+            await cls.repo.fail(event_id, cls.owner, f"Unknown event type {doc['event_type']}")
+            Metrics.incr("outbox.failed")
+            return False
+
+        event = event_class.from_dict({
+            "event_id": event_id,
+            "aggregate_id": doc["aggregate_id"],
+            "occurred_at": doc["occurred_at"],
+            "payload": doc["payload"],
+        })
+        if await cls.dispatcher.dispatch_all([event]):
+            return True
+
+        message = f"A handler of {event.event_type} failed"
+        if doc["attempts"] >= settings.OUTBOX_MAX_ATTEMPTS:
+            logger.error(f"Outbox event {event_id} ({event.event_type}) failed: {message}")
+            await cls.repo.fail(event_id, cls.owner, message)
+            Metrics.incr("outbox.failed")
+            return False
+
+        delay = exponential_backoff(
+            doc["attempts"],
+            settings.OUTBOX_RETRY_BACKOFF_SECONDS,
+            settings.OUTBOX_RETRY_BACKOFF_MAX_SECONDS
+        )
+        logger.warning(f"Outbox event {event_id} ({event.event_type}) attempt {doc['attempts']} failed, retrying in {delay}")
+        await cls.repo.retry(event_id, cls.owner, message, datetime.now(timezone.utc) + delay)
+        Metrics.incr("outbox.retried")
+        return False
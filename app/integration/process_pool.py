@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPool:
+    """
+    Worker processes for CPU bound work that would block the event loop.
+    Functions and arguments are pickled, send plain data, not entities.
+    Without a pool (max_workers=0) the function runs on the calling thread.
+    """
+    executor: Optional[ProcessPoolExecutor] = None
+    max_workers: int = 0
+
+    @classmethod
+    def _startup(cls, max_workers: int) -> None:
+        if cls.executor is not None:
+            raise RuntimeError("Process pool has already been started")
+
+        cls.max_workers = max_workers
+        if max_workers > 0:
+            cls.executor = cls._create_executor()
+
+    @classmethod
+    def _shutdown(cls) -> None:
+        if cls.executor is None:
+            return
+
+        cls.executor.shutdown(wait=True, cancel_futures=True)
+        cls.executor = None
+
+    @classmethod
+    async def run(cls, fn: Callable[..., T], *args: Any) -> T:
+        if cls.executor is None:
+            return fn(*args)
+
+        executor = cls.executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM kill...), the executor can not be used anymore. The
+            # other calls on it fail too, only the first one replaces it
+            if cls.executor is executor:
+                logger.error("Process pool is broken, starting a new one")
+                executor.shutdown(wait=False, cancel_futures=True)
+                cls.executor = cls._create_executor()
+            raise
+
+    @classmethod
+    def _create_executor(cls) -> ProcessPoolExecutor:
+        # Workers are forked from a clean server process, not from the API
+        # process and its threads (Mongo, audio processor...)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(max_workers=cls.max_workers, mp_context=context)
@@ -0,0 +1,6 @@
+from datetime import timedelta
+
+
+def exponential_backoff(attempts: int, base_seconds: float, max_seconds: float) -> timedelta:
+    """Delay before the next attempt: base, 2 * base, 4 * base... capped at max_seconds"""
+    return timedelta(seconds=min(max_seconds, base_seconds * 2 ** max(0, attempts - 1)))
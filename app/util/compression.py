@@ -0,0 +1,49 @@
+"""
+Compression of stored text blobs. zstandard is used when it is installed,
+gzip otherwise; the encoding is stored next to the data, so blobs written
+with either one can always be read back (zstd ones only with zstandard).
+"""
+import gzip
+from typing import Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+ZSTD = "zstd"
+GZIP = "gzip"
+IDENTITY = "identity"
+
+# Blobs are written once and read rarely, favour the ratio
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 9
+
+
+def preferred_encoding() -> str:
+    return ZSTD if zstandard is not None else GZIP
+
+
+def compress(data: bytes, encoding: Optional[str] = None) -> Tuple[str, bytes]:
+    """Returns (encoding, compressed data)"""
+    encoding = encoding or preferred_encoding()
+    if encoding == ZSTD:
+        return ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if encoding == GZIP:
+        # mtime=0 keeps the output deterministic
+        return GZIP, gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == IDENTITY:
+        return IDENTITY, data
+    raise ValueError(f"Unknown encoding {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd compressed data")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if encoding == GZIP:
+        return gzip.decompress(data)
+    if encoding == IDENTITY:
+        return data
+    raise ValueError(f"Unknown encoding {encoding}")
@@ -0,0 +1,67 @@
+"""
+Opaque pagination cursors.
+
+A keyset cursor stores the sort key values of the last item of a page,
+the next page starts right after them with a range predicate, so its cost
+does not grow with the page number. Listings that can not be expressed as
+a range (e.g. relevance ranked search) use an offset cursor instead.
+"""
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import json_util
+from bson.json_util import CANONICAL_JSON_OPTIONS
+
+SortSpec = Sequence[Tuple[str, int]]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: Optional[List[Any]] = None, offset: Optional[int] = None) -> str:
+    payload = {"k": values} if values is not None else {"o": offset}
+    raw = json_util.dumps(payload, json_options=CANONICAL_JSON_OPTIONS).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """Returns {"k": [sort values]} or {"o": offset}"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json_util.loads(raw, json_options=CANONICAL_JSON_OPTIONS)
+    except Exception:
+        raise InvalidCursorError("Invalid cursor")
+
+    if not isinstance(payload, dict) or not (isinstance(payload.get("k"), list) or _is_offset(payload.get("o"))):
+        raise InvalidCursorError("Invalid cursor")
+    return payload
+
+
+def _is_offset(value: Any) -> bool:
+    # bool is an int subclass, {"o": true} would be read as offset 1
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def keyset_filter(sort: SortSpec, values: List[Any]) -> Dict[str, Any]:
+    """
+    Range predicate selecting the documents after `values` in `sort` order,
+    e.g. for [(completed_at, -1), (_id, -1)]:
+    completed_at < v0 OR (completed_at == v0 AND _id < v1)
+    """
+    if len(values) != len(sort):
+        raise InvalidCursorError("Cursor does not match the listing order")
+
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {previous: values[j] for j, (previous, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[i]}
+        clauses.append(clause)
+
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def with_keyset(query: Dict[str, Any], sort: SortSpec, values: List[Any]) -> Dict[str, Any]:
+    """Combine the listing filters with the keyset predicate"""
+    predicate = keyset_filter(sort, values)
+    return {"$and": [query, predicate]} if query else predicate
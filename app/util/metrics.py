@@ -0,0 +1,90 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Tuple
+
+
+class Histogram:
+    """Fixed-bucket histogram, buckets are upper bounds in seconds"""
+
+    default_buckets: Tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+    )
+
+    def __init__(self, buckets: Tuple[float, ...] = None):
+        self.buckets = buckets or self.default_buckets
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound}": count for bound, count in zip(self.buckets, self.bucket_counts)}
+        buckets["le_inf"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "buckets": buckets,
+        }
+
+
+class Metrics:
+    """Process-wide registry of counters, gauges and histograms"""
+
+    _lock = threading.Lock()
+    _counters: Dict[str, float] = {}
+    _gauges: Dict[str, float] = {}
+    _histograms: Dict[str, Histogram] = {}
+
+    @classmethod
+    def incr(cls, name: str, value: float = 1) -> None:
+        with cls._lock:
+            cls._counters[name] = cls._counters.get(name, 0) + value
+
+    @classmethod
+    def set_gauge(cls, name: str, value: float) -> None:
+        with cls._lock:
+            cls._gauges[name] = value
+
+    @classmethod
+    def add_gauge(cls, name: str, delta: float) -> None:
+        with cls._lock:
+            cls._gauges[name] = cls._gauges.get(name, 0) + delta
+
+    @classmethod
+    def observe(cls, name: str, value: float) -> None:
+        with cls._lock:
+            if name not in cls._histograms:
+                cls._histograms[name] = Histogram()
+            cls._histograms[name].observe(value)
+
+    @classmethod
+    def get_counter(cls, name: str) -> float:
+        return cls._counters.get(name, 0)
+
+    @classmethod
+    def get_gauge(cls, name: str) -> float:
+        return cls._gauges.get(name, 0)
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Any]:
+        with cls._lock:
+            return {
+                "counters": dict(cls._counters),
+                "gauges": dict(cls._gauges),
+                "histograms": {name: hist.snapshot() for name, hist in cls._histograms.items()},
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._counters.clear()
+            cls._gauges.clear()
+            cls._histograms.clear()
@@ -3,4 +3,16 @@ from choicesenum import ChoicesEnum
 
 class SubtitleMoviesEnum(ChoicesEnum):
 
-    OPEN_SUBTITLES = 'OpenSubTitles'
\ No newline at end of file
+    OPEN_SUBTITLES = 'OpenSubTitles'
+
+class AudioProcessorsEnum(ChoicesEnum):
+
+    GOOGLE = 'Google'
+    FAKE = 'Fake'
+
+class SubtitleFormatsEnum(ChoicesEnum):
+
+    SRT = 'srt'
+    VTT = 'vtt'
+    ASS = 'ass'
+    MICRODVD = 'sub'
@@ -0,0 +1,72 @@
+"""
+Subtitle parsers. Every format is read in a single pass and produces the same
+stream of DialogueLine, the format is detected from the first lines when it
+is not given.
+"""
+import re
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+from app.util.patterns import SubtitleFormatsEnum
+from .ass import iter_ass_lines
+from .microdvd import iter_microdvd_lines
+from .srt import iter_srt_lines, parse_timing
+from .text import clean_text, identify_character, iter_text_lines, merge_consecutive_lines
+from .vtt import iter_vtt_lines
+
+SubtitleParser = Callable[[Iterable[str]], Iterator[DialogueLine]]
+
+PARSERS: Dict[SubtitleFormatsEnum, SubtitleParser] = {
+    SubtitleFormatsEnum.SRT: iter_srt_lines,
+    SubtitleFormatsEnum.VTT: iter_vtt_lines,
+    SubtitleFormatsEnum.ASS: iter_ass_lines,
+    SubtitleFormatsEnum.MICRODVD: iter_microdvd_lines,
+}
+
+# Lines read to detect the format
+DETECTION_LINES = 50
+MICRODVD_CUE = re.compile(r'\{\d+\}\{\d*\}')
+
+
+def detect_format(lines: List[str]) -> SubtitleFormatsEnum:
+    """Guess the format from the first stripped lines of a file, SRT when unsure"""
+    for line in lines:
+        if not line:
+            continue
+        if line.startswith("WEBVTT"):
+            return SubtitleFormatsEnum.VTT
+        if line in ("[Script Info]", "[Events]", "[V4+ Styles]", "[V4 Styles]") or line.startswith("Dialogue:"):
+            return SubtitleFormatsEnum.ASS
+        if MICRODVD_CUE.match(line):
+            return SubtitleFormatsEnum.MICRODVD
+        if "-->" in line:
+            return SubtitleFormatsEnum.SRT
+    return SubtitleFormatsEnum.SRT
+
+
+def iter_dialogue_lines(
+    content: Union[str, Iterable[str]],
+    subtitle_format: Optional[SubtitleFormatsEnum] = None
+) -> Iterator[DialogueLine]:
+    """Yield the dialogue lines of subtitle content of any supported format"""
+    lines = iter_text_lines(content)
+    head = list(islice(lines, DETECTION_LINES))
+    parser = PARSERS[subtitle_format or detect_format(head)]
+    return parser(chain(head, lines))
+
+
+__all__ = [
+    "PARSERS",
+    "detect_format",
+    "iter_dialogue_lines",
+    "iter_srt_lines",
+    "iter_vtt_lines",
+    "iter_ass_lines",
+    "iter_microdvd_lines",
+    "parse_timing",
+    "clean_text",
+    "identify_character",
+    "iter_text_lines",
+    "merge_consecutive_lines",
+]
@@ -0,0 +1,70 @@
+"""
+Single pass Advanced SubStation Alpha (ASS/SSA) parser.
+
+Only the Dialogue events of the [Events] section are read, using the field
+order of its Format line. The Name field is the character of the line,
+override blocks ({\\i1}, {\\pos(...)}) are removed and \\N starts a new line.
+"""
+import re
+from typing import Iterable, Iterator, List, Optional, Union
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+from .text import CueBuilder, iter_text_lines
+
+# Format of ASS v4+ and SSA v4 (Marked instead of Layer) when the Format line is missing
+DEFAULT_FIELDS = ["layer", "start", "end", "style", "name", "marginl", "marginr", "marginv", "effect", "text"]
+TIME_PATTERN = re.compile(r'(\d+):(\d{1,2}):(\d{1,2})[.:](\d{1,3})')
+OVERRIDE_BLOCK = re.compile(r'\{[^}]*\}')
+LINE_BREAK = re.compile(r'\\[Nn]')
+# {\p1} switches to vector drawing, the text is not dialogue
+DRAWING_MODE = re.compile(r'\{[^}]*\\p[1-9]')
+
+
+def parse_time(value: str) -> Optional[float]:
+    """Convert an ASS H:MM:SS.cc time to seconds"""
+    match = TIME_PATTERN.match(value.strip())
+    if not match:
+        return None
+
+    hours, minutes, seconds, fraction = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction) / 10 ** len(fraction)
+
+
+def iter_ass_lines(content: Union[str, Iterable[str]]) -> Iterator[DialogueLine]:
+    """Yield the dialogue lines of ASS/SSA content, given as a string or any iterable of lines"""
+    in_events = False
+    fields: List[str] = DEFAULT_FIELDS
+
+    for line in iter_text_lines(content):
+        if line.startswith("["):
+            in_events = line.lower() == "[events]"
+            continue
+
+        if not in_events:
+            continue
+
+        if line.startswith("Format:"):
+            fields = [field.strip().lower() for field in line[len("Format:"):].split(",")]
+            continue
+
+        if not line.startswith("Dialogue:"):
+            # Comment events and anything else
+            continue
+
+        values = line[len("Dialogue:"):].split(",", len(fields) - 1)
+        if len(values) != len(fields):
+            continue
+        event = dict(zip(fields, values))
+
+        start_time, end_time = parse_time(event.get("start", "")), parse_time(event.get("end", ""))
+        text = event.get("text", "")
+        if start_time is None or end_time is None or end_time < start_time or DRAWING_MODE.search(text):
+            continue
+
+        cue = CueBuilder(start_time, end_time)
+        speaker = event.get("name", "").strip()
+        text = OVERRIDE_BLOCK.sub("", text).replace("\\h", " ")
+        for part in LINE_BREAK.split(text):
+            dialogue_line = cue.add(part.strip(), speaker)
+            if dialogue_line is not None:
+                yield dialogue_line
@@ -0,0 +1,55 @@
+"""
+Single pass MicroDVD (.sub) parser.
+
+Cues are {start frame}{end frame}Text|Second line. Frames are converted with
+the frame rate of a leading {1}{1}23.976 cue when there is one, otherwise
+with DEFAULT_FPS.
+"""
+import re
+from typing import Iterable, Iterator, Optional, Union
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+from .text import CueBuilder, iter_text_lines
+
+DEFAULT_FPS = 23.976
+CUE_PATTERN = re.compile(r'\{(\d+)\}\{(\d*)\}(.*)')
+# {y:i}, {c:$0000FF}... formatting codes
+CONTROL_CODE = re.compile(r'\{[a-zA-Z]:[^}]*\}')
+
+
+def iter_microdvd_lines(content: Union[str, Iterable[str]], fps: float = DEFAULT_FPS) -> Iterator[DialogueLine]:
+    """Yield the dialogue lines of MicroDVD content, given as a string or any iterable of lines"""
+    first_cue = True
+
+    for line in iter_text_lines(content):
+        match = CUE_PATTERN.match(line)
+        if not match:
+            continue
+
+        start_frame, end_frame, text = match.groups()
+        if first_cue:
+            first_cue = False
+            frame_rate = _frame_rate(text) if start_frame in ("0", "1") else None
+            if frame_rate:
+                fps = frame_rate
+                continue
+
+        start_time = int(start_frame) / fps
+        end_time = int(end_frame) / fps if end_frame else start_time
+        if end_time < start_time:
+            continue
+
+        cue = CueBuilder(start_time, end_time)
+        for part in CONTROL_CODE.sub("", text).split("|"):
+            # A leading slash is an italic marker
+            dialogue_line = cue.add(part.strip().lstrip("/").strip())
+            if dialogue_line is not None:
+                yield dialogue_line
+
+
+def _frame_rate(text: str) -> Optional[float]:
+    try:
+        frame_rate = float(text.strip())
+    except ValueError:
+        return None
+    return frame_rate if frame_rate > 0 else None
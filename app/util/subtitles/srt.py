@@ -0,0 +1,81 @@
+"""
+Single pass SubRip (SRT) tokenizer.
+
+The content is read line by line, a cue starts at its timing line and ends at
+the next blank line, so the file is never split into blocks and dialogue lines
+are produced as soon as their text is read. CRLF line endings, a leading BOM,
+indented lines, missing cue numbers and blocks without a valid timing line are
+tolerated, broken cues are skipped instead of producing zero timestamps.
+"""
+import re
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+from .text import CueBuilder, iter_text_lines
+
+# 00:02:19,723 --> 00:02:20,929, a dot separator and short fractions are accepted
+TIMING_PATTERN = re.compile(
+    r'(\d+):(\d{1,2}):(\d{1,2})[,.](\d{1,3})\s*-->\s*(\d+):(\d{1,2}):(\d{1,2})[,.](\d{1,3})'
+)
+
+
+def parse_timing(line: str) -> Optional[Tuple[float, float]]:
+    """Convert an SRT timing line to (start, end) seconds, None when it is not one"""
+    match = TIMING_PATTERN.match(line)
+    if not match:
+        return None
+
+    h1, m1, s1, ms1, h2, m2, s2, ms2 = match.groups()
+    start_time = int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1.ljust(3, '0')) / 1000
+    end_time = int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2.ljust(3, '0')) / 1000
+    if end_time < start_time:
+        return None
+    return start_time, end_time
+
+
+def iter_srt_lines(content: Union[str, Iterable[str]]) -> Iterator[DialogueLine]:
+    """
+    Yield the dialogue lines of SRT content, given as a string or as any
+    iterable of lines (e.g. a text stream)
+    """
+    cue: Optional[CueBuilder] = None
+    # A digit only line may be the number of the next cue when a blank line is missing
+    pending: Optional[str] = None
+
+    for line in iter_text_lines(content):
+        if not line:
+            if cue is not None and pending is not None:
+                dialogue_line = cue.add(pending)
+                if dialogue_line is not None:
+                    yield dialogue_line
+            cue, pending = None, None
+            continue
+
+        timing = parse_timing(line) if line[0].isdigit() else None
+        if timing is not None:
+            # The pending line was the number of this cue
+            cue, pending = CueBuilder(*timing), None
+            continue
+
+        if cue is None:
+            # Cue number or garbage outside a cue
+            continue
+
+        if pending is not None:
+            dialogue_line = cue.add(pending)
+            pending = None
+            if dialogue_line is not None:
+                yield dialogue_line
+
+        if line.isdigit():
+            pending = line
+            continue
+
+        dialogue_line = cue.add(line)
+        if dialogue_line is not None:
+            yield dialogue_line
+
+    if cue is not None and pending is not None:
+        dialogue_line = cue.add(pending)
+        if dialogue_line is not None:
+            yield dialogue_line
@@ -0,0 +1,103 @@
+"""Cue text handling shared by the subtitle parsers"""
+import re
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+
+# JOHN: Hello there | John: Hello there | [JOHN] Hello there | (JOHN) Hello there,
+# the alternatives are tried in this order like separate patterns would be
+CHARACTER_PATTERN = re.compile(
+    r'(?:([A-Z][A-Z\s]+):|([A-Z][a-z]+):|\[([^\]]+)\]|\(([^\)]+)\))\s*(.*)'
+)
+HTML_TAG = re.compile('<.*?>')
+# {\an8} positioning or {\i1} style overrides, also found in SRT files
+OVERRIDE_TAG = re.compile(r'\{\\[^}]*\}')
+REMOVED_CHARS = str.maketrans('', '', '.-')
+
+# Lines of the same character closer than this are merged
+MERGE_MAX_GAP_SECONDS = 2.0
+
+BOM = '\ufeff'
+
+
+def iter_text_lines(content: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Stripped lines of a string or of any iterable of lines, without the BOM"""
+    lines = content.splitlines() if isinstance(content, str) else content
+    first = True
+    for line in lines:
+        if first:
+            line = line.lstrip(BOM)
+            first = False
+        yield line.strip()
+
+
+def clean_text(text: str) -> str:
+    """Remove HTML and override tags, dots and dashes"""
+    if '<' in text:
+        text = HTML_TAG.sub('', text)
+    if '{' in text:
+        text = OVERRIDE_TAG.sub('', text)
+    return text.translate(REMOVED_CHARS)
+
+
+def identify_character(text: str) -> Tuple[str, str]:
+    """
+    Identify character name and dialogue from a stripped line of text
+    Returns tuple of (character_name, dialogue_text)
+    """
+    match = CHARACTER_PATTERN.match(text)
+    if match:
+        character = (match.group(1) or match.group(2) or match.group(3) or match.group(4)).strip()
+        return character, clean_text(match.group(5).strip())
+
+    return "", clean_text(text)
+
+
+class CueBuilder:
+    """
+    Turns the text lines of one cue into dialogue lines. A line without a
+    character name is said by the previous character of the same cue.
+    """
+    __slots__ = ("start_time", "end_time", "_last_character")
+
+    def __init__(self, start_time: float, end_time: float):
+        self.start_time = start_time
+        self.end_time = end_time
+        self._last_character: Optional[str] = None
+
+    def add(self, text: str, speaker: str = "") -> Optional[DialogueLine]:
+        """Add a stripped line of text, `speaker` is given by formats with a speaker field"""
+        if speaker:
+            character, dialogue = speaker, clean_text(text)
+        else:
+            character, dialogue = identify_character(text)
+
+        if character and dialogue:
+            self._last_character = character
+        elif self._last_character is not None and character == "":
+            character = self._last_character
+        else:
+            character = ""
+            self._last_character = character
+
+        if not dialogue:
+            return None
+        return DialogueLine(character, dialogue, self.start_time, self.end_time)
+
+
+def merge_consecutive_lines(lines: Iterable[DialogueLine]) -> Iterator[DialogueLine]:
+    """Merge consecutive lines from the same character"""
+    current = None
+    for line in lines:
+        if current is None:
+            current = line
+        elif (current.character and current.character == line.character and
+              line.start_time - current.end_time < MERGE_MAX_GAP_SECONDS):
+            current.text += " " + line.text
+            current.end_time = line.end_time
+        else:
+            yield current
+            current = line
+
+    if current is not None:
+        yield current
@@ -0,0 +1,71 @@
+"""
+Single pass WebVTT parser.
+
+Cue identifiers, cue settings, the header and the NOTE, STYLE and REGION
+blocks are skipped. Voice spans (<v Mary>Hello</v>) give the character of the
+line, other lines go through the same character detection as SRT.
+"""
+import html
+import re
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+from .text import HTML_TAG, CueBuilder, iter_text_lines
+
+# 01:02:03.456 --> 01:02:04.000 align:start, the hours are optional
+TIMING_PATTERN = re.compile(
+    r'(?:(\d+):)?(\d{1,2}):(\d{1,2})[.,](\d{1,3})\s*-->\s*(?:(\d+):)?(\d{1,2}):(\d{1,2})[.,](\d{1,3})'
+)
+VOICE_PATTERN = re.compile(r'<v(?:\.[^\s>]*)?\s+([^>]+)>')
+SKIPPED_BLOCKS = ("WEBVTT", "NOTE", "STYLE", "REGION")
+
+
+def parse_timing(line: str) -> Optional[Tuple[float, float]]:
+    """Convert a WebVTT timing line to (start, end) seconds, None when it is not one"""
+    match = TIMING_PATTERN.match(line)
+    if not match:
+        return None
+
+    h1, m1, s1, ms1, h2, m2, s2, ms2 = match.groups()
+    start_time = int(h1 or 0) * 3600 + int(m1) * 60 + int(s1) + int(ms1.ljust(3, '0')) / 1000
+    end_time = int(h2 or 0) * 3600 + int(m2) * 60 + int(s2) + int(ms2.ljust(3, '0')) / 1000
+    if end_time < start_time:
+        return None
+    return start_time, end_time
+
+
+def iter_vtt_lines(content: Union[str, Iterable[str]]) -> Iterator[DialogueLine]:
+    """Yield the dialogue lines of WebVTT content, given as a string or any iterable of lines"""
+    cue: Optional[CueBuilder] = None
+    skipping = False
+    block_start = True
+
+    for line in iter_text_lines(content):
+        if not line:
+            cue, skipping, block_start = None, False, True
+            continue
+
+        if block_start:
+            block_start = False
+            if line.startswith(SKIPPED_BLOCKS) and "-->" not in line:
+                skipping = True
+                continue
+
+        if skipping:
+            continue
+
+        if cue is None:
+            # Cue identifier before the timing line, or garbage
+            timing = parse_timing(line) if "-->" in line else None
+            if timing is not None:
+                cue = CueBuilder(*timing)
+            continue
+
+        voice = VOICE_PATTERN.search(line)
+        if '<' in line:
+            line = HTML_TAG.sub('', line)
+        if '&' in line:
+            line = html.unescape(line)
+        dialogue_line = cue.add(line.strip(), voice.group(1).strip() if voice else "")
+        if dialogue_line is not None:
+            yield dialogue_line
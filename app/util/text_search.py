@@ -0,0 +1,135 @@
+"""
+Query parsing and match highlighting for the dialogue full-text search.
+
+The ranking itself is done by the MongoDB text index. This module turns the
+user input into a safe `$search` string and finds where the query matched
+inside each line, using the same normalization (lower case, no accents,
+stop words removed, light English stemming) for the query and the text.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+(?:'\w+)*")
+PHRASE_PATTERN = re.compile(r'"([^"]*)"')
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "if", "in",
+    "into", "is", "it", "no", "not", "of", "on", "or", "such", "that", "the",
+    "their", "then", "there", "these", "they", "this", "to", "was", "will", "with",
+})
+
+# Longest suffixes first, (suffix, replacement, minimum stem length)
+SUFFIXES = (
+    ("ational", "ate", 2), ("fulness", "ful", 2), ("iveness", "ive", 2),
+    ("ization", "ize", 2), ("ations", "ate", 2), ("ation", "ate", 2),
+    ("ingly", "", 3), ("edly", "", 3), ("ness", "", 3), ("ment", "", 4),
+    ("sses", "ss", 2), ("ies", "y", 2), ("ing", "", 3), ("ied", "y", 2),
+    ("ly", "", 3), ("ed", "", 3), ("es", "", 3), ("s", "", 3),
+)
+
+
+@dataclass
+class SearchQuery:
+    terms: List[str] = field(default_factory=list)
+    phrases: List[List[str]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not self.terms and not self.phrases
+
+
+def normalize(token: str) -> str:
+    """Lower case and strip accents and possessive endings"""
+    token = unicodedata.normalize("NFKD", token.lower())
+    token = "".join(char for char in token if not unicodedata.combining(char))
+    if token.endswith("'s"):
+        token = token[:-2]
+    return token.replace("'", "")
+
+
+def stem(token: str) -> str:
+    for suffix, replacement, min_length in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= min_length:
+            if suffix == "s" and token.endswith(("ss", "us", "is")):
+                return token
+            token = token[:-len(suffix)] + replacement
+            # running -> run, stopped -> stop
+            if suffix in ("ing", "ed") and len(token) > 2 and token[-1] == token[-2] and token[-1] not in "aeioulsz":
+                token = token[:-1]
+            return token
+    return token
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Returns (stemmed token, start, end) for every word in the text"""
+    return [
+        (stem(normalize(match.group())), match.start(), match.end())
+        for match in TOKEN_PATTERN.finditer(text)
+    ]
+
+
+def parse_query(search: str) -> SearchQuery:
+    """Split the user input into free terms and "quoted phrases" of stemmed tokens"""
+    query = SearchQuery()
+
+    for phrase in PHRASE_PATTERN.findall(search):
+        tokens = [token for token, _, _ in tokenize(phrase)]
+        if tokens:
+            query.phrases.append(tokens)
+
+    rest = PHRASE_PATTERN.sub(" ", search).replace('"', " ")
+    for token, _, _ in tokenize(rest):
+        if token not in STOP_WORDS and token not in query.terms:
+            query.terms.append(token)
+
+    return query
+
+
+def to_mongo_text_search(search: str) -> str:
+    """
+    Build a $search string from the user input. Only words and quoted phrases
+    are kept, so the input can never inject a negation or break the quoting.
+    """
+    parts = []
+    for phrase in PHRASE_PATTERN.findall(search):
+        words = TOKEN_PATTERN.findall(phrase)
+        if words:
+            parts.append('"' + " ".join(words) + '"')
+
+    rest = PHRASE_PATTERN.sub(" ", search)
+    parts.extend(TOKEN_PATTERN.findall(rest))
+    return " ".join(parts)
+
+
+def find_highlights(text: str, query: SearchQuery) -> List[Tuple[int, int]]:
+    """Character ranges of the text matching a query term or phrase, merged and sorted"""
+    tokens = tokenize(text)
+    ranges = []
+
+    terms = set(query.terms)
+    for token, start, end in tokens:
+        if token in terms:
+            ranges.append((start, end))
+
+    stems = [token for token, _, _ in tokens]
+    for phrase in query.phrases:
+        size = len(phrase)
+        for i in range(len(stems) - size + 1):
+            if stems[i:i + size] == phrase:
+                ranges.append((tokens[i][1], tokens[i + size - 1][2]))
+
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def find_literal_highlights(text: str, search: str) -> List[Tuple[int, int]]:
+    """Character ranges of case-insensitive occurrences of the raw input, used by the regex mode"""
+    if not search:
+        return []
+    return [(match.start(), match.end()) for match in re.finditer(re.escape(search), text, re.IGNORECASE)]
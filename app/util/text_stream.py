@@ -0,0 +1,85 @@
+"""
+Incremental decoding of downloaded text files.
+
+The encoding is detected once from the first KB (BOM, declared charset,
+UTF-8 validity) and the rest of the body is decoded chunk by chunk, so
+lines are available while the download is still running and the raw
+body is never held in memory as a whole.
+"""
+import codecs
+from typing import AsyncIterator, Optional
+
+DETECTION_BYTES = 1024
+# Most non UTF-8 subtitles are Windows-1252, which also decodes any byte sequence
+FALLBACK_ENCODING = "cp1252"
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+class TextTooLargeError(ValueError):
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Text is larger than {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+def detect_encoding(head: bytes, declared: Optional[str] = None) -> str:
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+
+    if declared:
+        try:
+            return codecs.lookup(declared).name
+        except LookupError:
+            pass
+
+    try:
+        # The head may end in the middle of a multi-byte character
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+
+async def iter_decoded_lines(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    declared_encoding: Optional[str] = None
+) -> AsyncIterator[str]:
+    """Decode a byte stream into lines (with their line ending), raises TextTooLargeError past max_bytes"""
+    head = b""
+    decoder = None
+    pending = ""
+    received = 0
+
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise TextTooLargeError(max_bytes)
+
+        if decoder is None:
+            head += chunk
+            if len(head) < DETECTION_BYTES:
+                continue
+            chunk, head = head, b""
+            decoder = codecs.getincrementaldecoder(detect_encoding(chunk, declared_encoding))(errors="replace")
+
+        text = pending + decoder.decode(chunk)
+        lines = text.splitlines(keepends=True)
+        # The last line may continue in the next chunk
+        pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        for line in lines:
+            yield line
+
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder(detect_encoding(head, declared_encoding))(errors="replace")
+        pending += decoder.decode(head)
+
+    text = pending + decoder.decode(b"", final=True)
+    for line in text.splitlines(keepends=True):
+        yield line
@@ -0,0 +1,138 @@
+"""Minimal EBML/Matroska reader used to probe the duration of WebM uploads.
+
+Only the elements needed to find the duration are interpreted, everything else
+is skipped by size, so the cost is proportional to the number of elements and
+not to the size of the audio payload. The buffer is never copied.
+"""
+import struct
+from typing import Optional, Tuple, Union
+
+EBML_HEADER_ID = 0x1A45DFA3
+SEGMENT_ID = 0x18538067
+INFO_ID = 0x1549A966
+TIMECODE_SCALE_ID = 0x2AD7B1
+DURATION_ID = 0x4489
+CLUSTER_ID = 0x1F43B675
+CLUSTER_TIMECODE_ID = 0xE7
+SIMPLE_BLOCK_ID = 0xA3
+BLOCK_GROUP_ID = 0xA0
+BLOCK_ID = 0xA1
+
+# Master elements we descend into instead of skipping
+CONTAINER_IDS = frozenset({SEGMENT_ID, INFO_ID, CLUSTER_ID, BLOCK_GROUP_ID})
+
+DEFAULT_TIMECODE_SCALE_NS = 1_000_000
+
+
+def _read_vint(buffer: memoryview, pos: int, keep_marker: bool) -> Optional[Tuple[int, int, bool]]:
+    """Read a variable size integer, returns (value, length, is_unknown_size)"""
+    if pos >= len(buffer):
+        return None
+
+    first = buffer[pos]
+    if first == 0:
+        return None
+
+    length = 1
+    mask = 0x80
+    while not first & mask:
+        mask >>= 1
+        length += 1
+
+    if pos + length > len(buffer):
+        return None
+
+    value = first if keep_marker else first & (mask - 1)
+    all_ones = (first & (mask - 1)) == mask - 1
+    for byte in buffer[pos + 1:pos + length]:
+        value = (value << 8) | byte
+        all_ones = all_ones and byte == 0xFF
+
+    return value, length, all_ones and not keep_marker
+
+
+def _read_uint(data: memoryview) -> int:
+    return int.from_bytes(data, "big")
+
+
+def _read_float(data: memoryview) -> Optional[float]:
+    if len(data) == 4:
+        return struct.unpack(">f", data)[0]
+    if len(data) == 8:
+        return struct.unpack(">d", data)[0]
+    return None
+
+
+def get_webm_duration_us(audio_data: Union[bytes, bytearray, memoryview]) -> Optional[int]:
+    """
+    Return the duration of a WebM/Matroska buffer in microseconds.
+
+    The Segment Info Duration is used when present. Recorders that stream
+    (e.g. MediaRecorder) usually leave it out, in that case the highest
+    cluster + block timecode is used. Returns None when the buffer is not
+    EBML or no timing information could be found.
+    """
+    buffer = memoryview(audio_data)
+    size = len(buffer)
+
+    element_id = _read_vint(buffer, 0, keep_marker=True)
+    if element_id is None or element_id[0] != EBML_HEADER_ID:
+        return None
+
+    timecode_scale = DEFAULT_TIMECODE_SCALE_NS
+    info_duration = None
+    cluster_timecode = 0
+    last_timecode = None
+    pos = 0
+
+    while pos < size:
+        element_id = _read_vint(buffer, pos, keep_marker=True)
+        if element_id is None:
+            break
+        element_size = _read_vint(buffer, pos + element_id[1], keep_marker=False)
+        if element_size is None:
+            break
+
+        eid = element_id[0]
+        data_start = pos + element_id[1] + element_size[1]
+        data_size, unknown_size = element_size[0], element_size[2]
+
+        if eid in CONTAINER_IDS:
+            if eid == CLUSTER_ID and info_duration:
+                # Info always precedes the clusters, no need to scan the media
+                break
+            # Unknown sized masters (live streams) simply continue in the flat scan
+            pos = data_start
+            continue
+
+        if unknown_size or data_start + data_size > size:
+            # Truncated upload, a block header is still enough to read its timecode
+            if eid not in (SIMPLE_BLOCK_ID, BLOCK_ID) or data_start + 3 > size:
+                break
+            data_size = size - data_start
+
+        data = buffer[data_start:data_start + data_size]
+
+        if eid == TIMECODE_SCALE_ID:
+            timecode_scale = _read_uint(data) or DEFAULT_TIMECODE_SCALE_NS
+        elif eid == DURATION_ID:
+            info_duration = _read_float(data)
+        elif eid == CLUSTER_TIMECODE_ID:
+            cluster_timecode = _read_uint(data)
+        elif eid in (SIMPLE_BLOCK_ID, BLOCK_ID):
+            track = _read_vint(data, 0, keep_marker=False)
+            if track is not None and track[1] + 2 <= len(data):
+                relative = struct.unpack(">h", data[track[1]:track[1] + 2])[0]
+                block_timecode = cluster_timecode + relative
+                if last_timecode is None or block_timecode > last_timecode:
+                    last_timecode = block_timecode
+
+        pos = data_start + data_size
+
+    if info_duration:
+        return int(info_duration * timecode_scale / 1000)
+
+    if last_timecode is None:
+        return None
+
+    return int(last_timecode * timecode_scale / 1000)
@@ -0,0 +1,61 @@
+"""
+Compare the EBML header probe against the pydub/ffmpeg decode used to
+measure the duration of practice uploads.
+
+Requires ffmpeg to build the sample clips:
+
+    python -m benchmarks.bench_audio_duration
+"""
+import io
+import time
+from statistics import median
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from app.util.webm import get_webm_duration_us
+
+CLIP_SECONDS = (5, 60, 300)
+ROUNDS = 20
+
+
+def build_clip(seconds: int) -> bytes:
+    audio = Sine(440).to_audio_segment(duration=seconds * 1000).set_frame_rate(48000)
+    buffer = io.BytesIO()
+    audio.export(buffer, format="webm", codec="libopus")
+    return buffer.getvalue()
+
+
+def pydub_duration(audio_data: bytes) -> float:
+    return len(AudioSegment.from_file(io.BytesIO(audio_data), format="webm")) / 1000.0
+
+
+def probe_duration(audio_data: bytes) -> float:
+    return get_webm_duration_us(audio_data) / 1_000_000
+
+
+def measure(func, audio_data: bytes, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        func(audio_data)
+        timings.append(time.perf_counter() - started_at)
+    return median(timings)
+
+
+def main() -> None:
+    print(f"{'clip':>6} {'size':>10} {'pydub (ms)':>12} {'probe (ms)':>12} {'speedup':>10}")
+    for seconds in CLIP_SECONDS:
+        clip = build_clip(seconds)
+        assert abs(pydub_duration(clip) - probe_duration(clip)) < 0.1
+
+        pydub_time = measure(pydub_duration, clip, rounds=3 if seconds >= 60 else ROUNDS)
+        probe_time = measure(probe_duration, clip, rounds=ROUNDS)
+        print(
+            f"{seconds:>5}s {len(clip):>10} {pydub_time * 1000:>12.2f} "
+            f"{probe_time * 1000:>12.3f} {pydub_time / probe_time:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Latency of the dialogue search, text index against the escaped regex
+fallback, on a synthetic corpus (100k dialogues by default).
+
+Requires a running MongoDB, the corpus is written to a separate collection
+of the configured database and dropped at the end:
+
+    DATABASE_NAME=bench python -m benchmarks.bench_dialogue_search --dialogues 100000
+"""
+import argparse
+import asyncio
+import random
+import time
+from statistics import quantiles
+
+from app.core.dialogues.infra.database.repositories import DialogueMongoRepository
+from app.integration import Mongo
+
+COLLECTION = "bench_dialogues"
+WORDS = (
+    "mission", "log", "captain", "fortress", "location", "infinity", "beyond", "friend",
+    "believe", "tonight", "never", "home", "ready", "space", "ranger", "planet", "toy",
+    "story", "sheriff", "cowboy", "rocket", "laser", "alarm", "command", "star",
+    "galaxy", "universe", "protect", "danger", "escape", "rescue", "team", "hero", "villain",
+)
+QUERIES = ("mission log", '"space ranger"', "fortress", "laser rocket alarm", "galaxy protect")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dialogues", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def build_dialogue(rng: random.Random, i: int) -> dict:
+    lines = []
+    for n in range(rng.randint(2, 8)):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12))).capitalize()
+        lines.append({"character": "", "text": text, "start_time": n * 2.0, "end_time": n * 2.0 + 1.5})
+    return {
+        "movie": {"imdb_id": f"tt{i % 500:07d}", "title": f"Movie {i % 500}", "language": "en"},
+        "difficulty_level": rng.randint(1, 5),
+        "duration_seconds": len(lines) * 2.0,
+        "lines": lines,
+    }
+
+
+async def load_corpus(collection, size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    batch = []
+    for i in range(size):
+        batch.append(build_dialogue(rng, i))
+        if len(batch) == 5000:
+            await collection.insert_many(batch)
+            batch = []
+    if batch:
+        await collection.insert_many(batch)
+    await collection.create_indexes(DialogueMongoRepository.indexes)
+
+
+async def measure(repo: DialogueMongoRepository, mode: str, rounds: int) -> list:
+    timings = []
+    for _ in range(rounds):
+        for search in QUERIES:
+            started_at = time.perf_counter()
+            await repo.find_with_filters({"search": search, "search_mode": mode}, 0, 20)
+            timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+async def run(args: argparse.Namespace) -> None:
+    Mongo._startup()
+    collection = Mongo.db[COLLECTION]
+    original = Mongo.dialogues
+    try:
+        await collection.drop()
+        print(f"Loading {args.dialogues} dialogues...")
+        await load_corpus(collection, args.dialogues, args.seed)
+
+        # The repository reads Mongo.dialogues, point it to the benchmark corpus
+        Mongo.dialogues = collection
+        repo = DialogueMongoRepository()
+
+        print(f"{'mode':<8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+        for mode in ("text", "regex"):
+            timings = await measure(repo, mode, args.rounds if mode == "text" else max(1, args.rounds // 10))
+            cuts = quantiles(timings, n=100)
+            print(f"{mode:<8} {cuts[49] * 1000:>10.1f} {cuts[98] * 1000:>10.1f} {max(timings) * 1000:>10.1f}")
+    finally:
+        Mongo.dialogues = original
+        await collection.drop()
+        Mongo._shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
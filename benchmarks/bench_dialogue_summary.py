@@ -0,0 +1,101 @@
+"""
+Payload size and serialization time of a dialogue listing page, full view
+against the summary view (view=summary).
+
+No database needed. The summary documents are projected locally the same
+way the server projection does, sizes are the BSON read from MongoDB and
+the JSON sent to the client:
+
+    python -m benchmarks.bench_dialogue_summary --page-size 20 --lines 30
+"""
+import argparse
+import json
+import time
+from statistics import median
+from typing import List
+
+import bson
+from bson import ObjectId
+
+from app.core.dialogues.application import DialogueMapper
+
+CHARACTERS = ("Woody", "Buzz", "Jessie", "Rex", "")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=200)
+    return parser.parse_args()
+
+
+def build_documents(page_size: int, lines: int) -> List[dict]:
+    return [
+        {
+            "_id": ObjectId(),
+            "movie": {"imdb_id": "tt0114709", "title": "Toy Story", "language": "en"},
+            "difficulty_level": 3,
+            "duration_seconds": lines * 2.0,
+            "lines": [
+                {
+                    "character": CHARACTERS[n % len(CHARACTERS)],
+                    "text": "You are a sad, strange little man, and you have my pity.",
+                    "start_time": n * 2.0,
+                    "end_time": n * 2.0 + 1.5,
+                }
+                for n in range(lines)
+            ],
+        }
+        for _ in range(page_size)
+    ]
+
+
+def project_summary(doc: dict) -> dict:
+    """Local equivalent of DialogueMongoRepository.SUMMARY_PROJECTION"""
+    return {
+        "_id": doc["_id"],
+        "movie": doc["movie"],
+        "difficulty_level": doc["difficulty_level"],
+        "duration_seconds": doc["duration_seconds"],
+        "line_count": len(doc["lines"]),
+        "preview": doc["lines"][0]["text"] if doc["lines"] else "",
+        "characters": list({line["character"] for line in doc["lines"]} - {""}),
+    }
+
+
+def serialize_full(docs: List[dict]) -> bytes:
+    dialogues = [DialogueMapper.to_dto(DialogueMapper.from_document_to_entity(doc)) for doc in docs]
+    return json.dumps([dialogue.model_dump(mode="json", by_alias=True) for dialogue in dialogues]).encode()
+
+
+def serialize_summary(docs: List[dict]) -> bytes:
+    summaries = [DialogueMapper.from_summary_document_to_dto(dict(doc)) for doc in docs]
+    return json.dumps([summary.model_dump(mode="json", by_alias=True, exclude_unset=True) for summary in summaries]).encode()
+
+
+def measure(serialize, docs: List[dict], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        serialize(docs)
+        timings.append(time.perf_counter() - started_at)
+    return median(timings)
+
+
+def main() -> None:
+    args = parse_args()
+    docs = build_documents(args.page_size, args.lines)
+    summaries = [project_summary(doc) for doc in docs]
+
+    print(f"{args.page_size} dialogues of {args.lines} lines per page")
+    print(f"{'view':<8} {'BSON (B)':>10} {'JSON (B)':>10} {'p50 (ms)':>10}")
+    for view, page, serialize in (("full", docs, serialize_full), ("summary", summaries, serialize_summary)):
+        bson_size = sum(len(bson.encode(doc)) for doc in page)
+        json_size = len(serialize(page))
+        elapsed = measure(serialize, page, args.rounds)
+        print(f"{view:<8} {bson_size:>10} {json_size:>10} {elapsed * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+End to end benchmark of DialogueBusiness.proccess_practice_dialogue using
+the fake audio processor, so only our own pipeline (MongoDB reads and writes,
+scoring, domain events) is measured against a simulated ASR latency profile.
+
+Requires a running MongoDB, use a disposable database:
+
+    DATABASE_NAME=bench python -m benchmarks.bench_practice_pipeline \\
+        --requests 500 --concurrency 50 --latency-mean 0.8 --latency-stddev 0.4
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from statistics import quantiles
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.config import start_mongo, stop_mongo, start_audio_processor, stop_audio_processor
+from app.core.common.domain.events.event_setup import setup_event_handlers
+from app.integration import Mongo
+from app.business import DialogueBusiness
+from app.core.users.application.dto.user_dto import UserOut
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--audio-seconds", type=float, default=5.0)
+    parser.add_argument("--latency-mean", type=float, default=0.5)
+    parser.add_argument("--latency-stddev", type=float, default=0.25)
+    parser.add_argument("--distribution", default="lognormal")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--busy-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def seed_data() -> tuple:
+    now = datetime.now(timezone.utc)
+    dialogue = await Mongo.dialogues.insert_one({
+        "movie": {"imdb_id": "bench", "title": "Benchmark", "language": "en"},
+        "difficulty_level": 2,
+        "lines": [
+            {"character": "", "text": "Buzz lightyear mission log", "start_time": 0, "end_time": 2},
+            {"character": "", "text": "as the location of zurg's fortress", "start_time": 2, "end_time": 5},
+        ],
+        "duration_seconds": 5,
+    })
+    user = await Mongo.users.insert_one({
+        "email": "bench@example.com",
+        "name": "Benchmark",
+        "google_id": "",
+        "achievements": [],
+        "created_at": now,
+        "last_login": now,
+        "progress": {
+            "total_practice_time_seconds": 0,
+            "total_dialogues": 0,
+            "average_pronunciation_score": 0.0,
+            "average_fluency_score": 0.0,
+            "level": 1,
+            "xp_points": 0,
+        },
+    })
+    user_doc = await Mongo.users.find_one({"_id": user.inserted_id})
+    return str(dialogue.inserted_id), UserOut(**user_doc)
+
+
+async def cleanup(dialogue_id: str, user: UserOut) -> None:
+    from bson import ObjectId
+    await Mongo.dialogues.delete_one({"_id": ObjectId(dialogue_id)})
+    await Mongo.dialogue_practice_history.delete_many({"dialogue_id": dialogue_id})
+    await Mongo.users.delete_one({"_id": ObjectId(user.id)})
+
+
+async def run(args: argparse.Namespace) -> None:
+    settings.AUDIO_PROCESSOR = "Fake"
+    settings.FAKE_AUDIO_PROCESSOR_LATENCY_MEAN_SECONDS = args.latency_mean
+    settings.FAKE_AUDIO_PROCESSOR_LATENCY_STDDEV_SECONDS = args.latency_stddev
+    settings.FAKE_AUDIO_PROCESSOR_LATENCY_DISTRIBUTION = args.distribution
+    settings.FAKE_AUDIO_PROCESSOR_ERROR_RATE = args.error_rate
+    settings.FAKE_AUDIO_PROCESSOR_BUSY_RATE = args.busy_rate
+    settings.FAKE_AUDIO_PROCESSOR_SEED = args.seed
+
+    await start_mongo()
+    await start_audio_processor()
+    setup_event_handlers()
+
+    dialogue_id, user = await seed_data()
+    # 16 kHz 16 bit PCM, the fake processor derives the duration from the size
+    audios = [bytes([i % 256]) * int(args.audio_seconds * 32_000) for i in range(args.requests)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies, failures = [], {}
+
+    async def practice(audio: bytes) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                await DialogueBusiness.proccess_practice_dialogue(dialogue_id, audio, user)
+                latencies.append(time.perf_counter() - started_at)
+            except HTTPException as e:
+                failures[e.status_code] = failures.get(e.status_code, 0) + 1
+
+    try:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(practice(audio) for audio in audios))
+        elapsed = time.perf_counter() - started_at
+    finally:
+        await cleanup(dialogue_id, user)
+        stop_audio_processor()
+        await stop_mongo()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} elapsed={elapsed:.2f}s")
+    print(f"throughput={len(latencies) / elapsed:.1f} req/s failures={failures or 0}")
+    if len(latencies) >= 2:
+        cuts = quantiles(latencies, n=100)
+        print(f"p50={cuts[49] * 1000:.1f}ms p95={cuts[94] * 1000:.1f}ms p99={cuts[98] * 1000:.1f}ms max={max(latencies) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,112 @@
+"""
+Lines per second of the single pass SRT tokenizer against the previous
+block/regex implementation, on real-world sized files (1,500 and 3,000 cues).
+
+A pytest-benchmark suite (requirements/develop.txt), run it explicitly:
+
+    python -m pytest benchmarks/bench_srt_tokenizer.py --benchmark-columns=mean,ops
+"""
+import random
+import re
+from typing import List, Tuple
+
+import pytest
+
+from app.core.dialogues.domain.dialogue_entity import DialogueLine
+from app.util.subtitles import iter_srt_lines, merge_consecutive_lines
+
+pytest.importorskip("pytest_benchmark")
+
+WORDS = (
+    "mission", "log", "captain", "fortress", "location", "infinity", "beyond", "friend",
+    "believe", "tonight", "never", "home", "ready", "space", "ranger", "planet", "toy",
+)
+CHARACTERS = ("BUZZ: ", "Woody: ", "[REX] ", "(HAMM) ", "- ", "", "", "")
+
+
+def timestamp(seconds: float) -> str:
+    millis = int(seconds * 1000)
+    return f"{millis // 3_600_000:02d}:{millis // 60_000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+def build_srt(cues: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    parts, start = [], 0.0
+    for i in range(cues):
+        start += rng.choice((1.0, 2.0, 2.5, 9.0))
+        text = [
+            rng.choice(CHARACTERS) + " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 9))).capitalize() + "."
+            for _ in range(rng.randint(1, 2))
+        ]
+        if rng.random() < 0.2:
+            text[0] = f"<i>{text[0]}</i>"
+        parts.append(f"{i + 1}\r\n{timestamp(start)} --> {timestamp(start + 1.8)}\r\n" + "\r\n".join(text))
+    return "\r\n\r\n".join(parts) + "\r\n"
+
+
+def legacy_extract(subtitle_content: str) -> List[DialogueLine]:
+    """The split/match per block parser the tokenizer replaced"""
+    patterns = [r'^([A-Z][A-Z\s]+):\s*(.*)', r'^([A-Z][a-z]+):\s*(.*)', r'\[([^\]]+)\]\s*(.*)', r'\(([^\)]+)\)\s*(.*)']
+
+    def clean(text: str) -> str:
+        return re.compile('<.*?>').sub('', text).replace('.', '').replace('-', '')
+
+    def identify(text: str) -> Tuple[str, str]:
+        for pattern in patterns:
+            match = re.match(pattern, text.strip())
+            if match:
+                return match.group(1).strip(), clean(match.group(2).strip())
+        return "", clean(text.strip())
+
+    def parse_timestamp(value: str) -> Tuple[float, float]:
+        match = re.match(r'(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})', value)
+        if not match:
+            return 0.0, 0.0
+        g = [int(group) for group in match.groups()]
+        return g[0] * 3600 + g[1] * 60 + g[2] + g[3] / 1000, g[4] * 3600 + g[5] * 60 + g[6] + g[7] / 1000
+
+    dialogue_lines = []
+    for block in re.split(r'\n\n+', subtitle_content.strip()):
+        lines = block.split('\n')
+        if len(lines) < 3:
+            continue
+        start_time, end_time = parse_timestamp(lines[1])
+        dialogues = []
+        for line in '\n'.join(lines[2:]).splitlines():
+            character, dialogue = identify(line)
+            if character and dialogue:
+                dialogues.append((character, dialogue))
+            elif dialogues and character == "":
+                dialogues.append((dialogues[-1][0], dialogue))
+            else:
+                dialogues.append(("", dialogue))
+        dialogue_lines.extend(
+            DialogueLine(character, dialogue, start_time, end_time)
+            for character, dialogue in dialogues if dialogue
+        )
+    return list(merge_consecutive_lines(dialogue_lines))
+
+
+def tokenizer_extract(subtitle_content: str) -> List[DialogueLine]:
+    return list(merge_consecutive_lines(iter_srt_lines(subtitle_content)))
+
+
+@pytest.fixture(scope="module", params=[1500, 3000], ids=lambda cues: f"{cues}cues")
+def content(request) -> str:
+    # LF only for the legacy parser, it does not handle CRLF
+    return build_srt(request.param).replace("\r\n", "\n")
+
+
+def test_both_parsers_agree(content):
+    legacy = [(line.character, line.text, line.start_time, line.end_time) for line in legacy_extract(content)]
+    tokenizer = [(line.character, line.text, line.start_time, line.end_time) for line in tokenizer_extract(content)]
+    assert tokenizer == legacy
+
+
+@pytest.mark.parametrize("parser", [legacy_extract, tokenizer_extract], ids=["legacy", "tokenizer"])
+def test_parse(benchmark, content, parser):
+    benchmark.group = f"srt {content.count('-->')} cues"
+    lines = benchmark(parser, content)
+    benchmark.extra_info["lines"] = len(lines)
+    if benchmark.stats:  # None with --benchmark-disable
+        benchmark.extra_info["lines_per_second"] = round(len(lines) / benchmark.stats.stats.mean)
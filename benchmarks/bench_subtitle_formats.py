@@ -0,0 +1,107 @@
+"""
+Lines per second of every subtitle parser, on the same synthetic movie
+(3,000 cues) written as SRT, WebVTT, ASS and MicroDVD.
+
+A pytest-benchmark suite (requirements/develop.txt), run it explicitly:
+
+    python -m pytest benchmarks/bench_subtitle_formats.py --benchmark-columns=mean,ops
+"""
+import random
+from typing import List, Tuple
+
+import pytest
+
+from app.util.patterns import SubtitleFormatsEnum
+from app.util.subtitles import iter_dialogue_lines
+
+pytest.importorskip("pytest_benchmark")
+
+CUES = 3000
+FPS = 25
+WORDS = (
+    "mission", "log", "captain", "fortress", "location", "infinity", "beyond", "friend",
+    "believe", "tonight", "never", "home", "ready", "space", "ranger", "planet", "toy",
+)
+SPEAKERS = ("BUZZ", "Woody", "Rex", "")
+
+Cue = Tuple[float, float, str, List[str]]
+
+
+def build_cues(seed: int = 7) -> List[Cue]:
+    rng = random.Random(seed)
+    cues, start = [], 0.0
+    for _ in range(CUES):
+        start += rng.choice((1.0, 2.0, 2.5, 9.0))
+        text = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 9))).capitalize() + "."
+            for _ in range(rng.randint(1, 2))
+        ]
+        cues.append((start, start + 1.8, rng.choice(SPEAKERS), text))
+    return cues
+
+
+def clock(seconds: float, separator: str) -> str:
+    millis = int(round(seconds * 1000))
+    return f"{millis // 3_600_000:02d}:{millis // 60_000 % 60:02d}:{millis // 1000 % 60:02d}{separator}{millis % 1000:03d}"
+
+
+def to_srt(cues: List[Cue]) -> str:
+    return "\n\n".join(
+        f"{i + 1}\n{clock(start, ',')} --> {clock(end, ',')}\n"
+        + "\n".join(f"{speaker}: {line}" if speaker else line for line in text)
+        for i, (start, end, speaker, text) in enumerate(cues)
+    )
+
+
+def to_vtt(cues: List[Cue]) -> str:
+    return "WEBVTT\n\n" + "\n\n".join(
+        f"{clock(start, '.')} --> {clock(end, '.')} align:center\n"
+        + "\n".join(f"<v {speaker}>{line}</v>" if speaker else line for line in text)
+        for start, end, speaker, text in cues
+    )
+
+
+def to_ass(cues: List[Cue]) -> str:
+    def ass_clock(seconds: float) -> str:
+        return clock(seconds, ".")[1:-1]
+
+    return "[Script Info]\nScriptType: v4.00+\n\n[Events]\n" \
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n" + "\n".join(
+            f"Dialogue: 0,{ass_clock(start)},{ass_clock(end)},Default,{speaker},0,0,0,,{{\\i1}}" + "\\N".join(text)
+            for start, end, speaker, text in cues
+        )
+
+
+def to_microdvd(cues: List[Cue]) -> str:
+    return f"{{1}}{{1}}{FPS}\n" + "\n".join(
+        f"{{{round(start * FPS)}}}{{{round(end * FPS)}}}{{y:i}}"
+        + "|".join(f"{speaker}: {line}" if speaker else line for line in text)
+        for start, end, speaker, text in cues
+    )
+
+
+WRITERS = {
+    SubtitleFormatsEnum.SRT: to_srt,
+    SubtitleFormatsEnum.VTT: to_vtt,
+    SubtitleFormatsEnum.ASS: to_ass,
+    SubtitleFormatsEnum.MICRODVD: to_microdvd,
+}
+
+
+@pytest.fixture(scope="module")
+def cues() -> List[Cue]:
+    return build_cues()
+
+
+@pytest.mark.parametrize("subtitle_format", list(WRITERS), ids=lambda subtitle_format: subtitle_format.value)
+def test_parse(benchmark, cues, subtitle_format):
+    content = WRITERS[subtitle_format](cues)
+    benchmark.group = f"subtitle formats {CUES} cues"
+
+    lines = benchmark(lambda: list(iter_dialogue_lines(content)))
+
+    assert len(lines) >= CUES
+    assert lines[-1].end_time == pytest.approx(cues[-1][1], abs=0.05)
+    benchmark.extra_info["lines"] = len(lines)
+    if benchmark.stats:  # None with --benchmark-disable
+        benchmark.extra_info["lines_per_second"] = round(len(lines) / benchmark.stats.stats.mean)
@@ -0,0 +1,89 @@
+"""
+Throughput of the subtitle parsing, sequential on the event loop against the
+process pool with a growing number of workers, on synthetic SRT files.
+Runs offline, no MongoDB or network needed:
+
+    python -m benchmarks.bench_subtitle_parsing --files 32 --blocks 1500
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from app.business.subtitles_bo import SubtitlesBussiness
+from app.integration.process_pool import ProcessPool
+
+WORDS = (
+    "mission", "log", "captain", "fortress", "location", "infinity", "beyond", "friend",
+    "believe", "tonight", "never", "home", "ready", "space", "ranger", "planet", "toy",
+    "story", "sheriff", "cowboy", "rocket", "laser", "alarm", "command", "star",
+)
+CHARACTERS = ("BUZZ", "WOODY", "Jessie", "[REX]", "(HAMM)", "")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=32)
+    parser.add_argument("--blocks", type=int, default=1500, help="subtitle blocks per file (~1500 for a movie)")
+    parser.add_argument("--workers", type=int, nargs="*", help="pool sizes, defaults to 1, 2, 4... up to the CPU count")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def timestamp(seconds: float) -> str:
+    millis = int(seconds * 1000)
+    return f"{millis // 3_600_000:02d}:{millis // 60_000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+def build_srt(rng: random.Random, blocks: int) -> str:
+    parts, start = [], 0.0
+    for i in range(blocks):
+        # Long pauses now and then split the file into scenes
+        start += rng.choice((1.0, 1.5, 2.0, 2.5, 12.0))
+        character = rng.choice(CHARACTERS)
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12))).capitalize() + "."
+        if character.isalpha():
+            text = f"{character}: {text}"
+        elif character:
+            text = f"{character} {text}"
+        parts.append(f"{i + 1}\n{timestamp(start)} --> {timestamp(start + 1.2)}\n<i>{text}</i>")
+    return "\n\n".join(parts)
+
+
+def default_workers() -> list:
+    cpus, workers, n = os.cpu_count() or 1, [], 1
+    while n < cpus:
+        workers.append(n)
+        n *= 2
+    return workers + [cpus]
+
+
+async def measure(contents: list) -> float:
+    started_at = time.perf_counter()
+    await SubtitlesBussiness.parse_many(contents)
+    return time.perf_counter() - started_at
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    contents = [build_srt(rng, args.blocks) for _ in range(args.files)]
+    print(f"{args.files} files, {sum(len(c) for c in contents) / 1_000_000:.1f} MB, {os.cpu_count()} CPUs")
+
+    sequential = await measure(contents)
+    print(f"{'workers':<10} {'seconds':>10} {'files/s':>10} {'speedup':>10}")
+    print(f"{'inline':<10} {sequential:>10.2f} {args.files / sequential:>10.1f} {1:>10.2f}")
+
+    for workers in args.workers or default_workers():
+        ProcessPool._startup(workers)
+        try:
+            # Start the workers before timing
+            await asyncio.gather(*(ProcessPool.run(len, "") for _ in range(workers)))
+            elapsed = await measure(contents)
+        finally:
+            ProcessPool._shutdown()
+        print(f"{workers:<10} {elapsed:>10.2f} {args.files / elapsed:>10.1f} {sequential / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
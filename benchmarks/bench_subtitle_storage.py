@@ -0,0 +1,112 @@
+"""
+Storage and transfer of the raw subtitles, inline in the movie documents
+against compressed in subtitle_contents.
+
+No database needed, sizes are the BSON of the documents and decode times
+are measured locally on a listing page:
+
+    python -m benchmarks.bench_subtitle_storage --page-size 20 --cues 1500
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+from statistics import median
+
+import bson
+from bson import ObjectId
+
+from app.core.movies.domain import MovieEntity
+from app.util.compression import GZIP, ZSTD, compress, zstandard
+
+WORDS = (
+    "mission", "log", "captain", "fortress", "location", "infinity", "beyond", "friend",
+    "believe", "tonight", "never", "home", "ready", "space", "ranger", "planet", "toy",
+    "story", "sheriff", "cowboy", "rocket", "laser", "alarm", "command", "star",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--cues", type=int, default=1500)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def timestamp(seconds: float) -> str:
+    millis = int(seconds * 1000)
+    return f"{millis // 3_600_000:02d}:{millis // 60_000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+def build_srt(rng: random.Random, cues: int) -> str:
+    parts, start = [], 0.0
+    for i in range(cues):
+        start += rng.choice((1.0, 2.0, 2.5, 9.0))
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12))).capitalize() + "."
+        parts.append(f"{i + 1}\n{timestamp(start)} --> {timestamp(start + 1.8)}\n{text}")
+    return "\n\n".join(parts)
+
+
+def build_movie(i: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "title": f"Movie {i}",
+        "year": 1995,
+        "feature_type": "Movie",
+        "imdb_id": f"tt{i:07d}",
+        "subtitle_id": str(1000 + i),
+        "all_movie_info": {"language": "en", "ratings": 8.5, "download_count": 1200, "files": [{"file_id": i}]},
+        "upload_date": datetime(2021, 1, 1, tzinfo=timezone.utc),
+        "language": "en",
+        "machine_translated": False,
+        "ai_translated": False,
+        "content_hash": None,
+        "parser_version": None,
+        "dialogues_count": 0,
+    }
+
+
+def decode_time(page: list, rounds: int) -> float:
+    raw = [bson.encode(doc) for doc in page]
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        for data in raw:
+            bson.decode(data)
+        timings.append(time.perf_counter() - started_at)
+    return median(timings)
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    contents = [build_srt(rng, args.cues) for _ in range(args.page_size)]
+
+    inline = [{**build_movie(i), "content": content} for i, content in enumerate(contents)]
+    detached = [
+        {**build_movie(i), "content_id": MovieEntity.hash_content(content)}
+        for i, content in enumerate(contents)
+    ]
+
+    raw_size = sum(len(content.encode()) for content in contents)
+    print(f"{args.page_size} movies, subtitles of {args.cues} cues ({raw_size / args.page_size / 1024:.0f} KB each)")
+
+    print(f"\n{'storage':<16} {'bytes':>12} {'ratio':>8}")
+    print(f"{'inline':<16} {raw_size:>12} {1:>8.2f}")
+    for encoding in (GZIP, ZSTD):
+        if encoding == ZSTD and zstandard is None:
+            print(f"{ZSTD:<16} {'zstandard is not installed':>21}")
+            continue
+        stored = sum(len(compress(content.encode(), encoding)[1]) for content in contents)
+        print(f"{encoding:<16} {stored:>12} {stored / raw_size:>8.2f}")
+
+    print(f"\n{'listing page':<16} {'BSON (B)':>12} {'decode (ms)':>12}")
+    for name, page in (("inline", inline), ("content_id", detached)):
+        size = sum(len(bson.encode(doc)) for doc in page)
+        print(f"{name:<16} {size:>12} {decode_time(page, args.rounds) * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
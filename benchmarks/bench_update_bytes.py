@@ -0,0 +1,103 @@
+"""
+Bytes sent to MongoDB per repository update, full $set of entity_dump()
+against the partial update built from the changed fields.
+
+No database needed, the update documents are BSON encoded locally:
+
+    python -m benchmarks.bench_update_bytes
+"""
+from datetime import datetime, timezone
+
+import bson
+
+from app.core.common.domain.value_objects import Uuid
+from app.core.common.infra.database.partial_update import build_partial_update
+from app.core.dialogues.domain.dialogue_entity import DialogueEntity, DialogueLine, DialogueMovie
+from app.core.movies.domain import MovieEntity
+from app.core.users.domain import UserEntity, UserProgress, Achievement
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def user_with_achievements(count: int) -> UserEntity:
+    return UserEntity.create(
+        email="bench@example.com",
+        name="Benchmark",
+        created_at=NOW,
+        last_login=NOW,
+        achievements=[
+            Achievement.create(id=str(Uuid()), name=f"Level {i} Achieved", description=f"You've reached level {i}.", earned_at=NOW)
+            for i in range(count)
+        ],
+        progress=UserProgress.create(xp_points=10_000),
+        id=str(Uuid())
+    )
+
+
+def movie_with_content(size: int) -> MovieEntity:
+    block = "1\n00:00:01,000 --> 00:00:02,000\nTo infinity and beyond!\n\n"
+    return MovieEntity.create(
+        title="Toy Story",
+        year=1995,
+        feature_type="movie",
+        imdb_id="tt0114709",
+        subtitle_id="1",
+        all_movie_info={"attributes": {"ratings": 8.3, "download_count": 1000}},
+        upload_date=NOW,
+        content=block * (size // len(block)),
+        id=str(Uuid())
+    )
+
+
+def dialogue_with_lines(count: int) -> DialogueEntity:
+    return DialogueEntity.create(
+        duration_seconds=count * 2.0,
+        lines=[DialogueLine(character="", text="To infinity and beyond!", start_time=i * 2.0, end_time=i * 2.0 + 1.5) for i in range(count)],
+        movie=DialogueMovie(imdb_id="tt0114709", title="Toy Story"),
+        id=str(Uuid())
+    )
+
+
+def login(user: UserEntity) -> None:
+    user.last_login = datetime.now(timezone.utc)
+
+
+def earn_achievement(user: UserEntity) -> None:
+    user.achievements.append(Achievement.create(id=str(Uuid()), name="Level 20 Achieved", description="", earned_at=NOW))
+
+
+def rename_movie(movie: MovieEntity) -> None:
+    movie.title = "Toy Story (1995)"
+
+
+def bump_rating(movie: MovieEntity) -> None:
+    movie.all_movie_info["attributes"]["ratings"] = 8.4
+
+
+def change_difficulty(dialogue: DialogueEntity) -> None:
+    dialogue.difficulty_level = dialogue.difficulty_level % 5 + 1
+
+
+CASES = (
+    ("user login, 50 achievements", lambda: user_with_achievements(50), login),
+    ("user new achievement", lambda: user_with_achievements(50), earn_achievement),
+    ("movie rename, 300 KB content", lambda: movie_with_content(300 * 1024), rename_movie),
+    ("movie rating", lambda: movie_with_content(300 * 1024), bump_rating),
+    ("dialogue difficulty, 40 lines", lambda: dialogue_with_lines(40), change_difficulty),
+)
+
+
+def main() -> None:
+    print(f"{'case':<32} {'full (B)':>10} {'partial (B)':>12} {'ratio':>8}")
+    for name, build, change in CASES:
+        entity = build()
+        entity.mark_persisted()
+        change(entity)
+
+        full = len(bson.encode({"$set": entity.entity_dump()}))
+        partial = len(bson.encode(build_partial_update(entity)))
+        print(f"{name:<32} {full:>10} {partial:>12} {full / partial:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import pytest
 from asgi_lifespan import LifespanManager
 from httpx import AsyncClient, ASGITransport
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from aioresponses import aioresponses
 from app.http.rest.v1 import auth_v1
 import pytest_asyncio
@@ -56,11 +56,18 @@ async def clean_database():
         await Mongo.movies_processed.delete_many({})
         await Mongo.dialogues.delete_many({})
         await Mongo.dialogue_practice_history.delete_many({})
+        await Mongo.jobs.delete_many({})
+        await Mongo.outbox_events.delete_many({})
+        await Mongo.subtitle_contents.delete_many({})
+        await Mongo.transcription_cache.delete_many({})
+        # The users are deleted behind the repository, their cached principals must go too
+        from app.core.users.application import PrincipalCache
+        PrincipalCache.clear()
         count = await Mongo.users.count_documents({})
         print(f"[CLEANING DB] Users left: {count}")
     
 @pytest_asyncio.fixture
-@patch("google.oauth2.id_token.verify_oauth2_token")
+@patch("app.integration.google_id_token.GoogleIdTokenVerifier.verify", new_callable=AsyncMock)
 async def mock_user_google_auth(
     mock_verify,
     client: AsyncClient
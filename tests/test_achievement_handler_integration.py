@@ -215,10 +215,11 @@ class TestAchievementHandlerIntegration:
             mock_repo.find_by_id = AsyncMock(return_value=sample_user_entity)
             mock_repo.update = AsyncMock(return_value=None)
             
-            # Patch UserMongoRepository where it's used
+            # Patch UserMongoRepository where it's used, events are published in memory
             with patch('app.core.users.application.event_handlers.achievement_handler.UserMongoRepository', return_value=mock_repo), \
                  patch('app.business.user_bo.UserMongoRepository', return_value=mock_repo), \
-                 patch('app.core.common.domain.events.event_dispatcher.event_dispatcher', real_dispatcher):
+                 patch('app.core.common.domain.events.event_dispatcher.event_dispatcher', real_dispatcher), \
+                 patch('app.business.dialogue_bo.settings.OUTBOX_ENABLED', False):
                 
                 # Ensure AchievementHandler instance uses our mock repo
                 achievement_handler.user_repo = mock_repo
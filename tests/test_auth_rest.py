@@ -1,6 +1,7 @@
+import asyncio
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from app.core.common.application.dto import GoogleLoginData
 from app.http.rest.v1 import auth_v1
 import pytest_asyncio
@@ -38,7 +39,7 @@ def mock_db_user():
         "last_login": datetime.now(timezone.utc)
     }
 
-@patch("google.oauth2.id_token.verify_oauth2_token")
+@patch("app.integration.google_id_token.GoogleIdTokenVerifier.verify", new_callable=AsyncMock)
 async def test_google_login_success_new_user(
     mock_verify,
     client: AsyncClient,
@@ -60,7 +61,7 @@ async def test_google_login_success_new_user(
     
     assert result["user"]["email"] == TEST_USER_EMAIL
     
-@patch("google.oauth2.id_token.verify_oauth2_token")
+@patch("app.integration.google_id_token.GoogleIdTokenVerifier.verify", new_callable=AsyncMock)
 async def test_google_login_success_exist_user(
     mock_verify,
     client: AsyncClient,
@@ -121,6 +122,25 @@ async def test_dev_login_success_existing_user(client: AsyncClient):
     assert result["user"]["email"] == "dev@local.com"
     assert result["user"]["last_login"] != result["user"]["created_at"]
 
+@patch("app.integration.google_id_token.GoogleIdTokenVerifier.verify", new_callable=AsyncMock)
+async def test_google_login_concurrent_first_logins_create_one_user(
+    mock_verify,
+    client: AsyncClient,
+    google_login_data,
+    mock_google_user
+):
+    from app.integration import Mongo
+    mock_verify.return_value = mock_google_user
+
+    responses = await asyncio.gather(*(
+        client.post(f"{BASE_URL}/google-login", json=google_login_data.model_dump())
+        for _ in range(5)
+    ))
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert len({response.json()["user"]["_id"] for response in responses}) == 1
+    assert await Mongo.users.count_documents({"google_id": mock_google_user["sub"]}) == 1
+
 async def test_dev_login_forbidden_when_not_debug(client: AsyncClient):
     from app.core.config import settings
     with patch.object(settings, "APP_DEBUG", False):
@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.adapters.cached_audio_processor import CachedAudioProcessor
+from app.core.common.ports import AudioProcessor, AudioTranscriptResult
+from app.util.cache import LRUCache
+from app.util.metrics import Metrics
+
+
+class CountingAudioProcessor(AudioProcessor):
+
+    def __init__(self, fingerprint: str = "config-a", delay: float = 0):
+        self.calls = 0
+        self.fingerprint = fingerprint
+        self.delay = delay
+
+    async def process_audio_transcript(self, audio_data: bytes) -> AudioTranscriptResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return AudioTranscriptResult(transcribed_text=audio_data.decode(), words=[], confidence=0.9)
+
+    def config_fingerprint(self) -> str:
+        return self.fingerprint
+
+
+def counters():
+    return {name: Metrics.get_counter(f"transcription_cache.{name}") for name in ("hit", "miss", "coalesced")}
+
+
+@pytest.mark.asyncio
+async def test_repeated_audio_is_served_from_memory():
+    inner = CountingAudioProcessor()
+    processor = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60)
+    before = counters()
+
+    first = await processor.process_audio_transcript(b"hello")
+    second = await processor.process_audio_transcript(b"hello")
+    other = await processor.process_audio_transcript(b"world")
+
+    assert first == second
+    assert other.transcribed_text == "world"
+    assert inner.calls == 2
+    assert counters()["hit"] == before["hit"] + 1
+    assert counters()["miss"] == before["miss"] + 2
+
+
+@pytest.mark.asyncio
+async def test_recognition_config_is_part_of_the_key():
+    inner = CountingAudioProcessor()
+    processor = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60)
+
+    await processor.process_audio_transcript(b"hello")
+    inner.fingerprint = "config-b"
+    await processor.process_audio_transcript(b"hello")
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    inner = CountingAudioProcessor(delay=0.02)
+    processor = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60)
+    before = counters()
+
+    results = await asyncio.gather(*(processor.process_audio_transcript(b"hello") for _ in range(5)))
+
+    assert inner.calls == 1
+    assert all(result.transcribed_text == "hello" for result in results)
+    assert counters()["miss"] == before["miss"] + 1
+    assert counters()["coalesced"] == before["coalesced"] + 4
+
+
+@pytest.mark.asyncio
+async def test_failed_recognition_is_not_cached():
+    inner = CountingAudioProcessor()
+    inner.process_audio_transcript = AsyncMock(side_effect=[RuntimeError("boom"), AudioTranscriptResult(transcribed_text="ok", words=[], confidence=1)])
+    processor = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60)
+
+    with pytest.raises(RuntimeError):
+        await processor.process_audio_transcript(b"hello")
+
+    result = await processor.process_audio_transcript(b"hello")
+    assert result.transcribed_text == "ok"
+
+
+@pytest.mark.asyncio
+async def test_mongo_tier_is_read_and_written():
+    inner = CountingAudioProcessor()
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value=None)
+    collection.replace_one = AsyncMock()
+    processor = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60, collection=collection)
+
+    result = await processor.process_audio_transcript(b"hello")
+
+    key, document = collection.replace_one.call_args.args
+    assert document["result"] == result.model_dump()
+
+    # A fresh process finds the entry in Mongo without calling the processor
+    collection.find_one = AsyncMock(return_value={"_id": key["_id"], **document})
+    restarted = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60, collection=collection)
+
+    assert await restarted.process_audio_transcript(b"hello") == result
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_audio_fills_the_cache():
+    inner = CountingAudioProcessor()
+    processor = CachedAudioProcessor(inner, max_entries=10, ttl_seconds=60)
+
+    async def chunks():
+        yield b"hel"
+        yield b"lo"
+
+    await processor.process_audio_stream(chunks())
+    await processor.process_audio_transcript(b"hello")
+
+    assert inner.calls == 1
+
+
+def test_lru_cache_evicts_least_recently_used_and_expired_entries():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, ttl_seconds=-1)
+    assert cache.get("d") is None
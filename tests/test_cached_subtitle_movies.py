@@ -0,0 +1,104 @@
+import asyncio
+import pytest
+
+from app.adapters.cached_subtitle_movies import CachedSubtitleMovies
+from app.core.common.ports import SubtitleMovies
+from app.core.movies.application.dto.movie_dto import MovieSearchOut
+from app.util.metrics import Metrics
+
+pytestmark = [pytest.mark.asyncio]
+
+
+class CountingSubtitleMovies(SubtitleMovies):
+
+    def __init__(self, delay: float = 0):
+        self.calls = 0
+        self.delay = delay
+        self.fail = False
+
+    async def search_movies(self, query: str):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise Exception("Failed to search movies")
+        return [MovieSearchOut(title=f"{query} {self.calls}", year=1999, feature_type="Movie", imdb_id="1", img_url="")]
+
+    async def get_subtitles(self, imdb_id: str, language: str = "en", on_line=None):
+        raise NotImplementedError
+
+
+def counters():
+    return {
+        name: Metrics.get_counter(f"movie_search_cache.{name}")
+        for name in ("hit", "miss", "coalesced", "stale", "upstream_calls")
+    }
+
+
+async def test_normalized_queries_share_the_cache():
+    inner = CountingSubtitleMovies()
+    service = CachedSubtitleMovies(inner, max_entries=10, ttl_seconds=60)
+    before = counters()
+
+    first = await service.search_movies("The  Matrix")
+    second = await service.search_movies(" the matrix ")
+    await service.search_movies("matrix")
+
+    assert first == second
+    assert inner.calls == 2
+    assert counters()["hit"] == before["hit"] + 1
+    assert counters()["upstream_calls"] == before["upstream_calls"] + 2
+    assert 0 < Metrics.get_gauge("movie_search_cache.hit_ratio") <= 1
+
+
+async def test_concurrent_identical_searches_hit_upstream_once():
+    inner = CountingSubtitleMovies(delay=0.05)
+    service = CachedSubtitleMovies(inner, max_entries=10, ttl_seconds=60)
+    before = counters()
+
+    results = await asyncio.gather(*(service.search_movies("Matrix") for _ in range(10)))
+
+    assert inner.calls == 1
+    assert all(result == results[0] for result in results)
+    assert counters()["coalesced"] == before["coalesced"] + 9
+
+
+async def test_errors_are_not_cached():
+    inner = CountingSubtitleMovies()
+    service = CachedSubtitleMovies(inner, max_entries=10, ttl_seconds=60)
+    inner.fail = True
+
+    with pytest.raises(Exception):
+        await service.search_movies("Matrix")
+
+    inner.fail = False
+    assert (await service.search_movies("Matrix"))[0].title == "Matrix 2"
+
+
+async def test_expired_results_are_fetched_again():
+    inner = CountingSubtitleMovies()
+    service = CachedSubtitleMovies(inner, max_entries=10, ttl_seconds=0.05)
+
+    await service.search_movies("Matrix")
+    await asyncio.sleep(0.06)
+    result = await service.search_movies("Matrix")
+
+    assert result[0].title == "Matrix 2"
+    assert inner.calls == 2
+
+
+async def test_stale_results_are_served_while_refreshing():
+    inner = CountingSubtitleMovies(delay=0.01)
+    service = CachedSubtitleMovies(inner, max_entries=10, ttl_seconds=0.05, stale_seconds=60)
+    before = counters()
+
+    await service.search_movies("Matrix")
+    await asyncio.sleep(0.06)
+    stale = await service.search_movies("Matrix")
+    again = await service.search_movies("Matrix")
+    await asyncio.sleep(0.03)
+    fresh = await service.search_movies("Matrix")
+
+    assert stale[0].title == again[0].title == "Matrix 1"
+    assert fresh[0].title == "Matrix 2"
+    assert inner.calls == 2
+    assert counters()["stale"] == before["stale"] + 2
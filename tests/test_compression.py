@@ -0,0 +1,44 @@
+import gzip
+
+import pytest
+
+from app.util import compression
+from app.util.compression import GZIP, IDENTITY, ZSTD, compress, decompress
+
+TEXT = ("1\n00:00:01,000 --> 00:00:02,000\nTo infinity and beyond!\n\n" * 200).encode()
+
+
+@pytest.mark.parametrize("encoding", [GZIP, IDENTITY])
+def test_round_trip(encoding):
+    used, data = compress(TEXT, encoding)
+
+    assert used == encoding
+    assert decompress(data, used) == TEXT
+
+
+def test_gzip_is_deterministic_and_smaller():
+    _, data = compress(TEXT, GZIP)
+
+    assert data == compress(TEXT, GZIP)[1]
+    assert len(data) < len(TEXT) / 10
+    assert gzip.decompress(data) == TEXT
+
+
+def test_falls_back_to_gzip_without_zstandard(monkeypatch):
+    monkeypatch.setattr(compression, "zstandard", None)
+
+    encoding, data = compress(TEXT)
+
+    assert encoding == GZIP
+    assert decompress(data, encoding) == TEXT
+    with pytest.raises(RuntimeError):
+        decompress(data, ZSTD)
+
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+
+    encoding, data = compress(TEXT)
+
+    assert encoding == ZSTD
+    assert decompress(data, encoding) == TEXT
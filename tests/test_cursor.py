@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+
+from app.util.cursor import InvalidCursorError, decode_cursor, encode_cursor, keyset_filter, with_keyset
+
+
+def test_cursor_round_trip_keeps_bson_types():
+    completed_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    oid = ObjectId()
+
+    token = encode_cursor([completed_at, oid])
+    values = decode_cursor(token)["k"]
+
+    assert "=" not in token
+    assert values[0].replace(tzinfo=timezone.utc) == completed_at
+    assert values[1] == oid
+    assert decode_cursor(encode_cursor(offset=40)) == {"o": 40}
+
+
+@pytest.mark.parametrize("token", [
+    "", "not a cursor", encode_cursor(offset=None), "eyJ4IjogMX0", encode_cursor(offset=True), encode_cursor(offset=-20)
+])
+def test_invalid_cursor(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_keyset_filter():
+    oid = ObjectId()
+
+    assert keyset_filter([("_id", 1)], [oid]) == {"_id": {"$gt": oid}}
+    assert keyset_filter([("xp_earned", -1), ("_id", -1)], [10, oid]) == {"$or": [
+        {"xp_earned": {"$lt": 10}},
+        {"xp_earned": 10, "_id": {"$lt": oid}},
+    ]}
+
+    with pytest.raises(InvalidCursorError):
+        keyset_filter([("xp_earned", -1), ("_id", -1)], [oid])
+
+
+def test_keyset_is_combined_with_the_filters():
+    oid = ObjectId()
+
+    assert with_keyset({}, [("_id", 1)], [oid]) == {"_id": {"$gt": oid}}
+    assert with_keyset({"user_id": "u"}, [("_id", 1)], [oid]) == {
+        "$and": [{"user_id": "u"}, {"_id": {"$gt": oid}}]
+    }
@@ -5,7 +5,9 @@ from httpx import AsyncClient
 from app.http.rest.v1 import dialogue_v1
 from app.integration.mongo import Mongo
 from app.core.common.application.dto import ObjectId
+from app.core.config import settings
 import io
+from datetime import datetime, timezone
 from google.cloud import speech_v1
 from pydub import AudioSegment
 
@@ -190,6 +192,123 @@ async def test_search_dialogues_with_query(client: AsyncClient, mock_auth_user_a
     assert len(json_data) == 1
     assert json_data[0]['movie']['title'] == dialogue_db['movie']['title']
 
+async def test_search_dialogues_ranked_with_highlights(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    weak_match = mock_dialogue()
+    weak_match['lines'] = [{ "character": "", "text": "Mission accomplished", "start_time": 0, "end_time": 2 }]
+    strong_match = mock_dialogue()
+    strong_match['lines'] = [
+        { "character": "", "text": "Buzz Lightyear mission log", "start_time": 0, "end_time": 2 },
+        { "character": "", "text": "Stardate 4072, the missions continue", "start_time": 2, "end_time": 4 },
+    ]
+    await Mongo.dialogues.insert_many([weak_match, strong_match])
+
+    res = await client.get(f"{BASE_URL}?search=missions log", headers=headers)
+    json_data = res.json()
+
+    assert res.status_code == 200
+    assert len(json_data) == 2
+    assert json_data[0]['lines'][0]['text'] == "Buzz Lightyear mission log"
+    assert json_data[0]['lines'][0]['highlights'] == [[15, 22], [23, 26]]
+    assert json_data[0]['lines'][1]['highlights'] == [[19, 27]]
+
+    res = await client.get(f'{BASE_URL}?search="mission log"', headers=headers)
+    json_data = res.json()
+
+    assert len(json_data) == 1
+    assert json_data[0]['lines'][0]['highlights'] == [[15, 26]]
+
+async def test_search_dialogues_regex_mode_escapes_input(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    dialogue_db = mock_dialogue()
+    dialogue_db['lines'] = [{ "character": "", "text": "Is it 3.14 or 3x14?", "start_time": 0, "end_time": 2 }]
+    await Mongo.dialogues.insert_one(dialogue_db)
+
+    res = await client.get(f"{BASE_URL}?search=3.14&search_mode=regex", headers=headers)
+    json_data = res.json()
+
+    assert res.status_code == 200
+    assert len(json_data) == 1
+    assert json_data[0]['lines'][0]['highlights'] == [[6, 10]]
+
+    res = await client.get(f"{BASE_URL}?search=.*&search_mode=regex", headers=headers)
+
+    assert res.status_code == 200
+    assert len(res.json()) == 0
+
+async def test_search_dialogues_with_cursor(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    await Mongo.dialogues.insert_many([mock_dialogue() for _ in range(5)])
+
+    seen = []
+    url = f"{BASE_URL}?limit=2"
+    while True:
+        res = await client.get(url, headers=headers)
+        assert res.status_code == 200
+        seen.extend(dialogue['_id'] for dialogue in res.json())
+
+        next_cursor = res.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        url = f"{BASE_URL}?limit=2&after={next_cursor}"
+
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+    res = await client.get(f"{BASE_URL}?after=invalid", headers=headers)
+
+    assert res.status_code == 400
+
+async def test_search_dialogues_ranked_with_cursor(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    for _ in range(3):
+        dialogue = mock_dialogue()
+        dialogue["lines"][0]["text"] = "Mission log"
+        await Mongo.dialogues.insert_one(dialogue)
+
+    res = await client.get(f"{BASE_URL}?search=mission&limit=2", headers=headers)
+    first_page = [dialogue['_id'] for dialogue in res.json()]
+
+    res = await client.get(f"{BASE_URL}?search=mission&limit=2&after={res.headers['X-Next-Cursor']}", headers=headers)
+    second_page = [dialogue['_id'] for dialogue in res.json()]
+
+    assert len(first_page) == 2
+    assert len(second_page) == 1
+    assert not set(first_page) & set(second_page)
+    assert "X-Next-Cursor" not in res.headers
+
+async def test_search_dialogues_summary_view(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    dialogue = mock_dialogue()
+    dialogue["lines"] = [
+        { "character": "Woody", "text": "Reach for the sky!", "start_time": 1, "end_time": 2 },
+        { "character": "Buzz", "text": "To infinity and beyond!", "start_time": 3, "end_time": 4 },
+        { "character": "Woody", "text": "That's not flying.", "start_time": 5, "end_time": 6 },
+    ]
+    result = await Mongo.dialogues.insert_one(dialogue)
+
+    res = await client.get(f"{BASE_URL}?view=summary", headers=headers)
+
+    assert res.status_code == 200
+    assert res.json() == [{
+        "_id": str(result.inserted_id),
+        "movie": dialogue["movie"],
+        "difficulty_level": dialogue["difficulty_level"],
+        "duration_seconds": dialogue["duration_seconds"],
+        "line_count": 3,
+        "preview": "Reach for the sky!",
+        "characters": ["Buzz", "Woody"],
+    }]
+
+    res = await client.get(f"{BASE_URL}?fields=line_count,preview", headers=headers)
+
+    assert res.status_code == 200
+    assert res.json() == [{"_id": str(result.inserted_id), "line_count": 3, "preview": "Reach for the sky!"}]
+
+    res = await client.get(f"{BASE_URL}?fields=lines", headers=headers)
+
+    assert res.status_code == 400
+
 async def test_search_dialogues_with_imdb(client: AsyncClient, mock_auth_user_and_header):
     headers, _ = mock_auth_user_and_header
     dialogue_db = mock_dialogue()
@@ -325,6 +444,52 @@ async def test_practice_dialogue_suggestions_return(mock_audio_transcript, clien
     assert len(result_json['suggestions']) == 5
     assert len(result_json['word_timings']) == 10
 
+@patch("google.cloud.speech_v1.SpeechClient.streaming_recognize")
+async def test_practice_dialogue_streamed_body(mock_streaming_recognize, client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    good_result = mock_google_speech_good_result()
+    for result in good_result.results:
+        result.is_final = True
+
+    def streaming_recognize(config, requests, timeout):
+        assert sum(len(request.audio_content) for request in requests) > 0
+        return [speech_v1.StreamingRecognizeResponse(results=good_result.results)]
+
+    mock_streaming_recognize.side_effect = streaming_recognize
+    dialogue_db = mock_dialogue()
+    dialogue_db['lines'] = [
+        { "character": "", "text": "Buzz lightyear mission log", "start_time": 0, "end_time": 2 },
+    ]
+    result = await Mongo.dialogues.insert_one(dialogue_db)
+    dialogue_id = result.inserted_id
+
+    audio_file = mock_audio()
+    res = await client.post(
+        f"{BASE_URL}/{dialogue_id}/practice",
+        content=audio_file.read(),
+        headers={**headers, "Content-Type": "audio/webm"}
+    )
+    result_json = res.json()
+
+    assert res.status_code == 200
+    assert result_json['pronunciation_score'] == 0.8
+    assert result_json['transcribed_text'] == "buzz lightyear mission log"
+    assert len(result_json['word_timings']) == 4
+
+async def test_practice_dialogue_too_large_upload(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    result = await Mongo.dialogues.insert_one(mock_dialogue())
+    dialogue_id = result.inserted_id
+
+    with patch.object(settings, "AUDIO_UPLOAD_MAX_BYTES", 10):
+        res = await client.post(
+            f"{BASE_URL}/{dialogue_id}/practice",
+            content=b"\x00" * 100,
+            headers={**headers, "Content-Type": "audio/webm"}
+        )
+
+    assert res.status_code == 413
+
 async def test_list_practice_history(client: AsyncClient, mock_auth_user_and_header):
     headers, user_auth = mock_auth_user_and_header
 
@@ -381,4 +546,32 @@ async def test_list_practice_history(client: AsyncClient, mock_auth_user_and_hea
     json_data = res.json()
 
     assert res.status_code == 200
-    assert len(json_data) == 0
\ No newline at end of file
+    assert len(json_data) == 0
+
+async def test_list_practice_history_with_cursor(client: AsyncClient, mock_auth_user_and_header):
+    headers, user_auth = mock_auth_user_and_header
+
+    result = await Mongo.dialogues.insert_one(mock_dialogue())
+    practices = []
+    for i in range(5):
+        practice_history = mock_practice_history_db(result.inserted_id)
+        practice_history['user_id'] = user_auth['_id']
+        # Ties on the sort key are broken by _id
+        practice_history['completed_at'] = datetime(2024, 1, 1 + i // 2, tzinfo=timezone.utc)
+        practice_history['xp_earned'] = 10 * (i // 2)
+        practices.append(practice_history)
+    await Mongo.dialogue_practice_history.insert_many(practices)
+    expected = [str(practice['_id']) for practice in reversed(practices)]
+
+    for filter_type in ('recent', 'best'):
+        seen = []
+        url = f"{BASE_URL}/practice/history?filter_type={filter_type}&limit=2"
+        while url:
+            res = await client.get(url, headers=headers)
+            assert res.status_code == 200
+            seen.extend(practice['_id'] for practice in res.json())
+
+            next_cursor = res.headers.get("X-Next-Cursor")
+            url = next_cursor and f"{BASE_URL}/practice/history?filter_type={filter_type}&limit=2&after={next_cursor}"
+
+        assert seen == expected
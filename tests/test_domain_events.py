@@ -1,6 +1,10 @@
+import asyncio
+import time
 import pytest
 from datetime import datetime, timezone
 from app.core.common.domain.events.event_dispatcher import EventDispatcher
+from app.core.common.domain.events.event_handler import EventHandler
+from app.util.metrics import Metrics
 from app.core.users.domain.events.user_leveled_up_event import UserLeveledUpEvent
 from app.core.dialogues.domain.events.practice_completed_event import PracticeCompletedEvent
 from app.core.users.application.event_handlers.achievement_handler import AchievementHandler
@@ -173,4 +177,91 @@ class TestDomainEvents:
         assert event1 != event2
         
         # Event should be equal to itself
-        assert event1 == event1
\ No newline at end of file
+        assert event1 == event1
+
+class RecordingHandler(EventHandler):
+    """Sleeps for `delay` seconds, then records the event, or raises when `error` is set"""
+
+    def __init__(self, name, delay=0.0, ordering_key=None, timeout_seconds=None, error=None, log=None):
+        self.name = name
+        self.delay = delay
+        self.ordering_key = ordering_key
+        self.timeout_seconds = timeout_seconds
+        self.error = error
+        self.log = log if log is not None else []
+
+    @property
+    def event_type(self):
+        return "user.leveled_up"
+
+    async def handle(self, event):
+        self.log.append((self.name, "start", event.new_level))
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.log.append((self.name, "end", event.new_level))
+
+
+def level_up(new_level=2):
+    return UserLeveledUpEvent(user_id=Uuid(), old_level=new_level - 1, new_level=new_level, total_xp=XpPoints(1500))
+
+
+class TestEventDispatcherConcurrency:
+    """Test concurrent dispatch, ordering keys and handler timeouts"""
+
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently(self):
+        dispatcher = EventDispatcher()
+        for name in ("a", "b", "c"):
+            dispatcher.register_handler(RecordingHandler(name, delay=0.1))
+
+        started = time.perf_counter()
+        await dispatcher.publish(level_up())
+
+        assert time.perf_counter() - started < 0.25
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode(self):
+        dispatcher = EventDispatcher(concurrent=False)
+        log = []
+        dispatcher.register_handler(RecordingHandler("a", delay=0.01, log=log))
+        dispatcher.register_handler(RecordingHandler("b", log=log))
+
+        await dispatcher.publish(level_up())
+
+        assert [entry[0] for entry in log] == ["a", "a", "b", "b"]
+
+    @pytest.mark.asyncio
+    async def test_ordering_key_keeps_handlers_serial(self):
+        dispatcher = EventDispatcher()
+        log = []
+        dispatcher.register_handler(RecordingHandler("slow", delay=0.05, ordering_key="user", log=log))
+        dispatcher.register_handler(RecordingHandler("fast", ordering_key="user", log=log))
+
+        await asyncio.gather(
+            dispatcher.publish_all([level_up(2), level_up(3)]),
+            dispatcher.publish(level_up(4)),
+        )
+
+        # Never interleaved, in publish order
+        assert [(name, level) for name, stage, level in log if stage == "start"] == [
+            ("slow", 2), ("fast", 2), ("slow", 3), ("fast", 3), ("slow", 4), ("fast", 4)
+        ]
+        assert all(log[i][0] == log[i + 1][0] for i in range(0, len(log), 2))
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_are_isolated(self):
+        Metrics.reset()
+        dispatcher = EventDispatcher(handler_timeout_seconds=0.05)
+        log = []
+        dispatcher.register_handler(RecordingHandler("Failing", error=RuntimeError("boom"), log=log))
+        dispatcher.register_handler(RecordingHandler("Slow", delay=1, log=log))
+        dispatcher.register_handler(RecordingHandler("Patient", delay=0.1, timeout_seconds=1, log=log))
+
+        await dispatcher.publish(level_up())
+
+        assert ("Patient", "end", 2) in log
+        assert ("Slow", "end", 2) not in log
+        assert Metrics.get_counter("events.handlers.RecordingHandler.errors") == 1
+        assert Metrics.get_counter("events.handlers.RecordingHandler.timeouts") == 1
+        assert Metrics.snapshot()["histograms"]["events.handlers.RecordingHandler.seconds"]["count"] == 3
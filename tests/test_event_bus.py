@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from app.config.event_bus import start_event_bus
+from app.core.common.domain.events import EventBus, EventDispatcher, EventHandler
+from app.core.common.domain.events.event_dispatcher import event_dispatcher
+from app.core.common.domain.value_objects import Uuid, XpPoints
+from app.core.users.domain.events.user_leveled_up_event import UserLeveledUpEvent
+from app.util.metrics import Metrics
+
+
+class GatedHandler(EventHandler):
+    """Records the levels it handles, each handling waits for the gate to open"""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.handled = []
+
+    @property
+    def event_type(self):
+        return "user.leveled_up"
+
+    async def handle(self, event):
+        await self.gate.wait()
+        self.handled.append(event.new_level)
+
+
+def level_up(new_level=2):
+    return UserLeveledUpEvent(user_id=Uuid(), old_level=new_level - 1, new_level=new_level, total_xp=XpPoints(1500))
+
+
+def make_bus(overflow_policy=EventBus.INLINE, max_size=10, consumers=1, queued=("user.leveled_up",)):
+    Metrics.reset()
+    dispatcher = EventDispatcher()
+    handler = GatedHandler()
+    dispatcher.register_handler(handler)
+    bus = EventBus(dispatcher, max_size=max_size, consumers=consumers, overflow_policy=overflow_policy, put_timeout_seconds=0.05)
+    dispatcher.attach_bus(bus, queued)
+    return dispatcher, bus, handler
+
+
+@pytest.mark.asyncio
+async def test_queued_events_do_not_wait_for_the_handlers():
+    dispatcher, bus, handler = make_bus()
+    bus.start()
+
+    await asyncio.wait_for(dispatcher.publish_all([level_up(2), level_up(3)]), 1)
+    assert handler.handled == []
+
+    handler.gate.set()
+    await bus.stop(drain_timeout_seconds=1)
+
+    assert handler.handled == [2, 3]
+    assert Metrics.get_counter("events.bus.enqueued") == 2
+
+
+@pytest.mark.asyncio
+async def test_other_event_types_are_handled_inline():
+    dispatcher, bus, handler = make_bus(queued=("dialogue.practice_completed",))
+    bus.start()
+    handler.gate.set()
+
+    await dispatcher.publish(level_up())
+
+    assert handler.handled == [2]
+    assert Metrics.get_counter("events.bus.enqueued") == 0
+    await bus.stop(drain_timeout_seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_then_handles_inline():
+    dispatcher, bus, handler = make_bus(consumers=2)
+    bus.start()
+    await dispatcher.publish_all([level_up(level) for level in range(2, 7)])
+
+    handler.gate.set()
+    await bus.stop(drain_timeout_seconds=1)
+    assert sorted(handler.handled) == [2, 3, 4, 5, 6]
+
+    await bus.put(level_up(7))
+    assert handler.handled[-1] == 7
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_drops_the_remaining_events():
+    dispatcher, bus, handler = make_bus()
+    bus.start()
+    await dispatcher.publish_all([level_up(2), level_up(3)])
+
+    await bus.stop(drain_timeout_seconds=0.05)
+
+    assert handler.handled == []
+    assert Metrics.get_counter("events.bus.dropped") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy, expected", [
+    (EventBus.DROP_NEWEST, [2, 3]),
+    (EventBus.DROP_OLDEST, [2, 4]),
+    (EventBus.BLOCK, [2, 3]),
+    (EventBus.INLINE, [2, 3, 4]),
+])
+async def test_overflow_policies(policy, expected):
+    dispatcher, bus, handler = make_bus(policy, max_size=1)
+    bus.start()
+
+    await dispatcher.publish(level_up(2))
+    # The consumer holds event 2, event 3 fills the queue
+    await asyncio.sleep(0)
+    await dispatcher.publish(level_up(3))
+
+    if policy == EventBus.INLINE:
+        # Handled by the publisher itself
+        handler.gate.set()
+        await asyncio.wait_for(dispatcher.publish(level_up(4)), 1)
+        assert 4 in handler.handled
+    else:
+        await asyncio.wait_for(dispatcher.publish(level_up(4)), 1)
+
+    handler.gate.set()
+    await bus.stop(drain_timeout_seconds=1)
+
+    assert sorted(handler.handled) == expected
+    assert Metrics.get_counter(f"events.bus.overflow.{policy}") == 1
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        EventBus(EventDispatcher(), max_size=1, consumers=1, overflow_policy="explode")
+
+
+def test_bus_is_not_started_with_the_outbox():
+    with patch("app.config.event_bus.settings.EVENT_BUS_ENABLED", True), \
+            patch("app.config.event_bus.settings.OUTBOX_ENABLED", True):
+        start_event_bus()
+
+    assert event_dispatcher.detach_bus() is None
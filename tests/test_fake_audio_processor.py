@@ -0,0 +1,63 @@
+import pytest
+from statistics import mean
+from unittest.mock import patch
+
+from app.adapters.fake_audio_processor import FakeAudioProcessor
+from app.core.common.ports import AudioProcessorBusyError
+from app.core.config import settings
+from app.integration.connector import get_audio_processor_connector
+
+
+@pytest.mark.asyncio
+async def test_same_audio_produces_same_transcript():
+    audio = bytes(range(256)) * 500
+
+    first = await FakeAudioProcessor(seed=1).process_audio_transcript(audio)
+    second = await FakeAudioProcessor(seed=2).process_audio_transcript(audio)
+    other = await FakeAudioProcessor(seed=1).process_audio_transcript(audio[:-1] + b"x")
+
+    assert first == second
+    assert first != other
+    assert len(first.words) == 10
+    assert all(0.6 <= word["confidence"] <= 0.99 for word in first.words)
+    assert all(word["start_time"] < word["end_time"] for word in first.words)
+
+
+@pytest.mark.asyncio
+async def test_empty_audio_has_no_words():
+    result = await FakeAudioProcessor().process_audio_transcript(b"")
+
+    assert result.transcribed_text == ""
+    assert result.confidence == 0
+
+
+@pytest.mark.asyncio
+async def test_error_rates():
+    processor = FakeAudioProcessor(busy_rate=1.0, retry_after=3)
+    with pytest.raises(AudioProcessorBusyError) as exc_info:
+        await processor.process_audio_transcript(b"audio")
+    assert exc_info.value.retry_after == 3
+
+    with pytest.raises(RuntimeError):
+        await FakeAudioProcessor(error_rate=1.0).process_audio_transcript(b"audio")
+
+
+def test_latency_distributions_honor_mean():
+    for distribution in FakeAudioProcessor.latency_distributions:
+        processor = FakeAudioProcessor(
+            latency_mean_seconds=0.2,
+            latency_stddev_seconds=0.05,
+            latency_distribution=distribution,
+            seed=7
+        )
+        samples = [processor._sample_latency() for _ in range(5000)]
+        assert mean(samples) == pytest.approx(0.2, rel=0.05)
+        assert min(samples) >= 0
+
+
+def test_connector_selects_processor_from_settings():
+    with patch.object(settings, "AUDIO_PROCESSOR", "Fake"):
+        assert isinstance(get_audio_processor_connector(), FakeAudioProcessor)
+
+    with patch.object(settings, "AUDIO_PROCESSOR", "Unknown"), pytest.raises(ValueError):
+        get_audio_processor_connector()
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from google.cloud import speech_v1
+
+from app.adapters.google_audio_processor import GoogleAudioProcessor
+from app.core.common.ports import AudioProcessorBusyError
+from app.core.config import settings
+from app.util.metrics import Metrics
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@pytest.fixture
+def processor():
+    with patch("google.oauth2.service_account.Credentials.from_service_account_file"), \
+         patch("google.cloud.speech_v1.SpeechClient") as mock_client_cls, \
+         patch.object(settings, "AUDIO_PROCESSOR_MAX_CONCURRENCY", 1), \
+         patch.object(settings, "AUDIO_PROCESSOR_ACQUIRE_TIMEOUT_SECONDS", 0.05):
+        mock_client_cls.return_value = MagicMock()
+        instance = GoogleAudioProcessor()
+        instance._get_audio_duration = lambda audio_data: 1.0
+        yield instance
+        instance.shutdown()
+
+
+async def test_recognition_does_not_block_event_loop(processor):
+    release = threading.Event()
+
+    def slow_recognize(config, audio):
+        release.wait(timeout=5)
+        return speech_v1.RecognizeResponse()
+
+    processor.speech_client.recognize.side_effect = slow_recognize
+
+    task = asyncio.create_task(processor.process_audio_transcript(b"audio"))
+    await asyncio.sleep(0.01)
+
+    # The loop is still free to run other coroutines while recognition waits
+    assert not task.done()
+    release.set()
+
+    result = await task
+    assert result.transcribed_text == ""
+    assert result.words == []
+
+
+async def test_saturated_processor_raises_busy_error(processor):
+    release = threading.Event()
+
+    def slow_recognize(config, audio):
+        release.wait(timeout=5)
+        return speech_v1.RecognizeResponse()
+
+    processor.speech_client.recognize.side_effect = slow_recognize
+    rejected_before = Metrics.get_counter("audio_processor.rejected")
+
+    first = asyncio.create_task(processor.process_audio_transcript(b"audio"))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(AudioProcessorBusyError) as exc_info:
+        await processor.process_audio_transcript(b"audio")
+
+    release.set()
+    await first
+
+    assert exc_info.value.retry_after == settings.AUDIO_PROCESSOR_RETRY_AFTER_SECONDS
+    assert Metrics.get_counter("audio_processor.rejected") == rejected_before + 1
+    assert Metrics.get_gauge("audio_processor.in_flight") == 0
+    assert Metrics.get_gauge("audio_processor.waiting") == 0
+
+
+async def chunks_of(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_streaming_recognition_splits_requests_and_joins_results(processor):
+    sent = []
+
+    def streaming_recognize(config, requests, timeout):
+        sent.extend(len(request.audio_content) for request in requests)
+        return [
+            speech_v1.StreamingRecognizeResponse(results=[
+                speech_v1.StreamingRecognitionResult(is_final=False, alternatives=[
+                    speech_v1.SpeechRecognitionAlternative(transcript="hel")
+                ]),
+            ]),
+            speech_v1.StreamingRecognizeResponse(results=[
+                speech_v1.StreamingRecognitionResult(is_final=True, alternatives=[
+                    speech_v1.SpeechRecognitionAlternative(transcript="hello", confidence=0.9, words=[
+                        speech_v1.WordInfo(word="hello", end_time={"nanos": 500000000})
+                    ])
+                ]),
+            ]),
+            speech_v1.StreamingRecognizeResponse(results=[
+                speech_v1.StreamingRecognitionResult(is_final=True, alternatives=[
+                    speech_v1.SpeechRecognitionAlternative(transcript=" world", confidence=0.7)
+                ]),
+            ]),
+        ]
+
+    processor.speech_client.streaming_recognize.side_effect = streaming_recognize
+
+    result = await processor.process_audio_stream(chunks_of(b"a" * 30 * 1024, b"b" * 10))
+
+    assert sent == [25 * 1024, 5 * 1024, 10]
+    assert result.transcribed_text == "hello world"
+    assert result.confidence == pytest.approx(0.8)
+    assert result.words == [{"word": "hello", "start_time": 0.0, "end_time": 0.5, "confidence": pytest.approx(0.9)}]
+
+
+async def test_streaming_recognition_reraises_upload_errors(processor):
+    async def failing_chunks():
+        yield b"audio"
+        raise ValueError("upload aborted")
+
+    def streaming_recognize(config, requests, timeout):
+        list(requests)
+        return []
+
+    processor.speech_client.streaming_recognize.side_effect = streaming_recognize
+
+    with pytest.raises(ValueError, match="upload aborted"):
+        await processor.process_audio_stream(failing_chunks())
+    processor.speech_client.streaming_recognize.assert_not_called()
+
+
+async def test_slow_upload_does_not_hold_a_slot(processor):
+    slot_taken = []
+
+    async def slow_chunks():
+        for chunk in (b"a", b"b"):
+            await asyncio.sleep(0.01)
+            slot_taken.append(processor.semaphore.locked())
+            yield chunk
+
+    def streaming_recognize(config, requests, timeout):
+        list(requests)
+        return []
+
+    processor.speech_client.streaming_recognize.side_effect = streaming_recognize
+
+    await processor.process_audio_stream(slow_chunks())
+
+    assert slot_taken == [False, False]
+    processor.speech_client.streaming_recognize.assert_called_once()
+
+
+@pytest.mark.parametrize("acquired", [False, True])
+async def test_abandoned_acquire_gives_back_a_granted_slot(processor, acquired):
+    await processor.semaphore.acquire()
+    acquire = asyncio.ensure_future(processor.semaphore.acquire())
+    await asyncio.sleep(0)
+
+    # The slot is granted as the wait times out, before or after the acquiring task resumes
+    processor.semaphore.release()
+    if acquired:
+        await asyncio.sleep(0)
+        assert acquire.done()
+    processor._abandon_acquire(acquire)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert not processor.semaphore.locked()
@@ -0,0 +1,168 @@
+import asyncio
+import base64
+import time
+
+import pytest
+import pytest_asyncio
+import rsa
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+
+from app.core.config import settings
+from app.integration.google_id_token import GoogleIdTokenVerifier, GoogleKeysUnavailableError
+from app.integration.http_client import HttpClient
+
+AUDIENCE = "client-id.apps.googleusercontent.com"
+
+
+def b64_int(value: int) -> str:
+    data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+@pytest.fixture(scope="module")
+def key_pairs():
+    return {kid: rsa.newkeys(1024) for kid in ("key-1", "key-2")}
+
+
+def sign(key_pairs, kid: str = "key-1", **claims) -> str:
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": AUDIENCE,
+        "sub": "1234567890",
+        "email": "test@example.com",
+        "iat": now,
+        "exp": now + 3600,
+        **claims,
+    }
+    signer = crypt.RSASigner.from_string(key_pairs[kid][1].save_pkcs1(), key_id=kid)
+    return google_jwt.encode(signer, payload).decode()
+
+
+@pytest_asyncio.fixture
+async def jwks_server(key_pairs, monkeypatch):
+    """Local certs endpoint publishing the keys listed in state["kids"]"""
+    state = {"kids": ["key-1"], "calls": 0, "status": 200, "max_age": 3600}
+
+    async def handler(request: web.Request) -> web.Response:
+        state["calls"] += 1
+        keys = [
+            {"kty": "RSA", "alg": "RS256", "use": "sig", "kid": kid,
+             "n": b64_int(key_pairs[kid][0].n), "e": b64_int(key_pairs[kid][0].e)}
+            for kid in state["kids"]
+        ]
+        headers = {"Cache-Control": f"public, max-age={state['max_age']}, must-revalidate"}
+        return web.json_response({"keys": keys}, status=state["status"], headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/certs", handler)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(settings, "GOOGLE_JWKS_URL", str(server.make_url("/certs")))
+    monkeypatch.setattr(settings, "HTTP_CLIENT_MAX_RETRIES", 0)
+
+    # Started outside of the app lifespan, the REST tests may hold the session
+    previous, HttpClient.session = HttpClient.session, None
+    await HttpClient.startup()
+    monkeypatch.setattr(GoogleIdTokenVerifier, "keys", {})
+    monkeypatch.setattr(GoogleIdTokenVerifier, "fetched_at", 0.0)
+    monkeypatch.setattr(GoogleIdTokenVerifier, "expires_at", 0.0)
+    monkeypatch.setattr(GoogleIdTokenVerifier, "_refresh", None)
+    try:
+        yield state
+    finally:
+        await GoogleIdTokenVerifier._shutdown()
+        await HttpClient.shutdown()
+        HttpClient.session = previous
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_keys_are_fetched_once_and_verified_locally(jwks_server, key_pairs):
+    claims = await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+    await GoogleIdTokenVerifier.verify(sign(key_pairs, sub="other"), AUDIENCE)
+
+    assert claims["sub"] == "1234567890"
+    assert claims["email"] == "test@example.com"
+    assert jwks_server["calls"] == 1
+    assert GoogleIdTokenVerifier.expires_at - GoogleIdTokenVerifier.fetched_at == pytest.approx(3600)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("claims", [
+    {"aud": "another-client"},
+    {"iss": "https://evil.example.com"},
+    {"exp": int(time.time()) - 3600, "iat": int(time.time()) - 7200},
+])
+async def test_invalid_claims(jwks_server, key_pairs, claims):
+    with pytest.raises(ValueError):
+        await GoogleIdTokenVerifier.verify(sign(key_pairs, **claims), AUDIENCE)
+
+
+@pytest.mark.asyncio
+async def test_invalid_signature(jwks_server, key_pairs):
+    header, payload, _ = sign(key_pairs).split(".")
+    forged = ".".join([header, payload, sign(key_pairs, "key-2").split(".")[2]])
+
+    with pytest.raises(ValueError):
+        await GoogleIdTokenVerifier.verify(forged, AUDIENCE)
+    with pytest.raises(ValueError):
+        await GoogleIdTokenVerifier.verify("not a token", AUDIENCE)
+
+
+@pytest.mark.asyncio
+async def test_rotated_key_triggers_a_refresh(jwks_server, key_pairs, monkeypatch):
+    monkeypatch.setattr(settings, "GOOGLE_JWKS_MIN_REFRESH_INTERVAL_SECONDS", 0)
+    await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+
+    jwks_server["kids"] = ["key-1", "key-2"]
+    claims = await GoogleIdTokenVerifier.verify(sign(key_pairs, "key-2"), AUDIENCE)
+
+    assert claims["sub"] == "1234567890"
+    assert jwks_server["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_keys_are_refreshed_in_the_background_before_they_expire(jwks_server, key_pairs, monkeypatch):
+    jwks_server["max_age"] = 60
+    monkeypatch.setattr(settings, "GOOGLE_JWKS_REFRESH_AHEAD_SECONDS", 120)
+    await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+
+    # Still valid, answered with the cached keys while they are refreshed
+    await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+    assert jwks_server["calls"] == 1
+    await GoogleIdTokenVerifier._refresh
+
+    assert jwks_server["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_previous_keys_are_used_when_the_refresh_fails(jwks_server, key_pairs):
+    await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+    GoogleIdTokenVerifier.expires_at = time.monotonic() - 1
+    jwks_server["status"] = 503
+
+    claims = await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+
+    assert claims["sub"] == "1234567890"
+    assert jwks_server["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_no_keys_available(jwks_server, key_pairs):
+    jwks_server["status"] = 503
+
+    with pytest.raises(GoogleKeysUnavailableError):
+        await GoogleIdTokenVerifier.verify(sign(key_pairs), AUDIENCE)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logins_share_the_fetch(jwks_server, key_pairs):
+    token = sign(key_pairs)
+
+    await asyncio.gather(*(GoogleIdTokenVerifier.verify(token, AUDIENCE) for _ in range(10)))
+
+    assert jwks_server["calls"] == 1
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientConnectionError, web
+from aiohttp.test_utils import TestServer
+
+from app.core.config import settings
+from app.integration.http_client import HttpClient
+
+
+@pytest_asyncio.fixture
+async def stub_server(monkeypatch):
+    """Local upstream answering with the queued (status, headers) responses, then 200"""
+    monkeypatch.setattr(settings, "HTTP_CLIENT_RETRY_BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "HTTP_CLIENT_READ_TIMEOUT_SECONDS", 0.2)
+    state = {"responses": [], "calls": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        state["calls"] += 1
+        if request.path == "/slow":
+            await asyncio.sleep(1)
+        if state["responses"]:
+            status, headers = state["responses"].pop(0)
+            return web.Response(status=status, headers=headers, text="error")
+        return web.json_response({"ok": True, "method": request.method})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    # Started outside of the app lifespan, the REST tests may hold the session
+    previous, HttpClient.session = HttpClient.session, None
+    await HttpClient.startup()
+    try:
+        yield server, state
+    finally:
+        await HttpClient.shutdown()
+        HttpClient.session = previous
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_session_uses_the_tuned_connector(stub_server):
+    connector = HttpClient.session.connector
+
+    assert connector.limit == settings.HTTP_CLIENT_LIMIT
+    assert connector.limit_per_host == settings.HTTP_CLIENT_LIMIT_PER_HOST
+    assert HttpClient.session.timeout.connect == settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_retries_overloaded_responses_honoring_retry_after(stub_server):
+    server, state = stub_server
+    state["responses"] = [(503, {"Retry-After": "0"}), (429, {})]
+
+    async with HttpClient.request("POST", str(server.make_url("/download"))) as response:
+        assert response.status == 200
+        assert await response.json() == {"ok": True, "method": "POST"}
+
+    assert state["calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_last_response_is_returned_when_retries_are_exhausted(stub_server):
+    server, state = stub_server
+    state["responses"] = [(503, {})] * 3
+
+    async with HttpClient.request("GET", str(server.make_url("/features")), max_retries=2) as response:
+        assert response.status == 503
+
+    assert state["calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(stub_server):
+    server, state = stub_server
+    state["responses"] = [(404, {})]
+
+    async with HttpClient.request("GET", str(server.make_url("/subtitles"))) as response:
+        assert response.status == 404
+
+    assert state["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_read_timeouts_are_retried_for_idempotent_methods_only(stub_server):
+    server, state = stub_server
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with HttpClient.request("GET", str(server.make_url("/slow")), max_retries=1):
+            pass
+    assert state["calls"] == 2
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with HttpClient.request("POST", str(server.make_url("/slow"))):
+            pass
+    assert state["calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_raised_after_the_retries(stub_server):
+    server, _ = stub_server
+    url = str(server.make_url("/features"))
+    await server.close()
+
+    with pytest.raises(ClientConnectionError):
+        async with HttpClient.request("GET", url, max_retries=1):
+            pass
+
+
+@pytest.mark.parametrize("attempt, retry_after, low, high", [
+    (1, None, 0, 0.5),
+    (3, None, 0, 2.0),
+    (20, None, 0, 10.0),
+    (1, "2", 2, 2),
+    (1, "3600", 10, 10),
+    (1, "-1", 0, 0),
+    (1, "Wed, 21 Oct 2015 07:28:00 GMT", 0, 0),
+])
+def test_retry_delay(attempt, retry_after, low, high):
+    assert low <= HttpClient.retry_delay(attempt, retry_after) <= high
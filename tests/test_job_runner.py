@@ -0,0 +1,156 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.jobs.domain import JobEntity
+from app.integration.job_runner import JobRunner
+from app.util.backoff import exponential_backoff
+
+
+def make_job(attempts: int = 1, max_attempts: int = 3) -> JobEntity:
+    return JobEntity.create(type="test_job", payload={"n": 1}, attempts=attempts, max_attempts=max_attempts)
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock()
+    for method in ("complete", "retry", "fail", "release", "renew_lease", "update_progress"):
+        setattr(repo, method, AsyncMock(return_value=True))
+    with patch.object(JobRunner, "repo", repo), patch.dict(JobRunner.handlers, clear=True):
+        yield repo
+
+
+def test_backoff_is_exponential_and_capped():
+    assert exponential_backoff(1, 5, 60) == timedelta(seconds=5)
+    assert exponential_backoff(3, 5, 60) == timedelta(seconds=20)
+    assert exponential_backoff(10, 5, 60) == timedelta(seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_completed_job_stores_result_and_progress(repo):
+    async def handler(job, progress):
+        await progress({"scenes_parsed": 4})
+        return {"dialogues_count": job.payload["n"]}
+
+    JobRunner.register("test_job", handler)
+    job = make_job()
+    await JobRunner.run_job(job)
+
+    repo.update_progress.assert_awaited_once()
+    assert repo.update_progress.await_args.args[2] == {"scenes_parsed": 4}
+    repo.complete.assert_awaited_once_with(str(job.id), JobRunner.owner, {"dialogues_count": 1})
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff(repo):
+    JobRunner.register("test_job", AsyncMock(side_effect=RuntimeError("boom")))
+    job = make_job(attempts=2)
+
+    before = datetime.now(timezone.utc)
+    with patch("app.integration.job_runner.settings.JOB_RETRY_BACKOFF_SECONDS", 10):
+        await JobRunner.run_job(job)
+
+    repo.retry.assert_awaited_once()
+    _, _, error, run_at = repo.retry.await_args.args
+    assert error == "boom"
+    assert run_at - before >= timedelta(seconds=20)
+    repo.fail.assert_not_awaited()
+
+
+@pytest.mark.parametrize("job, error", [
+    (make_job(attempts=3, max_attempts=3), RuntimeError("boom")),
+    (make_job(attempts=1), HTTPException(status_code=404, detail="Subtitle not found")),
+])
+@pytest.mark.asyncio
+async def test_job_fails_without_attempts_left_or_on_client_errors(repo, job, error):
+    JobRunner.register("test_job", AsyncMock(side_effect=error))
+
+    await JobRunner.run_job(job)
+
+    repo.fail.assert_awaited_once()
+    repo.retry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_is_released(repo):
+    started = asyncio.Event()
+
+    async def handler(job, progress):
+        started.set()
+        await asyncio.sleep(10)
+
+    JobRunner.register("test_job", handler)
+    job = make_job()
+    task = asyncio.create_task(JobRunner.run_job(job))
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    repo.release.assert_awaited_once_with(str(job.id), JobRunner.owner)
+    repo.complete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_type_fails(repo):
+    await JobRunner.run_job(make_job())
+
+    repo.fail.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_workers_run_claimed_jobs_and_stop(repo):
+    jobs = [make_job()]
+    repo.claim_next = AsyncMock(side_effect=lambda owner, lease_seconds: jobs.pop() if jobs else None)
+    done = asyncio.Event()
+
+    async def handler(job, progress):
+        done.set()
+        return {}
+
+    JobRunner.register("test_job", handler)
+    await JobRunner._startup()
+    await asyncio.wait_for(done.wait(), 1)
+    # A wakeup racing with the shutdown must not keep the workers alive
+    JobRunner.notify()
+    await asyncio.wait_for(JobRunner._shutdown(), 1)
+
+    repo.complete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_the_active_job_with_the_same_key():
+    from app.business.job_bo import JobBusiness
+
+    active = make_job()
+    job_repo = MagicMock()
+    job_repo.create_or_find_active = AsyncMock(return_value=(active, False))
+
+    with patch.object(JobBusiness, "job_repo", job_repo), patch.object(JobRunner, "notify") as notify:
+        job = await JobBusiness.enqueue("test_job", {"n": 2}, key="test_job:1")
+
+    assert job.id == str(active.id)
+    assert job_repo.create_or_find_active.await_args.args[0].key == "test_job:1"
+    notify.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_claim_only_retakes_expired_leases_with_attempts_left():
+    from app.core.jobs.infra.database.repositories import JobMongoRepository
+
+    jobs = MagicMock()
+    jobs.update_many = AsyncMock()
+    jobs.find_one_and_update = AsyncMock(return_value=None)
+
+    with patch("app.core.jobs.infra.database.repositories.job_mongo_repo.Mongo.jobs", jobs, create=True):
+        assert await JobMongoRepository().claim_next("worker", 60) is None
+
+    exhausted, update = jobs.update_many.await_args.args
+    assert exhausted["$expr"] == {"$gte": ["$attempts", "$max_attempts"]}
+    assert update["$set"]["status"] == "failed"
+    pending, expired = jobs.find_one_and_update.await_args.args[0]["$or"]
+    assert "$expr" not in pending
+    assert expired["$expr"] == {"$lt": ["$attempts", "$max_attempts"]}
@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.integration.mongo_indexes import ensure_indexes, get_index_registry, get_index_report
+
+
+def index_keys(collection_name: str):
+    return [list(index.document["key"].items()) for index in get_index_registry()[collection_name]]
+
+
+def test_registry_covers_query_paths():
+    assert index_keys("users") == [[("google_id", 1)], [("email", 1)]]
+    assert index_keys("movies_processed") == [[("imdb_id", 1)]]
+    assert index_keys("dialogues") == [
+        [("movie.imdb_id", 1)],
+        [("scene_key", 1)],
+        [("movie.title", "text"), ("lines.text", "text")],
+    ]
+    assert index_keys("dialogue_practice_history") == [
+        [("user_id", 1), ("completed_at", -1), ("_id", -1)],
+        [("user_id", 1), ("xp_earned", -1), ("_id", -1)],
+    ]
+
+    users = {index.document["name"]: index.document for index in get_index_registry()["users"]}
+    assert users["email_unique"]["unique"]
+    assert users["google_id_unique"]["partialFilterExpression"] == {"google_id": {"$gt": ""}}
+
+    assert index_keys("subtitle_contents") == []
+    cache = {index.document["name"]: index.document for index in get_index_registry()["transcription_cache"]}
+    assert cache["created_at_1"]["expireAfterSeconds"] > 0
+
+    jobs = {index.document["name"]: index.document for index in get_index_registry()["jobs"]}
+    assert jobs["active_key_unique"]["unique"]
+    assert jobs["active_key_unique"]["partialFilterExpression"] == {"active_key": {"$type": "string"}}
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_keeps_going_after_a_failure():
+    collections = {}
+
+    def get_collection(name):
+        collection = collections.setdefault(name, MagicMock())
+        collection.create_indexes = AsyncMock(side_effect=RuntimeError("duplicate key") if name == "users" else None)
+        return collection
+
+    db = MagicMock()
+    db.__getitem__.side_effect = get_collection
+
+    with patch("app.integration.mongo_indexes.Mongo.db", db):
+        await ensure_indexes()
+
+    assert set(collections) == {name for name, indexes in get_index_registry().items() if indexes}
+    for collection in collections.values():
+        collection.create_indexes.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_report_lists_missing_undeclared_and_unused_indexes():
+    async def index_stats():
+        for stats in ({"name": "_id_", "accesses": {"ops": 10}}, {"name": "email_unique", "accesses": {"ops": 0}}, {"name": "name_1", "accesses": {"ops": 3}}):
+            yield stats
+
+    users = MagicMock()
+    users.index_information = AsyncMock(return_value={
+        "_id_": {"key": [("_id", 1)]},
+        "email_unique": {"key": [("email", 1.0)]},
+        "name_1": {"key": [("name", 1)]},
+    })
+    users.aggregate = MagicMock(return_value=index_stats())
+
+    with patch("app.integration.mongo_indexes.get_index_registry", return_value={"users": get_index_registry()["users"]}), \
+         patch("app.integration.mongo_indexes.Mongo.db", {"users": users}):
+        report = await get_index_report()
+
+    assert report["users"]["missing"] == ["google_id_unique"]
+    assert report["users"]["undeclared"] == ["name_1"]
+    assert report["users"]["unused"] == ["email_unique"]
+
+
+@pytest.mark.asyncio
+async def test_report_matches_text_indexes_by_weights():
+    async def index_stats():
+        yield {"name": "dialogue_text", "accesses": {"ops": 5}}
+
+    dialogues = MagicMock()
+    dialogues.index_information = AsyncMock(return_value={
+        "_id_": {"key": [("_id", 1)]},
+        "movie_imdb_id": {"key": [("movie.imdb_id", 1)]},
+        "scene_key_unique": {"key": [("scene_key", 1)]},
+        "dialogue_text": {"key": [("_fts", "text"), ("_ftsx", 1)], "weights": {"lines.text": 1, "movie.title": 3}},
+    })
+    dialogues.aggregate = MagicMock(return_value=index_stats())
+
+    with patch("app.integration.mongo_indexes.get_index_registry", return_value={"dialogues": get_index_registry()["dialogues"]}), \
+         patch("app.integration.mongo_indexes.Mongo.db", {"dialogues": dialogues}):
+        report = await get_index_report()
+
+    assert report["dialogues"]["missing"] == []
+    assert report["dialogues"]["undeclared"] == []
+    assert report["dialogues"]["unused"] == ["movie_imdb_id", "scene_key_unique"]
@@ -1,9 +1,15 @@
 import re
+import asyncio
 import pytest
+from unittest.mock import patch
 import pytest_asyncio
 from httpx import AsyncClient
 from app.http.rest.v1 import movie_v1
 from app.integration.mongo import Mongo
+from app.business.subtitles_bo import SubtitlesBussiness
+from app.business.movie_bo import MovieBusiness
+from app.adapters.cached_subtitle_movies import CachedSubtitleMovies
+from app.core.config import settings
 
 BASE_URL = movie_v1.prefix
 MOVIE_IMDB_ID = "123"
@@ -14,6 +20,11 @@ pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("wipe_data")]
 async def wipe_data():
     await Mongo.dialogues.delete_many({})
     await Mongo.movies_processed.delete_many({})
+    await Mongo.subtitle_contents.delete_many({})
+    await Mongo.jobs.delete_many({})
+    # The test app lives for the whole session, searches must reach the mocked API
+    if isinstance(MovieBusiness.subtitle_movie, CachedSubtitleMovies):
+        MovieBusiness.subtitle_movie.clear()
 
 def mock_open_subtitles_movie():
     return {
@@ -26,6 +37,20 @@ def mock_open_subtitles_movie():
         }
     }
 
+async def process_movie_and_wait(client: AsyncClient, headers: dict) -> dict:
+    res = await client.post(f"{BASE_URL}/{MOVIE_IMDB_ID}/process", headers=headers)
+    assert res.status_code == 202
+
+    job = res.json()
+    for _ in range(100):
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        await asyncio.sleep(0.05)
+        res = await client.get(f"{BASE_URL}/jobs/{job['_id']}", headers=headers)
+        assert res.status_code == 200
+        job = res.json()
+    raise AssertionError(f"Job did not finish: {job}")
+
 def mock_get_subtitle_content ():
     return """
         00:02:19,723 --> 00:02:20,929
@@ -42,34 +67,34 @@ def mock_get_subtitle_content ():
         of intelligent life anywhere.
 
         4
-        00:03:25,330 --> 00:03:27,742
+        00:02:28,330 --> 00:02:30,742
         Come to me, my prey.
 
         5
-        00:04:10,000 --> 00:04:13,743
+        00:02:31,000 --> 00:02:34,743
         To infinity and beyond!
 
         6
-        00:04:25,807 --> 00:04:28,594
+        00:02:35,807 --> 00:02:38,594
         So, we meet again,
         buzz lightyear, for the last time.
 
         7
-        00:04:28,685 --> 00:04:30,016
+        00:02:38,685 --> 00:02:40,016
         Not today, zurg!
 
         8
-        00:04:49,331 --> 00:04:51,572
+        00:02:41,331 --> 00:02:43,572
         - No, no, no, no.
         - Oh, you almost had him.
 
         9
-        00:04:51,708 --> 00:04:54,745
+        00:02:43,708 --> 00:02:46,745
         - I'm never gonna defeat zurg!
         - Sure, you will, Rex.
 
         10
-        00:04:54,836 --> 00:04:56,355
+        00:02:46,836 --> 00:02:48,355
         In fact, you're a better buzz than I am.
     """
 
@@ -149,12 +174,10 @@ async def test_process_movie_sub_empty_content(client: AsyncClient, responses, m
         body=""
     )
 
-    res = await client.post(f"{BASE_URL}/{MOVIE_IMDB_ID}/process", headers=headers)
-
-    json = res.json()
+    job = await process_movie_and_wait(client, headers)
 
-    assert res.status_code == 200
-    assert json.get('dialogues_count') == 0
+    assert job['status'] == 'succeeded'
+    assert job['result'].get('dialogues_count') == 0
 
 async def test_process_movie_with_no_cache(client: AsyncClient, responses, mock_auth_user_and_header):
     headers, _ = mock_auth_user_and_header
@@ -173,12 +196,22 @@ async def test_process_movie_with_no_cache(client: AsyncClient, responses, mock_
         body=mock_get_subtitle_content()
     )
 
-    res = await client.post(f"{BASE_URL}/{MOVIE_IMDB_ID}/process", headers=headers)
+    job = await process_movie_and_wait(client, headers)
 
-    json = res.json()
+    assert job['status'] == 'succeeded'
+    assert job['result'].get('dialogues_count') == 1
+    assert job['progress'] == {"stage": "done", "scenes_parsed": 1, "dialogues_stored": 1}
+
+    # The raw subtitle is stored compressed, out of the movie document
+    movie = await Mongo.movies_processed.find_one({"imdb_id": MOVIE_IMDB_ID})
+    blob = await Mongo.subtitle_contents.find_one({"_id": movie['content_id']})
+    assert 'content' not in movie
+    assert blob['size'] == len(mock_get_subtitle_content().encode())
+    assert blob['stored_size'] < blob['size']
 
+    res = await client.get(f"{BASE_URL}/processed", headers=headers)
     assert res.status_code == 200
-    assert json.get('dialogues_count') == 1
+    assert 'content' not in res.json()[0]
 
 async def test_process_movie_with_cache(client: AsyncClient, responses, mock_auth_user_and_header):
     headers, _ = mock_auth_user_and_header
@@ -201,12 +234,66 @@ async def test_process_movie_with_cache(client: AsyncClient, responses, mock_aut
         body=mock_get_subtitle_content()
     )
 
-    res = await client.post(f"{BASE_URL}/{MOVIE_IMDB_ID}/process", headers=headers)
+    job = await process_movie_and_wait(client, headers)
 
-    json = res.json()
+    assert job['status'] == 'succeeded'
+    assert job['result'].get('dialogues_count') == 0
 
-    assert res.status_code == 200
-    assert json.get('dialogues_count') == 0
+async def test_process_movie_is_idempotent(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    movie_processed_db = mock_movie_processed_db()
+    movie_processed_db['content'] = mock_get_subtitle_content()
+    await Mongo.movies_processed.insert_one(movie_processed_db)
+    # Dialogue stored before scene keys, replaced by the first run
+    await Mongo.dialogues.insert_one({"movie": {"imdb_id": MOVIE_IMDB_ID, "title": "", "language": "en"}, "lines": []})
+
+    job = await process_movie_and_wait(client, headers)
+
+    assert job['result']['dialogues_count'] == 1
+    dialogue_ids = await Mongo.dialogues.distinct("_id")
+    assert len(dialogue_ids) == 1
+
+    # The inline content of the old document moved to subtitle_contents
+    movie = await Mongo.movies_processed.find_one({"imdb_id": MOVIE_IMDB_ID})
+    assert 'content' not in movie
+    assert await Mongo.subtitle_contents.count_documents({"_id": movie['content_id']}) == 1
+
+    job = await process_movie_and_wait(client, headers)
+
+    assert job['result'] == {"message": "Subtitles already processed", "dialogues_count": 1}
+    assert await Mongo.dialogues.distinct("_id") == dialogue_ids
+
+    # A new parser version reprocesses, unchanged scenes keep their dialogue
+    with patch.object(SubtitlesBussiness, "PARSER_VERSION", SubtitlesBussiness.PARSER_VERSION + 1):
+        job = await process_movie_and_wait(client, headers)
+
+    assert job['result'] == {"message": "Subtitles processed successfully", "dialogues_count": 1}
+    assert await Mongo.dialogues.distinct("_id") == dialogue_ids
+
+    movie = await Mongo.movies_processed.find_one({"imdb_id": MOVIE_IMDB_ID})
+    assert movie['parser_version'] == SubtitlesBussiness.PARSER_VERSION + 1
+    assert movie['dialogues_count'] == 1
+
+async def test_process_movie_failure_is_reported(client: AsyncClient, responses, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    responses.get(
+        re.compile(r".*/subtitles"),
+        payload={"data": []}
+    )
+
+    with patch.object(settings, "JOB_MAX_ATTEMPTS", 1):
+        job = await process_movie_and_wait(client, headers)
+
+    assert job['status'] == 'failed'
+    assert job['attempts'] == 1
+    assert job['error'] == "No subtitles found"
+
+async def test_unknown_job(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+
+    res = await client.get(f"{BASE_URL}/jobs/{'0' * 24}", headers=headers)
+
+    assert res.status_code == 404
 
 async def test_list_processed_movie(client: AsyncClient, mock_auth_user_and_header):
     headers, _ = mock_auth_user_and_header
@@ -273,4 +360,20 @@ async def test_search_processed_movie_with_pagination(client: AsyncClient, mock_
     json_data = res.json()
 
     assert res.status_code == 200
-    assert len(json_data) == 0
\ No newline at end of file
+    assert len(json_data) == 0
+
+async def test_list_processed_movie_with_cursor(client: AsyncClient, mock_auth_user_and_header):
+    headers, _ = mock_auth_user_and_header
+    await Mongo.movies_processed.insert_many([mock_movie_processed_db() for _ in range(3)])
+
+    res = await client.get(f"{BASE_URL}/processed?limit=2", headers=headers)
+    first_page = [movie['_id'] for movie in res.json()]
+
+    res = await client.get(f"{BASE_URL}/processed?limit=2&after={res.headers['X-Next-Cursor']}", headers=headers)
+    second_page = [movie['_id'] for movie in res.json()]
+
+    assert len(first_page) == 2
+    assert len(second_page) == 1
+    assert not set(first_page) & set(second_page)
+    assert "X-Next-Cursor" not in res.headers
+
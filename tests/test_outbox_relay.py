@@ -0,0 +1,306 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.business.dialogue_bo import DialogueBusiness
+from app.business.user_bo import UserBusiness
+from app.core.common.domain.events import EventDispatcher, EventHandler
+from app.core.common.domain.value_objects import Uuid, XpPoints
+from app.core.users.application.event_handlers.achievement_handler import AchievementHandler
+from app.core.users.domain.events.user_leveled_up_event import UserLeveledUpEvent
+from app.core.dialogues.application.dto.dialogue_dto import DialogueLine, DialogueMovie, DialogueOut, PracticeResult
+from app.core.users.domain.user_entity import UserEntity, UserProgress
+from app.integration.mongo import Mongo
+from app.integration.outbox_relay import OutboxRelay
+
+
+class LevelHandler(EventHandler):
+    def __init__(self, error=None):
+        self.error = error
+        self.events = []
+
+    @property
+    def event_type(self):
+        return "user.leveled_up"
+
+    async def handle(self, event):
+        self.events.append(event)
+        if self.error:
+            raise self.error
+
+
+class AsyncCursor:
+    def __init__(self, items):
+        self.items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def level_up(new_level=2) -> UserLeveledUpEvent:
+    return UserLeveledUpEvent(user_id=Uuid(), old_level=new_level - 1, new_level=new_level, total_xp=XpPoints(1500))
+
+
+def outbox_doc(event, attempts=1, event_type=None):
+    data = event.to_dict()
+    return {
+        "_id": data["event_id"],
+        "event_type": event_type or data["event_type"],
+        "aggregate_id": data["aggregate_id"],
+        "occurred_at": event.occurred_at,
+        "payload": data["payload"],
+        "attempts": attempts,
+    }
+
+
+@pytest.fixture
+def relay():
+    repo = MagicMock()
+    for method in ("claim_batch", "mark_dispatched", "retry", "fail"):
+        setattr(repo, method, AsyncMock(return_value=None))
+    handler = LevelHandler()
+    dispatcher = EventDispatcher()
+    dispatcher.register_handler(handler)
+    with patch.object(OutboxRelay, "repo", repo), \
+            patch.object(OutboxRelay, "dispatcher", dispatcher), \
+            patch.dict(OutboxRelay.event_types, {"user.leveled_up": UserLeveledUpEvent}, clear=True):
+        yield repo, handler
+
+
+def test_event_from_dict_keeps_its_identity():
+    event = level_up(3)
+
+    restored = UserLeveledUpEvent.from_dict(event.to_dict())
+
+    assert restored == event
+    assert restored.aggregate_id == event.aggregate_id
+    assert restored.occurred_at == event.occurred_at
+    assert restored.new_level == 3
+
+
+@pytest.mark.asyncio
+async def test_dispatched_events_are_marked(relay):
+    repo, handler = relay
+    events = [level_up(2), level_up(3)]
+    repo.claim_batch.return_value = [outbox_doc(event) for event in events]
+
+    assert await OutboxRelay.relay_batch() == 2
+
+    assert [event.event_id for event in handler.events] == [event.event_id for event in events]
+    repo.mark_dispatched.assert_awaited_once_with([str(event.event_id) for event in events], OutboxRelay.owner)
+
+
+@pytest.mark.asyncio
+async def test_failed_event_is_retried_with_backoff(relay):
+    repo, handler = relay
+    handler.error = RuntimeError("boom")
+    doc = outbox_doc(level_up(), attempts=2)
+    repo.claim_batch.return_value = [doc]
+
+    before = datetime.now(timezone.utc)
+    with patch("app.integration.outbox_relay.settings.OUTBOX_RETRY_BACKOFF_SECONDS", 10):
+        await OutboxRelay.relay_batch()
+
+    repo.retry.assert_awaited_once()
+    event_id, owner, _, retry_at = repo.retry.await_args.args
+    assert (event_id, owner) == (doc["_id"], OutboxRelay.owner)
+    assert retry_at - before >= timedelta(seconds=20)
+    repo.mark_dispatched.assert_not_awaited()
+    repo.fail.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_event_fails_after_the_last_attempt(relay):
+    repo, handler = relay
+    handler.error = RuntimeError("boom")
+    doc = outbox_doc(level_up(), attempts=3)
+    repo.claim_batch.return_value = [doc]
+
+    with patch("app.integration.outbox_relay.settings.OUTBOX_MAX_ATTEMPTS", 3):
+        await OutboxRelay.relay_batch()
+
+    repo.fail.assert_awaited_once()
+    assert repo.fail.await_args.args[0] == doc["_id"]
+    repo.retry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unknown_event_type_fails(relay):
+    repo, handler = relay
+    doc = outbox_doc(level_up(), event_type="user.removed")
+    repo.claim_batch.return_value = [doc]
+
+    await OutboxRelay.relay_batch()
+
+    repo.fail.assert_awaited_once()
+    assert handler.events == []
+
+
+@pytest.mark.asyncio
+async def test_redelivered_level_up_creates_one_achievement():
+    user = UserEntity.create(
+        id=str(Uuid()),
+        email="test@example.com",
+        name="Test User",
+        created_at=datetime.now(timezone.utc),
+        last_login=datetime.now(timezone.utc),
+    )
+    handler = AchievementHandler()
+    handler.user_repo = MagicMock()
+    handler.user_repo.find_by_id = AsyncMock(return_value=user)
+    handler.user_repo.update = AsyncMock(return_value=user)
+    event = level_up(2)
+
+    await handler.handle(event)
+    await handler.handle(UserLeveledUpEvent.from_dict(event.to_dict()))
+
+    assert len(user.achievements) == 1
+    assert user.achievements[0].id == event.event_id
+    handler.user_repo.update.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_progress_and_events_are_rewritten_when_the_transaction_is_retried():
+    session = object()
+    user_id = str(Uuid())
+
+    def user_before_update(*args, **kwargs):
+        return UserEntity.create(
+            id=user_id,
+            email="test@example.com",
+            name="Test User",
+            created_at=datetime.now(timezone.utc),
+            last_login=datetime.now(timezone.utc),
+            progress=UserProgress.create(xp_points=900)
+        )
+
+    async def run_in_transaction(callback):
+        # A write conflict aborts the first attempt, with_transaction runs the callback again
+        await callback(session)
+        return await callback(session)
+
+    user_repo = MagicMock()
+    user_repo.apply_practice_result = AsyncMock(side_effect=user_before_update)
+    outbox_repo = MagicMock()
+    outbox_repo.add = AsyncMock()
+    result = PracticeResult(
+        pronunciation_score=0.9, fluency_score=0.9, transcribed_text="", suggestions=[], word_timings=[], xp_earned=200
+    )
+
+    with patch.object(UserBusiness, "user_repo", user_repo), \
+            patch.object(UserBusiness, "outbox_repo", outbox_repo), \
+            patch.object(Mongo, "run_in_transaction", run_in_transaction), \
+            patch("app.business.user_bo.settings.OUTBOX_ENABLED", True):
+        user = await UserBusiness.update_progress(user_id, result)
+
+    assert all(call.kwargs["session"] is session for call in user_repo.apply_practice_result.await_args_list)
+    assert [call.kwargs["session"] for call in outbox_repo.add.await_args_list] == [session, session]
+    # Each attempt writes the level-up raised by its own replay, nothing carries over
+    assert [len(call.args[0]) for call in outbox_repo.add.await_args_list] == [1, 1]
+    assert user.progress.level == 2
+    assert user.get_uncommitted_events() == []
+
+
+@pytest.mark.asyncio
+async def test_run_in_transaction_lets_the_driver_retry():
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.with_transaction = AsyncMock(return_value="done")
+    client = MagicMock()
+    client.start_session = AsyncMock(return_value=session)
+    callback = AsyncMock()
+
+    with patch.object(Mongo, "client", client), patch.object(Mongo, "supports_transactions", True):
+        assert await Mongo.run_in_transaction(callback) == "done"
+    session.with_transaction.assert_awaited_once_with(callback)
+
+    with patch.object(Mongo, "supports_transactions", False):
+        await Mongo.run_in_transaction(callback)
+    callback.assert_awaited_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_practice_history_progress_and_events_share_one_transaction():
+    session = object()
+    user_id = str(Uuid())
+    dialogue = DialogueOut(
+        _id=str(Uuid()),
+        movie=DialogueMovie(title="Test Movie", imdb_id="tt1234567"),
+        difficulty_level=3,
+        duration_seconds=2.0,
+        lines=[DialogueLine(character="Alice", text="Hello world", start_time=0.0, end_time=2.0)]
+    )
+    result = PracticeResult(
+        pronunciation_score=0.9, fluency_score=0.9, transcribed_text="", suggestions=[], word_timings=[], xp_earned=20
+    )
+    user = UserEntity.create(
+        id=user_id,
+        email="test@example.com",
+        name="Test User",
+        created_at=datetime.now(timezone.utc),
+        last_login=datetime.now(timezone.utc)
+    )
+    history_repo = MagicMock()
+    history_repo.create = AsyncMock()
+    outbox_repo = MagicMock()
+    outbox_repo.add = AsyncMock()
+    async def run_callback(callback):
+        return await callback(session)
+
+    run_in_transaction = AsyncMock(side_effect=run_callback)
+
+    with patch.object(DialogueBusiness, "dialogue_practice_history_repo", history_repo), \
+            patch.object(DialogueBusiness, "outbox_repo", outbox_repo), \
+            patch.object(UserBusiness, "record_practice_result", AsyncMock(return_value=user)) as record_practice_result, \
+            patch.object(Mongo, "run_in_transaction", run_in_transaction), \
+            patch.object(OutboxRelay, "notify") as notify:
+        await DialogueBusiness._record_practice(dialogue, user_id, result)
+
+    run_in_transaction.assert_awaited_once()
+    assert history_repo.create.await_args.kwargs["session"] is session
+    record_practice_result.assert_awaited_once_with(user_id, result, session)
+    (event,), = outbox_repo.add.await_args.args
+    assert event.event_type == "dialogue.practice_completed"
+    assert outbox_repo.add.await_args.kwargs["session"] is session
+    notify.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_claim_fails_expired_leases_without_attempts_left():
+    from app.core.common.infra.database.repositories import OutboxMongoRepository
+
+    outbox_events = MagicMock()
+    outbox_events.update_many = AsyncMock()
+    outbox_events.find = MagicMock(return_value=MagicMock(**{"sort.return_value.limit.return_value": AsyncCursor([])}))
+
+    with patch("app.core.common.infra.database.repositories.outbox_mongo_repo.Mongo.outbox_events", outbox_events, create=True):
+        assert await OutboxMongoRepository().claim_batch("relay", 10, 60, 5) == []
+
+    exhausted, update = outbox_events.update_many.await_args.args
+    assert exhausted["attempts"] == {"$gte": 5}
+    assert "lease_expires_at" in exhausted
+    assert update["$set"]["status"] == "failed"
+    due = outbox_events.find.call_args.args[0]
+    assert due["attempts"] == {"$lt": 5}
+
+
+@pytest.mark.asyncio
+async def test_cli_replays_the_failed_or_given_events():
+    from app.cli import outbox
+
+    replay = AsyncMock(return_value=2)
+    with patch.object(outbox.OutboxMongoRepository, "replay", replay), \
+            patch.object(outbox.Mongo, "_startup"), patch.object(outbox.Mongo, "_shutdown") as shutdown:
+        assert await outbox.run([], 50) == 0
+        assert await outbox.run(["a", "b"], 50) == 0
+
+    assert [call.args for call in replay.await_args_list] == [(None,), (["a", "b"],)]
+    assert shutdown.call_count == 2
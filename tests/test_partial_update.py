@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+from app.core.common.domain.value_objects import Uuid
+from app.core.movies.application import MovieMapper
+from app.core.common.infra.database.partial_update import build_partial_update
+from app.core.movies.domain import MovieEntity
+from app.core.users.domain import UserEntity, UserProgress, Achievement
+
+
+def make_user() -> UserEntity:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return UserEntity.create(
+        email="test@example.com",
+        name="Test User",
+        created_at=now,
+        last_login=now,
+        achievements=[Achievement.create(id=str(Uuid()), name="First", description="", earned_at=now)],
+        progress=UserProgress.create(xp_points=100),
+        id=str(Uuid())
+    )
+
+
+def make_movie() -> MovieEntity:
+    return MovieEntity.create(
+        title="The Movie",
+        year=1995,
+        feature_type="movie",
+        imdb_id="tt0114709",
+        subtitle_id="1",
+        all_movie_info={"attributes": {"ratings": 8.3}},
+        upload_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        content="1\n00:00:01,000 --> 00:00:02,000\nHello\n" * 1000,
+        id=str(Uuid())
+    )
+
+
+def test_new_entity_is_fully_dumped():
+    user = make_user()
+
+    assert build_partial_update(user) == {"$set": user.entity_dump()}
+
+
+def test_unchanged_entity_has_no_update():
+    user = make_user()
+    user.mark_persisted()
+
+    assert build_partial_update(user) == {}
+
+
+def test_changed_scalar_is_set_alone():
+    movie = make_movie()
+    movie.mark_persisted()
+    movie.title = "Toy Story"
+
+    assert build_partial_update(movie) == {"$set": {"title": "Toy Story"}}
+
+
+def test_nested_documents_use_dotted_paths():
+    movie = make_movie()
+    movie.mark_persisted()
+    movie.all_movie_info["attributes"]["ratings"] = 9.0
+
+    assert build_partial_update(movie) == {"$set": {"all_movie_info.attributes.ratings": 9.0}}
+
+
+def test_appended_items_are_pushed():
+    user = make_user()
+    user.mark_persisted()
+    earned_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    user.achievements.append(Achievement.create(id=str(Uuid()), name="Level 2", description="", earned_at=earned_at))
+    user.last_login = earned_at
+
+    update = build_partial_update(user)
+
+    assert update["$set"] == {"last_login": earned_at}
+    assert [item["name"] for item in update["$push"]["achievements"]["$each"]] == ["Level 2"]
+
+
+def test_rewritten_list_is_set():
+    user = make_user()
+    user.mark_persisted()
+    user.achievements = []
+
+    assert build_partial_update(user) == {"$set": {"achievements": []}}
+
+
+def test_excluded_fields_are_never_written():
+    user = make_user()
+    user.mark_persisted()
+    user.update_progress(0.9, 0.9, 100)
+
+    assert build_partial_update(user, exclude=("progress",)) == {}
+    assert "progress.xp_points" in build_partial_update(user)["$set"]
+
+
+def test_loaded_entity_is_compared_to_its_document():
+    doc = {"_id": "64b7f0c2a1b2c3d4e5f60718", **make_movie().entity_dump()}
+
+    movie = MovieMapper.from_document_to_entity(doc)
+
+    assert movie.get_persisted_state() is doc
+    assert build_partial_update(movie) == {}
+    movie.all_movie_info["attributes"]["ratings"] = 9.0
+    assert build_partial_update(movie) == {"$set": {"all_movie_info.attributes.ratings": 9.0}}
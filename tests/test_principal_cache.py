@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.business.auth_bo import AuthBusiness
+from app.core.users.application import PrincipalCache
+from app.core.users.domain import UserEntity, UserProgress
+
+USER_ID = "507f1f77bcf86cd799439011"
+
+
+class StubUserRepository:
+
+    def __init__(self, user):
+        self.user = user
+        self.reads = 0
+
+    async def find_by_id(self, id: str):
+        self.reads += 1
+        return self.user
+
+
+@pytest.fixture
+def user_repo(monkeypatch):
+    user = UserEntity.create(
+        id=USER_ID,
+        email="test@example.com",
+        name="Test User",
+        picture="",
+        google_id="",
+        achievements=[],
+        created_at=datetime.now(timezone.utc),
+        last_login=datetime.now(timezone.utc),
+        progress=UserProgress()
+    )
+    repo = StubUserRepository(user)
+    monkeypatch.setattr(AuthBusiness, "user_repo", repo)
+    PrincipalCache.clear()
+    yield repo
+    PrincipalCache.clear()
+
+
+async def authenticate(token: str):
+    request = SimpleNamespace(state=SimpleNamespace())
+    await AuthBusiness.validate_auth(request, token)
+    return request.state.user
+
+
+@pytest.mark.asyncio
+async def test_principal_is_read_once_per_worker(user_repo):
+    token = AuthBusiness.create_access_token({"sub": USER_ID})
+
+    first = await authenticate(token)
+    second = await authenticate(token)
+
+    assert first.id == USER_ID
+    assert first.email == "test@example.com"
+    assert second == first
+    assert user_repo.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidated_principal_is_read_again(user_repo):
+    token = AuthBusiness.create_access_token({"sub": USER_ID})
+    await authenticate(token)
+
+    PrincipalCache.invalidate(USER_ID)
+    user_repo.user = None
+
+    with pytest.raises(HTTPException) as error:
+        await authenticate(token)
+    assert error.value.status_code == 401
+    assert user_repo.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled(user_repo, monkeypatch):
+    monkeypatch.setattr(PrincipalCache, "ttl_seconds", 0)
+    token = AuthBusiness.create_access_token({"sub": USER_ID})
+
+    await authenticate(token)
+    await authenticate(token)
+
+    assert user_repo.reads == 2
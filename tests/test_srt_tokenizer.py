@@ -0,0 +1,102 @@
+import types
+
+import pytest
+
+from app.util.subtitles import iter_srt_lines, merge_consecutive_lines, parse_timing
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+JOHN: <i>Hello there.</i>
+How are you?
+
+2
+00:00:03,000 --> 00:00:04,000
+[MARY] Fine - thanks
+Mary: Really fine
+
+3
+00:00:10,000 --> 00:00:11,000
+(NARRATOR) Later...
+"""
+
+
+def as_tuples(lines):
+    return [(line.character, line.text, line.start_time, line.end_time) for line in lines]
+
+
+EXPECTED = [
+    ("JOHN", "Hello there", 1.0, 2.5),
+    ("JOHN", "How are you?", 1.0, 2.5),
+    ("MARY", "Fine  thanks", 3.0, 4.0),
+    ("Mary", "Really fine", 3.0, 4.0),
+    ("NARRATOR", "Later", 10.0, 11.0),
+]
+
+
+def test_lines_are_yielded_lazily():
+    lines = iter_srt_lines(SRT)
+
+    assert isinstance(lines, types.GeneratorType)
+    assert as_tuples(lines) == EXPECTED
+
+
+@pytest.mark.parametrize("content", [
+    SRT.replace("\n", "\r\n"),
+    "\ufeff" + SRT,
+    "\n\n  " + SRT.replace("\n", "\n    "),
+    SRT.replace("1\n00:00:01", "00:00:01"),
+])
+def test_line_endings_bom_and_indentation(content):
+    assert as_tuples(iter_srt_lines(content)) == EXPECTED
+
+
+def test_text_stream_input():
+    assert as_tuples(iter_srt_lines(iter(SRT.splitlines(keepends=True)))) == EXPECTED
+
+
+def test_malformed_blocks_are_skipped():
+    content = (
+        "1\nnot a timing\nLost line\n\n"
+        "2\n00:00:05,000 --> 00:00:04,000\nBackwards\n\n"
+        "garbage\n\n"
+        "3\n00:00:06,000 --> 00:00:07,000\n\n"
+        "4\n00:00:08,000 --> 00:00:09,000\nKept"
+    )
+
+    assert as_tuples(iter_srt_lines(content)) == [("", "Kept", 8.0, 9.0)]
+
+
+def test_missing_blank_line_between_cues():
+    content = (
+        "1\n00:00:01,000 --> 00:00:02,000\nFirst\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nSecond\n"
+        "42\n\n"
+    )
+
+    assert as_tuples(iter_srt_lines(content)) == [
+        ("", "First", 1.0, 2.0),
+        ("", "Second", 3.0, 4.0),
+        ("", "42", 3.0, 4.0),
+    ]
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("00:02:19,723 --> 00:02:20,929", (139.723, 140.929)),
+    ("00:00:01.5 --> 00:00:02.25 X1:100", (1.5, 2.25)),
+    ("1:00:00,000-->1:00:01,000", (3600.0, 3601.0)),
+    ("00:00:01,000 -> 00:00:02,000", None),
+    ("Hello", None),
+])
+def test_parse_timing(line, expected):
+    assert parse_timing(line) == expected
+
+
+def test_merge_consecutive_lines():
+    merged = as_tuples(merge_consecutive_lines(iter_srt_lines(SRT)))
+
+    assert merged == [
+        ("JOHN", "Hello there How are you?", 1.0, 2.5),
+        ("MARY", "Fine  thanks", 3.0, 4.0),
+        ("Mary", "Really fine", 3.0, 4.0),
+        ("NARRATOR", "Later", 10.0, 11.0),
+    ]
@@ -0,0 +1,125 @@
+import pytest
+
+from app.util.patterns import SubtitleFormatsEnum
+from app.util.subtitles import detect_format, iter_dialogue_lines, iter_text_lines
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+JOHN: Hello there.
+
+2
+00:00:03,000 --> 00:00:04,000
+<i>Fine, thanks</i>
+"""
+
+VTT = """WEBVTT - Movie
+Kind: captions
+
+NOTE a comment
+spanning two lines
+
+STYLE
+::cue { color: yellow }
+
+intro
+00:01.000 --> 00:02.500 align:start position:10%
+<v John>Hello there.</v>
+
+00:00:03.000 --> 00:00:04.000
+<c.yellow>Fine,</c> thanks
+"""
+
+ASS = """[Script Info]
+Title: Movie
+ScriptType: v4.00+
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize
+Style: Default,Arial,20
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Comment: 0,0:00:00.00,0:00:01.00,Default,,0,0,0,,Not dialogue
+Dialogue: 0,0:00:01.00,0:00:02.50,Default,John,0,0,0,,{\\i1}Hello there.{\\i0}
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Fine,\\Nthanks
+Dialogue: 0,0:00:03.00,0:00:04.00,Sign,,0,0,0,,{\\p1}m 0 0 l 100 0 100 100{\\p0}
+"""
+
+MICRODVD = """{1}{1}25
+{25}{62}JOHN: Hello there.
+{75}{100}{y:i}Fine,|thanks
+"""
+
+
+def as_tuples(lines):
+    return [(line.character, line.text, line.start_time, line.end_time) for line in lines]
+
+
+@pytest.mark.parametrize("content, subtitle_format", [
+    (SRT, SubtitleFormatsEnum.SRT),
+    (VTT, SubtitleFormatsEnum.VTT),
+    (ASS, SubtitleFormatsEnum.ASS),
+    (MICRODVD, SubtitleFormatsEnum.MICRODVD),
+    ("\ufeff" + VTT.replace("\n", "\r\n"), SubtitleFormatsEnum.VTT),
+    ("", SubtitleFormatsEnum.SRT),
+])
+def test_detect_format(content, subtitle_format):
+    assert detect_format(list(iter_text_lines(content))) == subtitle_format
+
+
+def test_srt():
+    assert as_tuples(iter_dialogue_lines(SRT)) == [
+        ("JOHN", "Hello there", 1.0, 2.5),
+        ("", "Fine, thanks", 3.0, 4.0),
+    ]
+
+
+def test_vtt_uses_voice_spans_as_characters():
+    assert as_tuples(iter_dialogue_lines(VTT)) == [
+        ("John", "Hello there", 1.0, 2.5),
+        ("", "Fine, thanks", 3.0, 4.0),
+    ]
+
+
+def test_vtt_entities_are_unescaped():
+    content = "WEBVTT\n\n00:01.000 --> 00:02.000\nTom &amp; Jerry &lt;3\n"
+
+    assert as_tuples(iter_dialogue_lines(content)) == [("", "Tom & Jerry <3", 1.0, 2.0)]
+
+
+def test_ass_uses_the_name_field_as_character():
+    assert as_tuples(iter_dialogue_lines(ASS)) == [
+        ("John", "Hello there", 1.0, 2.5),
+        ("", "Fine,", 3.0, 4.0),
+        ("", "thanks", 3.0, 4.0),
+    ]
+
+
+def test_ssa_format_line_is_followed():
+    content = (
+        "[Events]\n"
+        "Format: Marked, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: Marked=0,0:00:01.50,0:00:02.00,Default,MARY,0000,0000,0000,,Hi, you\n"
+    )
+
+    assert as_tuples(iter_dialogue_lines(content)) == [("MARY", "Hi, you", 1.5, 2.0)]
+
+
+def test_microdvd_uses_the_declared_frame_rate():
+    assert as_tuples(iter_dialogue_lines(MICRODVD)) == [
+        ("JOHN", "Hello there", 1.0, 2.48),
+        ("", "Fine,", 3.0, 4.0),
+        ("", "thanks", 3.0, 4.0),
+    ]
+
+
+def test_microdvd_default_frame_rate():
+    lines = as_tuples(iter_dialogue_lines("{0}{2397}Hello", SubtitleFormatsEnum.MICRODVD))
+
+    assert lines == [("", "Hello", 0.0, pytest.approx(2397 / 23.976))]
+
+
+def test_format_is_detected_on_a_line_stream():
+    lines = iter(VTT.splitlines(keepends=True))
+
+    assert as_tuples(iter_dialogue_lines(lines))[0] == ("John", "Hello there", 1.0, 2.5)
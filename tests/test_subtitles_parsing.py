@@ -0,0 +1,145 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.business.movie_bo import MovieBusiness
+from app.business.subtitles_bo import SubtitlesBussiness
+from app.core.dialogues.domain.dialogue_entity import DialogueEntity, DialogueMovie
+from app.core.dialogues.infra.database.repositories.dialogue_mongo_repo import DialogueMongoRepository
+from app.integration.mongo import Mongo
+from app.integration.process_pool import ProcessPool
+
+
+def build_srt(blocks: int, offset: float = 0.0) -> str:
+    parts = []
+    for i in range(blocks):
+        start = offset + i * 2.0
+        parts.append(
+            f"{i + 1}\n"
+            f"{_timestamp(start)} --> {_timestamp(start + 1.5)}\n"
+            f"{'JOHN' if i % 2 else 'MARY'}: <i>Line number {i}.</i>"
+        )
+    return "\n\n".join(parts)
+
+
+def _timestamp(seconds: float) -> str:
+    millis = int(round(seconds * 1000))
+    return f"{millis // 3_600_000:02d}:{millis // 60_000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+@pytest.fixture
+def process_pool():
+    ProcessPool._startup(1)
+    yield
+    ProcessPool._shutdown()
+
+
+def test_parse_content_returns_plain_data():
+    scenes = SubtitlesBussiness.parse_content(build_srt(6))
+
+    assert len(scenes) == 1
+    lines, duration_seconds, difficulty_level = scenes[0]
+    assert lines[0] == ("MARY", "Line number 0", 0.0, 1.5)
+    assert len(lines) == 6
+    assert duration_seconds == 11.5
+    assert 1 <= difficulty_level <= 5
+
+
+def test_to_dialogue_entities_matches_the_inline_processing():
+    movie = DialogueMovie(title="Toy Story", imdb_id="tt0114709", language="en")
+    content = build_srt(12) + "\n\n" + build_srt(6, offset=100)
+
+    entities = SubtitlesBussiness.to_dialogue_entities(SubtitlesBussiness.parse_content(content), movie)
+
+    assert [entity.entity_dump() for entity in entities] == [
+        entity.entity_dump() for entity in SubtitlesBussiness.process_subtitle_content(content, movie)
+    ]
+    assert len(entities) == 2
+    assert entities[0].movie is movie
+    assert entities[0].scene_key == DialogueEntity.build_scene_key(movie.imdb_id, entities[0].lines)
+
+
+@pytest.mark.asyncio
+async def test_replaced_scenes_get_the_fields_of_the_current_parser():
+    movie = DialogueMovie(title="Toy Story", imdb_id="tt0114709", language="en")
+    entities = SubtitlesBussiness.process_subtitle_content(build_srt(12) + "\n\n" + build_srt(6, offset=100), movie)
+    session = object()
+    dialogues = MagicMock()
+    dialogues.bulk_write = AsyncMock()
+
+    async def run_in_transaction(callback):
+        return await callback(session)
+
+    with patch.object(Mongo, "dialogues", dialogues, create=True), \
+            patch.object(Mongo, "run_in_transaction", run_in_transaction):
+        assert await DialogueMongoRepository().replace_movie_dialogues(movie.imdb_id, entities) == 2
+
+    operations = dialogues.bulk_write.await_args.args[0]
+    assert dialogues.bulk_write.await_args.kwargs["session"] is session
+    # Stored scenes are upserted too, so a parser change reaches their derived fields
+    assert [op._doc["$set"]["difficulty_level"] for op in operations[:2]] == [e.difficulty_level for e in entities]
+    assert operations[2]._filter["scene_key"] == {"$nin": [e.scene_key for e in entities]}
+
+
+@pytest.mark.asyncio
+async def test_process_pool_gives_the_same_result(process_pool):
+    contents = [build_srt(6), build_srt(8), ""]
+
+    parsed = await SubtitlesBussiness.parse_many(contents)
+
+    assert parsed == [SubtitlesBussiness.parse_content(content) for content in contents]
+    assert parsed[2] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [0, 1])
+async def test_downloaded_subtitle_is_parsed_with_or_without_workers(workers):
+    content = build_srt(12) + "\n\n" + build_srt(6, offset=100)
+
+    async def get_subtitles(imdb_id, language, on_line=None):
+        for line in content.splitlines(keepends=True):
+            if on_line is not None:
+                on_line(line)
+        return MagicMock(content=content)
+
+    subtitle_movie = MagicMock(get_subtitles=get_subtitles)
+    ProcessPool._startup(workers)
+    try:
+        with patch.object(MovieBusiness, "subtitle_movie", subtitle_movie):
+            movie_dto, scenes = await MovieBusiness._download_and_parse("tt0114709", "en")
+    finally:
+        ProcessPool._shutdown()
+
+    assert movie_dto.content == content
+    assert scenes == SubtitlesBussiness.parse_content(content)
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_inline_without_workers():
+    assert ProcessPool.executor is None
+    assert await ProcessPool.run(SubtitlesBussiness.parse_content, build_srt(6)) == SubtitlesBussiness.parse_content(build_srt(6))
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_once():
+    broken, replacement = MagicMock(), MagicMock()
+
+    async def run_in_executor(executor, fn, *args):
+        await asyncio.sleep(0)
+        raise BrokenProcessPool()
+
+    loop = asyncio.get_running_loop()
+    with patch.object(ProcessPool, "executor", broken), \
+         patch.object(ProcessPool, "_create_executor", return_value=replacement) as create_executor, \
+         patch.object(loop, "run_in_executor", run_in_executor):
+        results = await asyncio.gather(
+            *(ProcessPool.run(SubtitlesBussiness.parse_content, "") for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, BrokenProcessPool) for result in results)
+        assert ProcessPool.executor is replacement
+    create_executor.assert_called_once()
+    broken.shutdown.assert_called_once()
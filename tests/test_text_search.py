@@ -0,0 +1,45 @@
+from app.util.text_search import (
+    parse_query,
+    stem,
+    to_mongo_text_search,
+    find_highlights,
+    find_literal_highlights,
+)
+
+LINE = "Buzz Lightyear mission log, as the location of Zurg's fortress"
+
+
+def test_stemming_groups_word_forms():
+    assert stem("running") == stem("runs") == "run"
+    assert stem("flies") == "fly"
+    assert stem("fortresses") == "fortress"
+    assert stem("bus") == "bus"
+
+
+def test_query_parsing():
+    query = parse_query('The "Mission Logs" of Buzz, Zurg\'s fortresses')
+
+    assert query.phrases == [["mission", "log"]]
+    assert query.terms == ["buzz", "zurg", "fortress"]
+
+
+def test_mongo_search_keeps_only_words_and_phrases():
+    assert to_mongo_text_search('-buzz "mission log" (zurg) \\"') == '"mission log" buzz zurg'
+    assert to_mongo_text_search('".*"') == ""
+
+
+def test_highlights_terms_and_phrases():
+    query = parse_query('"mission log" fortresses')
+
+    assert find_highlights(LINE, query) == [(15, 26), (54, 62)]
+    assert [LINE[start:end] for start, end in find_highlights(LINE, parse_query("zurg"))] == ["Zurg's"]
+
+
+def test_overlapping_highlights_are_merged():
+    query = parse_query('"lightyear mission" mission')
+
+    assert find_highlights(LINE, query) == [(5, 22)]
+
+
+def test_literal_highlights_escape_the_input():
+    assert find_literal_highlights("a.b a*b A.B", "a.b") == [(0, 3), (8, 11)]
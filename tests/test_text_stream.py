@@ -0,0 +1,53 @@
+import codecs
+
+import pytest
+
+from app.util.text_stream import TextTooLargeError, detect_encoding, iter_decoded_lines
+
+TEXT = "1\r\n00:00:01,000 --> 00:00:02,000\r\nCafé, naïve señor!\r\n\r\n" * 100
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def decode(data: bytes, size: int = 7, max_bytes: int = 1 << 20, declared: str = None):
+    return [line async for line in iter_decoded_lines(chunked(data, size), max_bytes, declared)]
+
+
+@pytest.mark.parametrize("head, declared, expected", [
+    (codecs.BOM_UTF8 + b"abc", "latin-1", "utf-8-sig"),
+    (codecs.BOM_UTF16_LE + "a".encode("utf-16-le"), None, "utf-16"),
+    ("é".encode("latin-1"), "ISO-8859-1", "iso8859-1"),
+    ("é".encode("utf-8"), "not-a-charset", "utf-8"),
+    ("é!".encode("cp1252"), None, "cp1252"),
+    # A multi-byte character cut at the end of the head is still UTF-8
+    (b"aaaa" + "é".encode("utf-8")[:1], None, "utf-8"),
+])
+def test_detect_encoding(head, declared, expected):
+    assert detect_encoding(head, declared) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "cp1252", "utf-16"])
+async def test_lines_survive_any_chunking(encoding):
+    lines = await decode(TEXT.encode(encoding))
+
+    assert "".join(lines) == TEXT
+    assert lines[:3] == ["1\r\n", "00:00:01,000 --> 00:00:02,000\r\n", "Café, naïve señor!\r\n"]
+
+
+@pytest.mark.asyncio
+async def test_last_line_without_newline():
+    assert await decode(b"a\nb", size=1) == ["a\n", "b"]
+    assert await decode(b"") == []
+
+
+@pytest.mark.asyncio
+async def test_max_bytes():
+    data = TEXT.encode()
+
+    assert "".join(await decode(data, size=1024, max_bytes=len(data))) == TEXT
+    with pytest.raises(TextTooLargeError):
+        await decode(data, size=1024, max_bytes=len(data) - 1)
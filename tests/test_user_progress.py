@@ -0,0 +1,10 @@
+from app.core.users.domain import UserProgress
+
+
+def test_level_thresholds_match_level_calculation():
+    progress = UserProgress()
+    thresholds = UserProgress.level_thresholds()
+
+    assert thresholds[:3] == [1000, 2200, 3640]
+    for xp in (0, 999, 1000, 2199, 2200, 3640, 50_000, 1_000_000):
+        assert progress._calculate_level(xp) == 1 + sum(1 for threshold in thresholds if threshold <= xp)
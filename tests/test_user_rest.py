@@ -1,6 +1,12 @@
+import asyncio
+
 import pytest
+from unittest.mock import patch
 from httpx import AsyncClient
 from app.http.rest.v1 import user_v1
+from app.business.user_bo import UserBusiness
+from app.core.dialogues.application.dto.dialogue_dto import PracticeResult
+from app.integration import Mongo
 import pytest_asyncio
 
 BASE_URL = user_v1.prefix
@@ -21,4 +27,65 @@ async def test_user_profile(
     result = response.json()
     
     assert result["email"] == user["email"]
-    assert "_id" in result
\ No newline at end of file
+    assert "_id" in result
+
+
+async def test_concurrent_practice_results_do_not_lose_progress(
+    client: AsyncClient,
+    mock_auth_user_and_header
+):
+    headers, user = mock_auth_user_and_header
+    results = [
+        PracticeResult(
+            pronunciation_score=0.5 if i % 2 else 1.0,
+            fluency_score=0.25 if i % 2 else 0.75,
+            transcribed_text="",
+            suggestions=[],
+            word_timings=[],
+            xp_earned=10 + i
+        ) for i in range(100)
+    ]
+
+    await asyncio.gather(*(UserBusiness.update_progress(user["_id"], result) for result in results))
+
+    response = await client.get(f"{BASE_URL}/profile", headers=headers)
+    progress = response.json()["progress"]
+
+    assert progress["xp_points"] == sum(result.xp_earned for result in results)
+    assert progress["total_dialogues"] == 100
+    assert progress["average_pronunciation_score"] == pytest.approx(0.75)
+    assert progress["average_fluency_score"] == pytest.approx(0.5)
+    # 5950 XP is past the 5368 XP needed for level 5
+    assert progress["level"] == 5
+
+
+async def test_concurrent_practice_results_in_transactions(
+    client: AsyncClient,
+    mock_auth_user_and_header
+):
+    if not Mongo.supports_transactions:
+        pytest.skip("Transactions need a replica set")
+
+    headers, user = mock_auth_user_and_header
+    results = [
+        PracticeResult(
+            pronunciation_score=1.0,
+            fluency_score=1.0,
+            transcribed_text="",
+            suggestions=[],
+            word_timings=[],
+            xp_earned=50
+        ) for _ in range(40)
+    ]
+
+    # Same user document in every transaction, the write conflicts are retried
+    with patch("app.business.user_bo.settings.OUTBOX_ENABLED", True):
+        await asyncio.gather(*(UserBusiness.update_progress(user["_id"], result) for result in results))
+
+    response = await client.get(f"{BASE_URL}/profile", headers=headers)
+    progress = response.json()["progress"]
+
+    assert progress["xp_points"] == 2000
+    assert progress["total_dialogues"] == 40
+    # Level 2 reached once, from the transaction that crossed 1000 XP
+    assert await Mongo.outbox_events.count_documents({"event_type": "user.leveled_up", "payload.user_id": user["_id"]}) == 1
@@ -0,0 +1,65 @@
+import struct
+from app.util.webm import get_webm_duration_us
+
+
+def ebml_size(size: int) -> bytes:
+    return bytes([0x08]) + size.to_bytes(4, "big")
+
+
+def element(element_id: int, payload: bytes) -> bytes:
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    return id_bytes + ebml_size(len(payload)) + payload
+
+
+def unknown_size_element(element_id: int, payload: bytes) -> bytes:
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    return id_bytes + bytes([0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]) + payload
+
+
+def simple_block(relative_timecode: int, frame: bytes = b"\x00" * 40) -> bytes:
+    return element(0xA3, bytes([0x81]) + struct.pack(">h", relative_timecode) + b"\x80" + frame)
+
+
+def cluster(timecode: int, *blocks: bytes) -> bytes:
+    return element(0x1F43B675, element(0xE7, timecode.to_bytes(2, "big")) + b"".join(blocks))
+
+
+EBML_HEADER = element(0x1A45DFA3, element(0x4282, b"webm"))
+
+
+def test_duration_from_segment_info():
+    info = element(0x1549A966, element(0x2AD7B1, (1_000_000).to_bytes(3, "big")) + element(0x4489, struct.pack(">d", 5230.0)))
+    data = EBML_HEADER + element(0x18538067, info + cluster(0, simple_block(0)))
+
+    assert get_webm_duration_us(data) == 5_230_000
+
+
+def test_duration_honors_timecode_scale():
+    info = element(0x1549A966, element(0x4489, struct.pack(">f", 30.0)) + element(0x2AD7B1, (100_000_000).to_bytes(4, "big")))
+    data = EBML_HEADER + element(0x18538067, info)
+
+    assert get_webm_duration_us(data) == 3_000_000
+
+
+def test_duration_from_cluster_timecodes_when_info_has_no_duration():
+    # MediaRecorder output: unknown sized segment and clusters, no Duration
+    info = element(0x1549A966, element(0x2AD7B1, (1_000_000).to_bytes(3, "big")))
+    clusters = (
+        unknown_size_element(0x1F43B675, element(0xE7, (0).to_bytes(2, "big")) + simple_block(0) + simple_block(20))
+        + unknown_size_element(0x1F43B675, element(0xE7, (1000).to_bytes(2, "big")) + simple_block(0) + simple_block(980))
+    )
+    data = EBML_HEADER + unknown_size_element(0x18538067, info + clusters)
+
+    assert get_webm_duration_us(data) == 1_980_000
+
+
+def test_duration_of_truncated_upload():
+    data = EBML_HEADER + element(0x18538067, cluster(2000, simple_block(0), simple_block(500)))
+
+    assert get_webm_duration_us(data[:-20]) == 2_500_000
+
+
+def test_non_webm_buffer_returns_none():
+    assert get_webm_duration_us(b"RIFF....WAVEfmt ") is None
+    assert get_webm_duration_us(b"") is None
+    assert get_webm_duration_us(EBML_HEADER) is None